@@ -1,11 +1,15 @@
 """Alien enemy sprite and formation management."""
 
 import random
+from collections.abc import Iterator
 
 import arcade
 
 from invaders.bullet import Bullet
+from invaders.hitbox import load_texture
 from invaders.settings import SETTINGS
+from invaders.shared_state import next_entity_id
+from invaders.waves import ALIEN_SCALE, WaveSpec
 
 # Default sprite paths for different alien types
 ALIEN_SPRITES = [
@@ -30,6 +34,8 @@ class Alien(arcade.Sprite):
         y: float,
         alien_type: int = 0,
         image_path: str | None = None,
+        scale: float = ALIEN_SCALE,
+        speed: float | None = None,
     ) -> None:
         """
         Initialize an alien.
@@ -39,19 +45,47 @@ class Alien(arcade.Sprite):
             y: Starting y coordinate.
             alien_type: Type of alien (affects appearance/score).
             image_path: Optional path to alien sprite image.
+            scale: Sprite scale.
+            speed: Horizontal speed, defaults to the configured alien speed.
         """
         if image_path:
             sprite_path = image_path
         else:
             sprite_path = ALIEN_SPRITES[alien_type % len(ALIEN_SPRITES)]
 
-        super().__init__(sprite_path, scale=0.4)
+        super().__init__(load_texture(sprite_path), scale=scale)
 
         self.center_x = x
         self.center_y = y
         self.alien_type = alien_type
-        self.change_x: float = SETTINGS.alien_speed
+        self.change_x: float = SETTINGS.alien_speed if speed is None else speed
         self.change_y: float = 0.0
+        self.entity_id: int = next_entity_id()
+
+    def reset(self, x: float, y: float, alien_type: int, scale: float, speed: float) -> None:
+        """
+        Reinitialize a recycled alien for a new wave.
+
+        Args:
+            x: Starting x coordinate.
+            y: Starting y coordinate.
+            alien_type: Type of alien (affects appearance/score).
+            scale: Sprite scale.
+            speed: Horizontal speed.
+        """
+        if alien_type != self.alien_type:
+            sprite_path = ALIEN_SPRITES[alien_type % len(ALIEN_SPRITES)]
+            self.texture = load_texture(sprite_path)
+            self.sync_hit_box_to_texture()
+
+        self.scale = scale
+        self.center_x = x
+        self.center_y = y
+        self.alien_type = alien_type
+        self.change_x = speed
+        self.change_y = 0.0
+        # A recycled alien is a new entity to anyone mirroring the game
+        self.entity_id = next_entity_id()
 
     def update(self, delta_time: float = 1 / 60) -> None:
         """
@@ -74,27 +108,80 @@ class AlienFormation:
     Manages a formation of alien sprites.
 
     Handles movement, shooting, and collision detection for all aliens.
+    Waves are spawned a few aliens at a time, and destroyed aliens are kept
+    in a pool to be recycled into the next wave.
     """
 
     def __init__(self) -> None:
         """Initialize an empty alien formation."""
         self.aliens: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList()
         self.bullets: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList()
+        self.wave: WaveSpec | None = None
         self._move_down: bool = False
+        self._pending: Iterator[tuple[float, float, int]] | None = None
+        self._pool: list[Alien] = []
+
+    def start_wave(self, wave: WaveSpec) -> None:
+        """
+        Begin a new wave. Aliens are added by subsequent ``spawn`` calls.
 
-    def create_formation(self) -> None:
-        """Create the initial alien formation based on settings."""
-        start_x = (
-            SETTINGS.screen_width - (SETTINGS.alien_columns - 1) * SETTINGS.alien_spacing
-        ) / 2
-        start_y = SETTINGS.screen_height - 100
+        Any aliens still alive are recycled into the new wave.
 
-        for row in range(SETTINGS.alien_rows):
-            for col in range(SETTINGS.alien_columns):
-                x = start_x + col * SETTINGS.alien_spacing
-                y = start_y - row * SETTINGS.alien_spacing
-                alien = Alien(x, y, alien_type=row)
-                self.aliens.append(alien)
+        Args:
+            wave: Layout and difficulty of the wave.
+        """
+        for alien in list(self.aliens):
+            if isinstance(alien, Alien):
+                self.kill(alien)
+        self.wave = wave
+        self._pending = wave.positions()
+
+    def spawn(self, limit: int | None = None) -> int:
+        """
+        Add pending aliens of the current wave, reusing pooled sprites first.
+
+        Args:
+            limit: Maximum number of aliens to add, None for all of them.
+
+        Returns:
+            Number of aliens added.
+        """
+        if self._pending is None or self.wave is None:
+            return 0
+
+        wave = self.wave
+        added = 0
+        while limit is None or added < limit:
+            position = next(self._pending, None)
+            if position is None:
+                self._pending = None
+                break
+
+            x, y, alien_type = position
+            if self._pool:
+                alien = self._pool.pop()
+                alien.reset(x, y, alien_type, scale=wave.scale, speed=wave.speed)
+            else:
+                alien = Alien(x, y, alien_type=alien_type, scale=wave.scale, speed=wave.speed)
+            self.aliens.append(alien)
+            added += 1
+
+        return added
+
+    @property
+    def spawning(self) -> bool:
+        """True while the current wave still has aliens to spawn."""
+        return self._pending is not None
+
+    def kill(self, alien: Alien) -> None:
+        """
+        Remove an alien from play and keep it for reuse in a later wave.
+
+        Args:
+            alien: The alien to remove.
+        """
+        alien.remove_from_sprite_lists()
+        self._pool.append(alien)
 
     def update(self, delta_time: float = 1 / 60) -> None:
         """
@@ -103,19 +190,21 @@ class AlienFormation:
         Args:
             delta_time: Time elapsed since last update in seconds.
         """
-        # Check if any alien hit the edge
-        self._move_down = False
-        for alien in self.aliens:
-            if alien.right >= SETTINGS.screen_width or alien.left <= 0:
-                self._move_down = True
-                break
-
-        # Update aliens
-        for alien in self.aliens:
-            if self._move_down:
-                if isinstance(alien, Alien):
-                    alien.drop_and_reverse()
-            alien.update(delta_time)
+        # Hold the formation still until the whole wave has spawned
+        if not self.spawning:
+            # Check if any alien hit the edge
+            self._move_down = False
+            for alien in self.aliens:
+                if alien.right >= SETTINGS.screen_width or alien.left <= 0:
+                    self._move_down = True
+                    break
+
+            # Update aliens
+            for alien in self.aliens:
+                if self._move_down:
+                    if isinstance(alien, Alien):
+                        alien.drop_and_reverse()
+                alien.update(delta_time)
 
         # Update bullets
         self.bullets.update(delta_time)
@@ -136,7 +225,7 @@ class AlienFormation:
             A new bullet if one was fired, None otherwise.
         """
         if random.random() < shoot_chance and len(self.aliens) > 0:
-            shooter = random.choice(list(self.aliens))
+            shooter = self.aliens[random.randrange(len(self.aliens))]
             bullet = Bullet(
                 x=shooter.center_x,
                 y=shooter.bottom,
@@ -160,9 +249,9 @@ class AlienFormation:
         Check if all aliens have been destroyed.
 
         Returns:
-            True if no aliens remain.
+            True if no aliens remain and none are left to spawn.
         """
-        return len(self.aliens) == 0
+        return len(self.aliens) == 0 and not self.spawning
 
     def reached_bottom(self, y_threshold: float = 100.0) -> bool:
         """
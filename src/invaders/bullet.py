@@ -2,6 +2,9 @@
 
 import arcade
 
+from invaders.hitbox import load_texture
+from invaders.shared_state import next_entity_id
+
 # Default sprite paths for bullets
 PLAYER_BULLET_SPRITE = ":resources:/images/space_shooter/laserBlue01.png"
 ALIEN_BULLET_SPRITE = ":resources:/images/space_shooter/laserRed01.png"
@@ -37,12 +40,13 @@ class Bullet(arcade.Sprite):
         else:
             sprite_path = PLAYER_BULLET_SPRITE if is_player_bullet else ALIEN_BULLET_SPRITE
 
-        super().__init__(sprite_path, scale=0.5)
+        super().__init__(load_texture(sprite_path), scale=0.5)
 
         self.center_x = x
         self.center_y = y
         self.change_y = speed if is_player_bullet else -speed
         self.is_player_bullet = is_player_bullet
+        self.entity_id: int = next_entity_id()
 
         # Rotate laser to point upward for player, downward for alien
         self.angle = 0 if is_player_bullet else 180
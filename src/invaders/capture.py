@@ -0,0 +1,347 @@
+"""
+Gameplay recording without stalling the game loop.
+
+Frames are read back from the offscreen buffer into a ring of pixel pack
+buffers. ``glReadPixels`` into a bound pack buffer returns immediately and
+the copy completes on the GPU (or in Mesa's software rasterizer) while the
+next frames are drawn; a fence tells when a slot is ready. Finished frames
+are copied into a fixed pool of host buffers and handed to a writer thread
+that flips, converts and writes them as a PNG sequence or raw I420 YUV.
+
+When the writer falls behind and every host buffer is in use, frames are
+either dropped (the game never waits) or the game waits for a free buffer
+(every frame is kept), depending on the policy.
+"""
+
+import ctypes
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+import arcade
+from arcade.gl.backends.opengl.buffer import OpenGLBuffer
+from PIL import Image
+from pyglet import gl
+
+from invaders.settings import CAPTURE_FORMATS, CAPTURE_POLICIES
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the GPU to finish a readback that has to be reused
+_FENCE_TIMEOUT_NS = 1_000_000_000
+
+
+@dataclass
+class CaptureStats:
+    """Counts of frames seen by a recorder."""
+
+    captured: int = 0  # Readbacks issued
+    written: int = 0  # Frames written by the worker
+    dropped: int = 0  # Frames lost because the writer was behind
+    waited: float = 0.0  # Seconds the game spent waiting for the writer
+
+
+class _Slot:
+    """One pixel pack buffer in the readback ring."""
+
+    def __init__(self, ctx: arcade.ArcadeContext, size: int) -> None:
+        buffer = ctx.buffer(reserve=size)
+        if not isinstance(buffer, OpenGLBuffer):
+            raise TypeError("Frame capture needs Arcade's OpenGL backend")
+        self.buffer = buffer
+        self.size = size
+        self.fence: object | None = None  # GLsync of the readback in flight
+        self.frame: int = -1
+        self.frame_size: tuple[int, int] = (0, 0)
+
+    @property
+    def pending(self) -> bool:
+        """Whether a readback into this slot has been issued and not collected."""
+        return self.fence is not None
+
+    def is_ready(self, timeout_ns: int = 0) -> bool:
+        """Check, waiting at most ``timeout_ns``, whether the readback has completed."""
+        result = gl.glClientWaitSync(self.fence, gl.GL_SYNC_FLUSH_COMMANDS_BIT, timeout_ns)
+        return result in (gl.GL_ALREADY_SIGNALED, gl.GL_CONDITION_SATISFIED)
+
+    def copy_to(self, host: bytearray) -> None:
+        """Copy the finished readback into a host buffer and free the slot."""
+        gl.glBindBuffer(gl.GL_PIXEL_PACK_BUFFER, self.buffer.glo)
+        pointer = gl.glMapBufferRange(gl.GL_PIXEL_PACK_BUFFER, 0, self.size, gl.GL_MAP_READ_BIT)
+        try:
+            ctypes.memmove((ctypes.c_char * self.size).from_buffer(host), pointer, self.size)
+        finally:
+            gl.glUnmapBuffer(gl.GL_PIXEL_PACK_BUFFER)
+            gl.glBindBuffer(gl.GL_PIXEL_PACK_BUFFER, 0)
+        self.release()
+
+    def release(self) -> None:
+        """Forget the readback in this slot."""
+        if self.fence is not None:
+            gl.glDeleteSync(self.fence)
+            self.fence = None
+
+
+class FrameWriter:
+    """
+    Writes frames to disk on a background thread.
+
+    Frames are handed over in host buffers taken from ``free`` with
+    ``acquire`` and queued with ``submit``; the thread puts each buffer back
+    into ``free`` as soon as it has decoded the frame.
+    """
+
+    def __init__(self, output: Path, frame_format: str, policy: str = "drop") -> None:
+        """
+        Start the writer thread.
+
+        Args:
+            output: Directory for a PNG sequence, or file for raw YUV.
+            frame_format: "png" or "yuv".
+            policy: "drop" to skip frames while every host buffer is in use,
+                or "wait" to block until one is handed back.
+        """
+        if frame_format not in CAPTURE_FORMATS:
+            raise ValueError(
+                f"Unknown capture format {frame_format!r}, expected one of {CAPTURE_FORMATS}"
+            )
+        if policy not in CAPTURE_POLICIES:
+            raise ValueError(
+                f"Unknown capture policy {policy!r}, expected one of {CAPTURE_POLICIES}"
+            )
+        self.output = output
+        self.frame_format = frame_format
+        self.policy = policy
+        self.written: int = 0
+        self.dropped: int = 0
+        self.waited: float = 0.0
+        self.error: BaseException | None = None
+
+        # Frames to write, and host buffers that can be filled again
+        self.frames: queue.Queue[tuple[int, tuple[int, int], bytearray] | None] = queue.Queue()
+        self.free: queue.Queue[bytearray] = queue.Queue()
+
+        self._file: BinaryIO | None = None
+        if frame_format == "png":
+            output.mkdir(parents=True, exist_ok=True)
+        else:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            self._file = output.open("wb")
+
+        self._thread = threading.Thread(target=self._run, name="invaders-capture", daemon=True)
+        self._thread.start()
+
+    def acquire(self) -> bytearray | None:
+        """
+        Take a free host buffer to copy a frame into, following the policy.
+
+        Returns:
+            The buffer, or None if the frame has to be dropped.
+        """
+        try:
+            return self.free.get_nowait()
+        except queue.Empty:
+            if self.policy == "drop":
+                self.dropped += 1
+                return None
+        start = time.perf_counter()
+        pixels = self.free.get()
+        self.waited += time.perf_counter() - start
+        return pixels
+
+    def submit(self, frame: int, size: tuple[int, int], pixels: bytearray) -> None:
+        """
+        Queue a frame for writing.
+
+        Args:
+            frame: Frame number, used to name PNG files.
+            size: Width and height in pixels.
+            pixels: Bottom-up RGBA rows from ``glReadPixels``, in a buffer from ``acquire``.
+        """
+        self.frames.put((frame, size, pixels))
+
+    def _run(self) -> None:
+        """Write queued frames until the end marker arrives."""
+        while (item := self.frames.get()) is not None:
+            frame, size, pixels = item
+            # Decode bottom-up GL rows without alpha (the offscreen clear is
+            # transparent), then hand the host buffer back right away
+            image = Image.frombytes("RGB", size, pixels, "raw", "RGBX", 0, -1)
+            self.free.put(pixels)
+            try:
+                if self.error is None:
+                    self._write(frame, image)
+                    self.written += 1
+            except Exception as error:
+                logger.exception("Failed to write frame %d", frame)
+                self.error = error
+
+    def _write(self, frame: int, image: Image.Image) -> None:
+        """Write one frame."""
+        if self.frame_format == "png":
+            image.save(self.output / f"frame_{frame:06d}.png", compress_level=1)
+            return
+
+        # Planar I420: full resolution luma, chroma at half resolution
+        if self._file is None:
+            return
+        y, cb, cr = image.convert("YCbCr").split()
+        self._file.write(y.tobytes())
+        self._file.write(cb.reduce(2).tobytes())
+        self._file.write(cr.reduce(2).tobytes())
+
+    def close(self) -> None:
+        """
+        Write the remaining frames and stop the thread.
+
+        Raises:
+            Exception: The first error the thread hit while writing, if any.
+        """
+        self.frames.put(None)
+        self._thread.join()
+        if self._file is not None:
+            self._file.close()
+        if self.error is not None:
+            raise self.error
+
+
+class FrameRecorder:
+    """
+    Records frames from a framebuffer without waiting on the GPU or the disk.
+
+    Call ``capture`` once per frame after drawing into the framebuffer, and
+    ``close`` when done to flush every frame still in flight.
+    """
+
+    def __init__(
+        self,
+        ctx: arcade.ArcadeContext,
+        output: str | Path,
+        frame_format: str = "png",
+        ring_size: int = 4,
+        policy: str = "drop",
+    ) -> None:
+        """
+        Initialize the recorder and start its writer thread.
+
+        Args:
+            ctx: The window's OpenGL context.
+            output: Directory for a PNG sequence, or file for raw YUV.
+            frame_format: "png" or "yuv".
+            ring_size: Pixel pack buffers in the readback ring, and host
+                buffers the writer can have queued.
+            policy: "drop" to skip frames while the writer is behind, or
+                "wait" to make the game wait for it.
+        """
+        self.ctx = ctx
+        self.ring_size = max(ring_size, 2)
+        self.stats = CaptureStats()
+
+        self.writer = FrameWriter(Path(output), frame_format, policy)
+        self._slots: list[_Slot] = []
+        self._frame_bytes: int = 0
+        self._next_slot: int = 0
+        self._frame: int = 0
+
+    def _allocate(self, frame_bytes: int) -> None:
+        """(Re)create the readback ring and host buffers for a frame size."""
+        self.flush()
+        for slot in self._slots:
+            slot.buffer.delete()
+        self._slots = [_Slot(self.ctx, frame_bytes) for _ in range(self.ring_size)]
+
+        # Replace the host buffers once the writer has handed them all back
+        for _ in range(self.ring_size if self._frame_bytes else 0):
+            self.writer.free.get()
+        for _ in range(self.ring_size):
+            self.writer.free.put(bytearray(frame_bytes))
+        self._frame_bytes = frame_bytes
+
+    def capture(self, framebuffer: arcade.gl.Framebuffer) -> None:
+        """
+        Start reading back the current contents of a framebuffer.
+
+        Args:
+            framebuffer: Framebuffer the frame was drawn into.
+        """
+        width, height = framebuffer.size
+        frame_bytes = width * height * 4
+        if frame_bytes != self._frame_bytes:
+            if self.writer.frame_format == "yuv" and self._frame_bytes:
+                raise ValueError("Raw YUV captures need a fixed frame size")
+            self._allocate(frame_bytes)
+
+        # Hand over finished readbacks, then make sure the next slot is free
+        self.poll()
+        slot = self._slots[self._next_slot]
+        if slot.pending:
+            slot.is_ready(_FENCE_TIMEOUT_NS)
+            self._collect(slot)
+        self._next_slot = (self._next_slot + 1) % len(self._slots)
+
+        with framebuffer.activate():
+            gl.glPixelStorei(gl.GL_PACK_ALIGNMENT, 1)
+            gl.glBindBuffer(gl.GL_PIXEL_PACK_BUFFER, slot.buffer.glo)
+            gl.glReadPixels(0, 0, width, height, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, 0)
+            gl.glBindBuffer(gl.GL_PIXEL_PACK_BUFFER, 0)
+        slot.fence = gl.glFenceSync(gl.GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+        slot.frame = self._frame
+        slot.frame_size = (width, height)
+        self._frame += 1
+        self.stats.captured += 1
+
+    def poll(self) -> None:
+        """Hand every readback that has completed to the writer, oldest first."""
+        for slot in sorted((s for s in self._slots if s.pending), key=lambda s: s.frame):
+            if not slot.is_ready():
+                break
+            self._collect(slot)
+
+    def _collect(self, slot: _Slot) -> None:
+        """Copy a completed readback into a free host buffer and queue it for writing."""
+        host = self.writer.acquire()
+        self.stats.dropped = self.writer.dropped
+        self.stats.waited = self.writer.waited
+        if host is None:
+            slot.release()
+            return
+
+        slot.copy_to(host)
+        self.writer.submit(slot.frame, slot.frame_size, host)
+
+    def flush(self) -> None:
+        """Wait for every readback in flight and queue it for writing."""
+        for slot in sorted((s for s in self._slots if s.pending), key=lambda s: s.frame):
+            slot.is_ready(_FENCE_TIMEOUT_NS)
+            self._collect(slot)
+
+    def close(self) -> CaptureStats:
+        """
+        Flush all frames, stop the writer and free the GPU buffers.
+
+        Returns:
+            Final frame counts.
+
+        Raises:
+            Exception: The first error the writer hit, after cleaning up.
+        """
+        self.flush()
+        try:
+            self.writer.close()
+        finally:
+            for slot in self._slots:
+                slot.buffer.delete()
+            self._slots.clear()
+            self.stats.written = self.writer.written
+
+        logger.info(
+            "Recorded %d frames to %s (%d dropped)",
+            self.stats.written,
+            self.writer.output,
+            self.stats.dropped,
+        )
+        return self.stats
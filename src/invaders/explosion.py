@@ -1,6 +1,10 @@
 """Explosion animation sprite."""
 
 import arcade
+from arcade.texture import ImageData
+
+from invaders.hitbox import texture_from_image
+from invaders.shared_state import next_entity_id
 
 
 class Explosion(arcade.Sprite):
@@ -23,6 +27,7 @@ class Explosion(arcade.Sprite):
 
         self.center_x = x
         self.center_y = y
+        self.entity_id: int = next_entity_id()
 
         # Animation state
         self.time_elapsed: float = 0.0
@@ -63,10 +68,11 @@ def load_explosion_textures() -> list[arcade.Texture]:
     file_name = ":resources:/images/spritesheets/explosion.png"
 
     spritesheet = arcade.load_spritesheet(file_name)
-    texture_list = spritesheet.get_texture_grid(
+    image_list = spritesheet.get_image_grid(
         size=(sprite_width, sprite_height),
         columns=columns,
         count=count,
     )
 
-    return texture_list
+    # Hit boxes come from the cache instead of being traced for every frame
+    return [texture_from_image(ImageData(image)) for image in image_list]
@@ -1,14 +1,42 @@
 """Main game class managing the Space Invaders game."""
 
-import arcade
-from arcade.types import LRBT
+import importlib.util
+import logging
+import time
+from typing import TYPE_CHECKING
 
-from invaders.alien import AlienFormation
-from invaders.bullet import Bullet
-from invaders.explosion import Explosion, load_explosion_textures
-from invaders.player import Player
+import arcade
+from arcade.types import LRBT, Rect
+
+from invaders.capture import CaptureStats, FrameRecorder
+from invaders.explosion import load_explosion_textures
+from invaders.hitbox import load_hit_box_cache, save_hit_box_cache
+from invaders.input import Action, InputState
+from invaders.leaderboard import Leaderboard, ScoreEntry
+from invaders.offscreen import OffscreenBuffer
+from invaders.power import PowerManager, PowerMode
+from invaders.quality import QualityGovernor, QualityLevel
 from invaders.settings import SETTINGS
+from invaders.simulation import GameSimulation, Sound
+from invaders.spectator import Snapshot, SpectatorServer
+from invaders.split import RemoteSimulation
 from invaders.star import StarField
+from invaders.telemetry import Event, EventLog, FrameStats, open_event_log
+from invaders.timing import FixedStepClock, SpriteInterpolator, frame_interval
+
+if TYPE_CHECKING:
+    from invaders.particles import ParticleSystem
+
+logger = logging.getLogger(__name__)
+
+# Keys that control the player
+KEY_BINDINGS: dict[int, Action] = {
+    arcade.key.LEFT: Action.LEFT,
+    arcade.key.A: Action.LEFT,
+    arcade.key.RIGHT: Action.RIGHT,
+    arcade.key.D: Action.RIGHT,
+    arcade.key.SPACE: Action.FIRE,
+}
 
 
 class InvadersGame(arcade.Window):
@@ -25,11 +53,16 @@ class InvadersGame(arcade.Window):
         Creates the window with dimensions from settings and initializes
         sprite lists for player, aliens, and bullets.
         """
+        # The window is driven at the render rate; logic runs on its own fixed clock
+        render_interval = frame_interval(SETTINGS.render_rate)
         super().__init__(
             width=SETTINGS.screen_width,
             height=SETTINGS.screen_height,
             title=SETTINGS.screen_title,
             resizable=True,
+            update_rate=render_interval,
+            draw_rate=render_interval,
+            vsync=SETTINGS.vsync,
         )
 
         # Camera for scaling in fullscreen - uses fixed projection to maintain game coordinates
@@ -41,12 +74,8 @@ class InvadersGame(arcade.Window):
             viewport=self.rect,
         )
 
-        # Game objects
-        self.player: Player
-        self.player_list: arcade.SpriteList[arcade.Sprite]
-        self.alien_formation: AlienFormation
-        self.player_bullets: arcade.SpriteList[arcade.Sprite]
-        self.explosions_list: arcade.SpriteList[arcade.Sprite]
+        # Game state and rules, run here or in a separate process
+        self.sim: GameSimulation | RemoteSimulation
 
         # Background
         self.starfield: StarField
@@ -55,16 +84,68 @@ class InvadersGame(arcade.Window):
         self.explosion_textures: list[arcade.Texture]
 
         # Sound effects
-        self.laser_sound: arcade.Sound
-        self.explosion_sound: arcade.Sound
-        self.hit_sound: arcade.Sound
-        self.gameover_sound: arcade.Sound
-        self.victory_sound: arcade.Sound
+        self.sounds: dict[Sound, arcade.Sound]
+        self._sound_last_played: dict[arcade.Sound, float] = {}
+
+        # Player input, sampled at the start of every logic step
+        self.input = InputState(KEY_BINDINGS, SETTINGS.fire_buffer_time)
+
+        # Fixed-rate logic and interpolated drawing
+        self.logic_clock = FixedStepClock(SETTINGS.logic_rate, SETTINGS.max_logic_steps)
+        self.interpolator = SpriteInterpolator(snap_distance=SETTINGS.screen_height / 2)
+
+        # Adaptive quality: sheds optional visual work when frames run over budget
+        self.quality = QualityGovernor(budget=SETTINGS.frame_budget)
+        self.quality.enabled = SETTINGS.adaptive_quality
+        self.quality.on_change = self._apply_quality
+        self.offscreen: OffscreenBuffer | None = None
+        self._update_time: float = 0.0
+
+        # Particle effects, drawn in one batch; numpy is an optional dependency
+        self.particles: ParticleSystem | None = None
+        if SETTINGS.particles and importlib.util.find_spec("numpy") is not None:
+            from invaders.particles import ParticleSystem
+
+            self.particles = ParticleSystem(
+                self.ctx, SETTINGS.max_particles, SETTINGS.particle_intensity
+            )
 
-        # Game state
-        self.score: int = 0
-        self.game_over: bool = False
-        self.game_won: bool = False
+        # Power saving: throttle static screens and pause in the background
+        self.power = PowerManager(
+            active_interval=render_interval,
+            idle_interval=frame_interval(SETTINGS.idle_rate),
+            background_interval=frame_interval(SETTINGS.background_rate),
+            pause_when_unfocused=SETTINGS.pause_when_unfocused,
+        )
+        self._discard_next_delta: bool = False
+
+        # Optional gameplay event log, with per-second frame statistics
+        self.telemetry: EventLog | None = open_event_log()
+        self.frame_stats: FrameStats | None = None
+        if self.telemetry is not None:
+            self.frame_stats = FrameStats(self.telemetry)
+
+        # Optional high-score table; the final score is submitted once per game
+        self.leaderboard: Leaderboard | None = None
+        if SETTINGS.leaderboard_path:
+            self.leaderboard = Leaderboard(SETTINGS.leaderboard_path, SETTINGS.leaderboard_size)
+        self.last_score: ScoreEntry | None = None
+        self._score_submitted: bool = False
+        # Static screen drawn before the stored scores had loaded
+        self._high_scores_pending: bool = False
+
+        # Optional recording of every drawn frame
+        self.recorder: FrameRecorder | None = None
+        if SETTINGS.capture_path:
+            self.start_recording(SETTINGS.capture_path, SETTINGS.capture_format)
+
+        # Optional stream of the game to spectator viewers
+        self.spectators: SpectatorServer | None = None
+        if SETTINGS.spectator_port is not None:
+            self.spectators = SpectatorServer(
+                SETTINGS.spectator_host, SETTINGS.spectator_port, SETTINGS.spectator_queue_size
+            )
+            self.spectators.start()
 
         # Background color
         self.background_color = arcade.color.BLACK
@@ -76,8 +157,10 @@ class InvadersGame(arcade.Window):
         Initializes or resets all game objects and state. Call this
         to start a new game or restart after game over.
         """
-        # Load explosion textures (only once)
+        # Load explosion textures (only once), using persisted hit boxes if configured
         if not hasattr(self, "explosion_textures") or not self.explosion_textures:
+            if SETTINGS.hit_box_cache_path:
+                load_hit_box_cache(SETTINGS.hit_box_cache_path)
             self.explosion_textures = load_explosion_textures()
 
         # Create starfield background (only once)
@@ -85,63 +168,194 @@ class InvadersGame(arcade.Window):
             self.starfield = StarField()
 
         # Load sound effects (only once)
-        if not hasattr(self, "laser_sound") or not self.laser_sound:
-            self.laser_sound = arcade.load_sound(":resources:/sounds/laser1.wav")
-            self.explosion_sound = arcade.load_sound(":resources:/sounds/explosion2.wav")
-            self.hit_sound = arcade.load_sound(":resources:/sounds/hit1.wav")
-            self.gameover_sound = arcade.load_sound(":resources:/sounds/gameover1.wav")
-            self.victory_sound = arcade.load_sound(":resources:/sounds/upgrade1.wav")
-
-        # Create player at bottom center of screen
-        self.player = Player()
-        self.player.center_x = SETTINGS.screen_width / 2
-        self.player.center_y = 50
-
-        # Create player sprite list
-        self.player_list = arcade.SpriteList()
-        self.player_list.append(self.player)
-
-        # Create alien formation
-        self.alien_formation = AlienFormation()
-        self.alien_formation.create_formation()
-
-        # Create player bullet list
-        self.player_bullets = arcade.SpriteList()
-
-        # Create explosions list
-        self.explosions_list = arcade.SpriteList()
+        if not hasattr(self, "sounds") or not self.sounds:
+            self.sounds = {
+                Sound.LASER: arcade.load_sound(":resources:/sounds/laser1.wav"),
+                Sound.EXPLOSION: arcade.load_sound(":resources:/sounds/explosion2.wav"),
+                Sound.HIT: arcade.load_sound(":resources:/sounds/hit1.wav"),
+                Sound.GAME_OVER: arcade.load_sound(":resources:/sounds/gameover1.wav"),
+                Sound.VICTORY: arcade.load_sound(":resources:/sounds/upgrade1.wav"),
+            }
+
+        # Create the simulation (only once), sharing the loaded explosion frames
+        if not hasattr(self, "sim"):
+            if SETTINGS.split_processes:
+                self.sim = RemoteSimulation(self.explosion_textures)
+            else:
+                self.sim = GameSimulation(self.telemetry)
+                self.sim.explosion_textures = self.explosion_textures
+
+        # Apply the current quality level to the freshly loaded resources
+        self._apply_quality(self.quality.level)
+
+        # Start a new game; a fire press from the previous one is not carried over
+        self.sim.setup()
+        self.input.reset()
+        if self.particles is not None:
+            self.particles.clear()
+        self.last_score = None
+        self._score_submitted = False
+
+        # Persist any hit boxes computed while loading
+        if SETTINGS.hit_box_cache_path:
+            save_hit_box_cache(SETTINGS.hit_box_cache_path)
+
+        # Start the logic clock fresh so the new game has no stale state to blend from
+        self.logic_clock.reset()
+        self.interpolator.clear()
+        self._sync_power_mode()
+
+    def draw(self, dt: float) -> None:
+        """
+        Redraw the window, skipping frames when power saving says nothing changed.
 
-        # Reset game state
-        self.score = 0
-        self.game_over = False
-        self.game_won = False
+        Args:
+            dt: Time since the last draw in seconds.
+        """
+        if self.power.should_draw():
+            super().draw(dt)
 
     def on_draw(self) -> None:
         """Render the game screen."""
+        start = time.perf_counter()
         self.clear()
 
+        # Recordings are always drawn offscreen, at full resolution
+        render_scale = 1.0 if self.recorder else self.quality.level.render_scale
+        if render_scale < 1.0 or self.recorder:
+            # Draw at internal resolution, then stretch onto the window
+            width = int(SETTINGS.screen_width * render_scale)
+            height = int(SETTINGS.screen_height * render_scale)
+            if self.offscreen is None:
+                self.offscreen = OffscreenBuffer(self.ctx, width, height)
+            else:
+                self.offscreen.resize(width, height)
+            with self.offscreen.activate():
+                self._draw_scene(self.offscreen.rect)
+            if self.recorder:
+                self.recorder.capture(self.offscreen.framebuffer)
+            self.offscreen.draw(self.rect)
+        else:
+            self._draw_scene(self.rect)
+
+        # Input sampled by the last logic step is visible from this frame on; in
+        # split mode, once the simulation process has published a frame applying it
+        for latency in self.input.frame_drawn(self.sim.input_steps_pending):
+            if self.telemetry is not None:
+                self.telemetry.emit(
+                    Event.INPUT,
+                    (latency.action.name or "").lower(),
+                    latency.pressed,
+                    round(latency.latency * 1000, 2),
+                )
+
+        # Feed the governor the work done for this frame
+        frame_time = self._update_time + time.perf_counter() - start
+        self.quality.record(frame_time)
+        if self.frame_stats is not None:
+            self.frame_stats.record(frame_time, self.quality.level_index)
+
+    def _draw_scene(self, viewport: Rect) -> None:
+        """
+        Draw the game world and UI into the active framebuffer.
+
+        Args:
+            viewport: Area of the active framebuffer the game is drawn to.
+        """
         # Use camera for proper scaling
+        self.camera.viewport = viewport
         self.camera.use()
 
+        # Show moving sprites between the last two logic states
+        moving_lists = self._interpolated_sprite_lists()
+        self.interpolator.apply(moving_lists, self.logic_clock.alpha)
+
         # Draw starfield background first
         self.starfield.draw()
 
         # Draw game objects
-        self.player_list.draw()
-        self.alien_formation.aliens.draw()
-        self.alien_formation.bullets.draw()
-        self.player_bullets.draw()
-        self.explosions_list.draw()
+        for sprite_list in self.sim.sprite_lists:
+            sprite_list.draw()
+        if self.particles is not None:
+            self.particles.draw(scale=viewport.width / SETTINGS.screen_width)
+
+        self.interpolator.restore()
 
         # Draw UI
         self._draw_ui()
 
         # Draw game over or win screen
-        if self.game_over:
+        if self.sim.game_over:
             self._draw_game_over()
-        elif self.game_won:
+        elif self.sim.game_won:
             self._draw_victory()
 
+        # Draw paused overlay while in the background
+        if self.power.mode is PowerMode.BACKGROUND:
+            self._draw_paused()
+
+    def start_recording(self, path: str, frame_format: str, policy: str | None = None) -> None:
+        """
+        Record every drawn frame until ``stop_recording`` is called.
+
+        Quality is held at full while recording: the governor follows wall
+        clock frame times, which would make the frames depend on the machine.
+
+        Args:
+            path: Directory for a PNG sequence, or file for raw YUV.
+            frame_format: "png" or "yuv".
+            policy: "drop" or "wait" when the writer falls behind, defaults to the settings.
+        """
+        self.stop_recording()
+        self.quality.enabled = False
+        self.quality.set_level(0, "recording")
+        self.recorder = FrameRecorder(
+            self.ctx,
+            path,
+            frame_format=frame_format,
+            ring_size=SETTINGS.capture_ring_size,
+            policy=policy or SETTINGS.capture_policy,
+        )
+
+    def stop_recording(self) -> CaptureStats | None:
+        """
+        Finish writing the recording in progress, if any.
+
+        Returns:
+            Frame counts of the finished recording, or None if not recording.
+        """
+        if self.recorder is None:
+            return None
+        try:
+            stats = self.recorder.close()
+        finally:
+            self.recorder = None
+            self.quality.enabled = SETTINGS.adaptive_quality
+        return stats
+
+    def close(self) -> None:
+        """Close the window, finishing any recording and stopping background work."""
+        if getattr(self, "recorder", None) is not None:
+            self.stop_recording()
+        spectators = getattr(self, "spectators", None)
+        if spectators is not None:
+            spectators.stop()
+            self.spectators = None
+        sim = getattr(self, "sim", None)
+        if isinstance(sim, RemoteSimulation):
+            sim.close()
+        if hasattr(self, "input") and self.input.latency.count:
+            logger.info("Input latency: %s", self.input.latency.summary())
+        leaderboard = getattr(self, "leaderboard", None)
+        if leaderboard is not None:
+            leaderboard.close()
+            self.leaderboard = None
+        telemetry = getattr(self, "telemetry", None)
+        if telemetry is not None:
+            telemetry.close()
+            self.telemetry = None
+        super().close()
+
     def on_resize(self, width: int, height: int) -> None:
         """
         Handle window resize events.
@@ -153,43 +367,109 @@ class InvadersGame(arcade.Window):
         super().on_resize(width, height)
         # Update camera viewport to match window, keep projection fixed to game coordinates
         self.camera.viewport = self.rect
+        self.power.invalidate()
+
+    def on_activate(self) -> None:
+        """Handle the window gaining keyboard focus."""
+        self.power.focused = True
+        self._sync_power_mode()
+
+    def on_deactivate(self) -> None:
+        """Handle the window losing keyboard focus."""
+        # Key releases are not seen while unfocused
+        self.input.release_all()
+        self.power.focused = False
+        self._sync_power_mode()
+
+    def on_show(self) -> None:
+        """Handle the window being shown or restored from minimized."""
+        self.power.visible = True
+        self._sync_power_mode()
+
+    def on_hide(self) -> None:
+        """Handle the window being hidden or minimized."""
+        self.power.visible = False
+        self._sync_power_mode()
+
+    def on_expose(self) -> None:
+        """Handle the window contents being invalidated by the system."""
+        self.power.invalidate()
 
     def on_update(self, delta_time: float) -> None:
         """
-        Update game logic.
+        Advance the logic clock and run any fixed logic steps that are due.
 
         Args:
             delta_time: Time elapsed since last update in seconds.
         """
-        # Always update starfield background
-        self.starfield.update(delta_time)
+        start = time.perf_counter()
 
-        if self.game_over or self.game_won:
-            return
+        self._sync_power_mode()
 
-        # Update player
-        self.player.update(delta_time)
+        # A viewer that joined while nothing is stepping still gets the current state
+        if self.spectators is not None and self.spectators.needs_snapshot:
+            self.spectators.publish(self._snapshot())
 
-        # Update aliens
-        self.alien_formation.update(delta_time)
-        self.alien_formation.maybe_shoot(shoot_chance=0.02)
+        if self.power.mode is not PowerMode.ACTIVE:
+            # Paused or showing a static screen: nothing to simulate
+            self._update_time = 0.0
+            if self._high_scores_pending and self.leaderboard and self.leaderboard.loaded.is_set():
+                self._high_scores_pending = False
+                self.power.invalidate()
+            return
+        if self._discard_next_delta:
+            # Don't replay the time spent paused or idle
+            delta_time = 0.0
+            self._discard_next_delta = False
 
-        # Update player bullets
-        self.player_bullets.update(delta_time)
+        steps = self.logic_clock.advance(delta_time)
+        for _ in range(steps):
+            self.interpolator.capture(self._interpolated_sprite_lists())
+            self._update_logic(self.logic_clock.step)
 
-        # Update explosions
-        self.explosions_list.update(delta_time)
+        self._update_time = time.perf_counter() - start
 
-        # Remove off-screen player bullets
-        for bullet in list(self.player_bullets):
-            if isinstance(bullet, Bullet) and bullet.is_off_screen(SETTINGS.screen_height):
-                bullet.remove_from_sprite_lists()
+    def _update_logic(self, delta_time: float) -> None:
+        """
+        Run one fixed step of game logic.
 
-        # Check collisions
-        self._check_collisions()
+        Args:
+            delta_time: Fixed logic step in seconds.
+        """
+        # Update starfield background
+        self.starfield.update(delta_time)
 
-        # Check win/lose conditions
-        self._check_game_state()
+        # Apply the input held at the start of this step
+        controls = self.input.sample(delta_time)
+        if not (self.sim.game_over or self.sim.game_won):
+            self.sim.steer(controls.direction)
+            if controls.fire and self.sim.fire():
+                self.input.consume_fire()
+
+        # Advance the game (or pick up the latest state from the simulation process)
+        self.sim.update(delta_time)
+
+        # Play the sounds the step triggered
+        for sound in self.sim.sounds:
+            self._play_sound(self.sounds[sound])
+        self.sim.sounds.clear()
+
+        # Turn the step's effects and the bullets' trails into particles
+        if self.particles is not None:
+            self.particles.add_effects(self.sim.effects)
+            self.particles.add_trails(self.sim.player_bullets, self.sim.alien_bullets)
+            self.particles.update(delta_time)
+        self.sim.effects.clear()
+
+        # Keep the final score once the game has ended
+        if (self.sim.game_over or self.sim.game_won) and not self._score_submitted:
+            self._score_submitted = True
+            if self.leaderboard is not None:
+                self.last_score = self.leaderboard.submit(self.sim.score, self.sim.wave_number)
+
+        # Stream the step to spectators, if anyone is watching
+        if self.spectators is not None and self.spectators.has_clients:
+            self.spectators.publish(self._snapshot())
 
     def on_key_press(self, key: int, modifiers: int) -> None:
         """
@@ -199,22 +479,16 @@ class InvadersGame(arcade.Window):
             key: The key that was pressed.
             modifiers: Bitwise OR of modifier keys pressed.
         """
-        if self.game_over or self.game_won:
-            if key == arcade.key.R:
-                self.setup()
-            elif key == arcade.key.F:
-                self._toggle_fullscreen()
+        self.power.invalidate()
+
+        # Movement and fire are applied by the next logic step
+        if self.input.press(key):
             return
 
-        match key:
-            case arcade.key.LEFT | arcade.key.A:
-                self.player.move_left()
-            case arcade.key.RIGHT | arcade.key.D:
-                self.player.move_right()
-            case arcade.key.SPACE:
-                self._fire_player_bullet()
-            case arcade.key.F:
-                self._toggle_fullscreen()
+        if key == arcade.key.F:
+            self._toggle_fullscreen()
+        elif key == arcade.key.R and (self.sim.game_over or self.sim.game_won):
+            self.setup()
 
     def on_key_release(self, key: int, modifiers: int) -> None:
         """
@@ -224,25 +498,82 @@ class InvadersGame(arcade.Window):
             key: The key that was released.
             modifiers: Bitwise OR of modifier keys still pressed.
         """
-        match key:
-            case arcade.key.LEFT | arcade.key.A if self.player.change_x < 0:
-                self.player.stop()
-            case arcade.key.RIGHT | arcade.key.D if self.player.change_x > 0:
-                self.player.stop()
-
-    def _fire_player_bullet(self) -> None:
-        """Fire a bullet from the player's position."""
-        # Limit to one player bullet at a time (classic Space Invaders behavior)
-        if len(self.player_bullets) < 3:
-            bullet = Bullet(
-                x=self.player.center_x,
-                y=self.player.top,
-                speed=SETTINGS.bullet_speed,
-                is_player_bullet=True,
-            )
-            self.player_bullets.append(bullet)
-            # Play laser sound
-            arcade.play_sound(self.laser_sound)
+        self.input.release(key)
+
+    def _sync_power_mode(self) -> None:
+        """Switch update and draw rates when the power mode changes."""
+        self.power.static = self.sim.game_over or self.sim.game_won
+        if not self.power.refresh():
+            return
+
+        # Hold the game still while in the background
+        self.sim.paused = self.power.mode is PowerMode.BACKGROUND
+
+        interval = self.power.interval
+        self.set_update_rate(interval)
+        self.set_draw_rate(interval)
+
+        if self.power.mode is PowerMode.ACTIVE:
+            # Resume from where the game left off instead of catching up
+            self.logic_clock.reset()
+            self.interpolator.clear()
+            self._discard_next_delta = True
+
+    def _snapshot(self) -> Snapshot:
+        """
+        Capture the game state for spectators.
+
+        Returns:
+            A snapshot of the current logic step.
+        """
+        return Snapshot(
+            score=self.sim.score,
+            lives=self.sim.lives,
+            wave=self.sim.wave_number,
+            game_over=self.sim.game_over,
+            game_won=self.sim.game_won,
+            alien_scale=self.sim.alien_scale,
+            entities=list(self.sim.entities()),
+        )
+
+    def _interpolated_sprite_lists(self) -> list[arcade.SpriteList[arcade.Sprite]]:
+        """
+        Get the sprite lists whose movement is interpolated when drawing.
+
+        Returns:
+            Sprite lists of moving objects.
+        """
+        return [
+            *(layer.stars for layer in self.starfield.visible_layers),
+            *self.sim.moving_sprite_lists,
+        ]
+
+    def _play_sound(self, sound: arcade.Sound) -> None:
+        """
+        Play a sound effect, coalescing rapid repeats at reduced quality.
+
+        Args:
+            sound: The sound to play.
+        """
+        interval = self.quality.level.sound_interval
+        now = time.perf_counter()
+        if interval > 0 and now - self._sound_last_played.get(sound, -interval) < interval:
+            return
+        self._sound_last_played[sound] = now
+        arcade.play_sound(sound)
+
+    def _apply_quality(self, level: QualityLevel) -> None:
+        """
+        Adjust optional visual work to a quality level.
+
+        Args:
+            level: The quality level to apply.
+        """
+        if isinstance(self.sim, GameSimulation):
+            self.sim.explosion_frames = self.explosion_textures[:: level.explosion_frame_stride]
+        self.starfield.active_layers = level.star_layers
+        if self.particles is not None:
+            self.particles.intensity = SETTINGS.particle_intensity * level.particle_intensity
 
     def _toggle_fullscreen(self) -> None:
         """Toggle between fullscreen and windowed mode."""
@@ -250,71 +581,11 @@ class InvadersGame(arcade.Window):
         # Update camera viewport to match new window size, projection stays fixed
         self.camera.viewport = self.rect
 
-    def _check_collisions(self) -> None:
-        """Check and handle all sprite collisions."""
-        # Player bullets hitting aliens
-        for bullet in list(self.player_bullets):
-            if isinstance(bullet, Bullet):
-                hit_aliens = arcade.check_for_collision_with_list(
-                    bullet,
-                    self.alien_formation.aliens,
-                )
-                for alien in hit_aliens:
-                    # Create explosion at alien position
-                    explosion = Explosion(
-                        self.explosion_textures,
-                        x=alien.center_x,
-                        y=alien.center_y,
-                    )
-                    self.explosions_list.append(explosion)
-
-                    # Play explosion sound
-                    arcade.play_sound(self.explosion_sound)
-
-                    # Remove bullet and alien
-                    bullet.remove_from_sprite_lists()
-                    alien.remove_from_sprite_lists()
-                    # Update score
-                    self.score += 10
-                    break
-
-        # Alien bullets hitting player
-        for bullet in list(self.alien_formation.bullets):
-            if isinstance(bullet, Bullet):
-                if arcade.check_for_collision(bullet, self.player):
-                    bullet.remove_from_sprite_lists()
-                    self.player.hit()
-                    # Play hit sound
-                    arcade.play_sound(self.hit_sound)
-                    if not self.player.is_alive():
-                        self.game_over = True
-                        arcade.play_sound(self.gameover_sound)
-
-        # Aliens colliding with player
-        if arcade.check_for_collision_with_list(
-            self.player,
-            self.alien_formation.aliens,
-        ):
-            self.game_over = True
-            arcade.play_sound(self.gameover_sound)
-
-    def _check_game_state(self) -> None:
-        """Check for win/lose conditions."""
-        # Win: all aliens destroyed
-        if self.alien_formation.is_empty():
-            self.game_won = True
-            arcade.play_sound(self.victory_sound)
-
-        # Lose: aliens reached the bottom
-        if self.alien_formation.reached_bottom(y_threshold=80):
-            self.game_over = True
-            arcade.play_sound(self.gameover_sound)
-
     def _draw_ui(self) -> None:
         """Draw score and lives display."""
         # Draw score
         arcade.draw_text(
-            text=f"Score: {self.score}",
+            text=f"Score: {self.sim.score}",
             x=10,
             y=SETTINGS.screen_height - 30,
             color=arcade.color.WHITE,
@@ -323,13 +594,24 @@ class InvadersGame(arcade.Window):
 
         # Draw lives
         arcade.draw_text(
-            text=f"Lives: {self.player.lives}",
+            text=f"Lives: {self.sim.lives}",
             x=10,
             y=SETTINGS.screen_height - 50,
             color=arcade.color.WHITE,
             font_size=16,
         )
 
+        # Draw wave number
+        if self.sim.wave_number:
+            arcade.draw_text(
+                text=f"Wave: {self.sim.wave_number}",
+                x=SETTINGS.screen_width - 10,
+                y=SETTINGS.screen_height - 30,
+                color=arcade.color.WHITE,
+                font_size=16,
+                anchor_x="right",
+            )
+
     def _draw_game_over(self) -> None:
         """Draw game over screen."""
         arcade.draw_text(
@@ -341,7 +623,7 @@ class InvadersGame(arcade.Window):
             anchor_x="center",
         )
         arcade.draw_text(
-            text=f"Final Score: {self.score}",
+            text=f"Final Score: {self.sim.score}",
             x=SETTINGS.screen_width / 2,
             y=SETTINGS.screen_height / 2 - 10,
             color=arcade.color.WHITE,
@@ -356,6 +638,7 @@ class InvadersGame(arcade.Window):
             font_size=16,
             anchor_x="center",
         )
+        self._draw_high_scores()
 
     def _draw_victory(self) -> None:
         """Draw victory screen."""
@@ -368,7 +651,7 @@ class InvadersGame(arcade.Window):
             anchor_x="center",
         )
         arcade.draw_text(
-            text=f"Final Score: {self.score}",
+            text=f"Final Score: {self.sim.score}",
             x=SETTINGS.screen_width / 2,
             y=SETTINGS.screen_height / 2 - 10,
             color=arcade.color.WHITE,
@@ -383,3 +666,59 @@ class InvadersGame(arcade.Window):
             font_size=16,
             anchor_x="center",
         )
+        self._draw_high_scores()
+
+    def _draw_high_scores(self) -> None:
+        """Draw the top scores below the game over or victory message."""
+        leaderboard = self.leaderboard
+        if leaderboard is None:
+            return
+
+        y = SETTINGS.screen_height / 2 - 110
+        if not leaderboard.loaded.is_set():
+            # Drawn again by on_update once the stored scores are in
+            self._high_scores_pending = True
+            arcade.draw_text(
+                text="Loading high scores...",
+                x=SETTINGS.screen_width / 2,
+                y=y,
+                color=arcade.color.LIGHT_GRAY,
+                font_size=12,
+                anchor_x="center",
+            )
+            return
+
+        top = leaderboard.top
+        if not top:
+            return
+        rank = leaderboard.rank(self.last_score) if self.last_score is not None else None
+        arcade.draw_text(
+            text="HIGH SCORES" if rank is None else f"HIGH SCORES - YOU PLACED #{rank}",
+            x=SETTINGS.screen_width / 2,
+            y=y,
+            color=arcade.color.WHITE,
+            font_size=14,
+            anchor_x="center",
+        )
+        y -= 6
+        for position, entry in enumerate(top, start=1):
+            y -= 16
+            arcade.draw_text(
+                text=f"{position:>2}.  {entry.score:>6}  wave {entry.wave}",
+                x=SETTINGS.screen_width / 2,
+                y=y,
+                color=arcade.color.YELLOW if entry is self.last_score else arcade.color.LIGHT_GRAY,
+                font_size=12,
+                anchor_x="center",
+            )
+
+    def _draw_paused(self) -> None:
+        """Draw paused overlay shown while the window is in the background."""
+        arcade.draw_text(
+            text="PAUSED",
+            x=SETTINGS.screen_width / 2,
+            y=SETTINGS.screen_height / 2 - 80,
+            color=arcade.color.YELLOW,
+            font_size=24,
+            anchor_x="center",
+        )
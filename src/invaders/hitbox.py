@@ -0,0 +1,201 @@
+"""Cached per-texture hit boxes and axis-aligned collision checks."""
+
+import logging
+from pathlib import Path
+
+import arcade
+from arcade.cache import HitBoxCache
+from arcade.hitbox import algo_default
+from arcade.texture import ImageData
+
+logger = logging.getLogger(__name__)
+
+# Hit box points shared by every texture with the same image and algorithm.
+# Can be persisted with ``load_hit_box_cache`` / ``save_hit_box_cache``.
+HIT_BOX_CACHE = HitBoxCache()  # type: ignore[no-untyped-call]
+
+# Textures loaded through ``load_texture``, keyed by file path
+_textures: dict[str, arcade.Texture] = {}
+
+# Local hit box bounds (left, right, bottom, top) per texture
+_bounds: dict[arcade.Texture, tuple[float, float, float, float]] = {}
+
+# Set when the hit box cache has entries not yet written to disk
+_dirty = False
+
+
+def texture_from_image(image: ImageData) -> arcade.Texture:
+    """
+    Create a texture, reusing cached hit box points when available.
+
+    Args:
+        image: Image data for the texture.
+
+    Returns:
+        A texture whose hit box was computed at most once per image.
+    """
+    global _dirty
+
+    name = arcade.Texture.create_cache_name(hash=image.hash, hit_box_algorithm=algo_default)
+    points = HIT_BOX_CACHE.get(name)
+    if points is not None:
+        return arcade.Texture(image, hit_box_points=points)
+
+    texture = arcade.Texture(image)
+    HIT_BOX_CACHE.put(name, texture.hit_box_points)
+    _dirty = True
+    return texture
+
+
+def load_texture(path: str) -> arcade.Texture:
+    """
+    Load a texture from a file once, with a cached hit box.
+
+    Args:
+        path: Path or resource handle of the image file.
+
+    Returns:
+        The shared texture for this path.
+    """
+    texture = _textures.get(path)
+    if texture is None:
+        image = ImageData(arcade.load_image(path))
+        texture = texture_from_image(image)
+        texture.file_path = arcade.resources.resolve(path)
+        _textures[path] = texture
+    return texture
+
+
+def load_hit_box_cache(path: str | Path) -> None:
+    """
+    Load persisted hit boxes, if the file exists.
+
+    Args:
+        path: JSON file written by ``save_hit_box_cache`` (``.gz`` is compressed).
+    """
+    if Path(path).exists():
+        HIT_BOX_CACHE.load(path)
+        logger.debug("Loaded %d hit boxes from %s", len(HIT_BOX_CACHE), path)
+
+
+def save_hit_box_cache(path: str | Path) -> None:
+    """
+    Persist hit boxes if any were computed since the last save.
+
+    Args:
+        path: JSON file to write (``.gz`` is compressed).
+    """
+    global _dirty
+
+    if not _dirty:
+        return
+    HIT_BOX_CACHE.save(Path(path))
+    _dirty = False
+    logger.debug("Saved %d hit boxes to %s", len(HIT_BOX_CACHE), path)
+
+
+def _texture_bounds(texture: arcade.Texture) -> tuple[float, float, float, float]:
+    """Get the unscaled (left, right, bottom, top) extent of a texture's hit box."""
+    bounds = _bounds.get(texture)
+    if bounds is None:
+        xs = [x for x, _ in texture.hit_box_points]
+        ys = [y for _, y in texture.hit_box_points]
+        bounds = (min(xs), max(xs), min(ys), max(ys))
+        _bounds[texture] = bounds
+    return bounds
+
+
+def _axis_aligned_box(sprite: arcade.Sprite) -> tuple[float, float, float, float] | None:
+    """
+    Get a sprite's world-space hit box as (left, right, bottom, top).
+
+    Returns:
+        The box, or None when the sprite is rotated by something other
+        than a half turn and needs the polygon test.
+    """
+    angle = sprite.angle % 360
+    if angle != 0 and angle != 180:
+        return None
+
+    texture = sprite.texture
+    bounds = _bounds.get(texture) or _texture_bounds(texture)
+    if angle == 0:
+        left, right, bottom, top = bounds
+    else:
+        right, left, top, bottom = (-bounds[0], -bounds[1], -bounds[2], -bounds[3])
+
+    x, y = sprite.position
+    scale_x, scale_y = sprite.scale
+    return x + left * scale_x, x + right * scale_x, y + bottom * scale_y, y + top * scale_y
+
+
+def check_for_collision(sprite1: arcade.Sprite, sprite2: arcade.Sprite, mode: str) -> bool:
+    """
+    Check whether two sprites overlap.
+
+    Args:
+        sprite1: First sprite.
+        sprite2: Second sprite.
+        mode: "aabb" to compare axis-aligned hit box bounds for upright
+            sprites, or "polygon" for Arcade's exact polygon test.
+
+    Returns:
+        True if the sprites overlap.
+    """
+    if mode == "aabb":
+        box1 = _axis_aligned_box(sprite1)
+        box2 = _axis_aligned_box(sprite2)
+        if box1 is not None and box2 is not None:
+            return (
+                box1[0] < box2[1] and box2[0] < box1[1] and box1[2] < box2[3] and box2[2] < box1[3]
+            )
+    return arcade.check_for_collision(sprite1, sprite2)
+
+
+def check_for_collision_with_list(
+    sprite: arcade.Sprite, sprite_list: arcade.SpriteList[arcade.Sprite], mode: str
+) -> list[arcade.Sprite]:
+    """
+    Find all sprites in a list that overlap a sprite.
+
+    Args:
+        sprite: The sprite to test.
+        sprite_list: Sprites to test against.
+        mode: Collision mode, see ``check_for_collision``.
+
+    Returns:
+        Sprites from the list that overlap ``sprite``.
+    """
+    if mode != "aabb":
+        return arcade.check_for_collision_with_list(sprite, sprite_list)
+
+    box = _axis_aligned_box(sprite)
+    if box is None:
+        return [other for other in sprite_list if arcade.check_for_collision(sprite, other)]
+
+    left, right, bottom, top = box
+    x, y = sprite.position
+    reach_x = max(x - left, right - x)
+    reach_y = max(y - bottom, top - y)
+
+    hits = []
+    for other in sprite_list:
+        # Cheap reject on center distance. Half of width + height bounds the
+        # distance to any corner of the texture, whatever the rotation.
+        other_x, other_y = other.position
+        other_reach = (other.width + other.height) * 0.5
+        if abs(other_x - x) > reach_x + other_reach or abs(other_y - y) > reach_y + other_reach:
+            continue
+
+        other_box = _axis_aligned_box(other)
+        if other_box is None:
+            if arcade.check_for_collision(sprite, other):
+                hits.append(other)
+        elif (
+            left < other_box[1]
+            and other_box[0] < right
+            and bottom < other_box[3]
+            and other_box[2] < top
+        ):
+            hits.append(other)
+    return hits
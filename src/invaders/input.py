@@ -0,0 +1,261 @@
+"""
+Polled player input with input-to-frame latency measurement.
+
+Key events only update a key-state map; the game samples it once at the
+start of every logic step. Movement then follows whichever direction key
+was pressed last among those still held, so overlapping presses of left
+and right behave the same however the events interleave, and a fire press
+is kept until a step can use it, even if the key was released in between.
+The press ages with the logic steps sampling it rather than the wall clock,
+so a stall never changes which presses fire.
+
+Every event is timestamped when it arrives. Once a step has sampled it, the
+next drawn frame is the first one that can show its effect, and the time
+from the event to the end of that frame is recorded as its latency.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import IntFlag
+
+
+class Action(IntFlag):
+    """Player actions keys can be bound to."""
+
+    LEFT = 1
+    RIGHT = 2
+    FIRE = 4
+
+
+@dataclass(frozen=True)
+class InputSample:
+    """Input state for one logic step."""
+
+    direction: int  # -1 left, 1 right, 0 stopped
+    fire: bool  # A fire press is waiting to be used
+
+
+@dataclass(frozen=True)
+class InputLatency:
+    """Latency of one input event."""
+
+    action: Action
+    pressed: bool  # False for a key release
+    latency: float  # Seconds from the event to the end of the frame showing it
+
+
+class LatencyStats:
+    """Rolling input latency statistics."""
+
+    def __init__(self, window: int = 1000) -> None:
+        """
+        Initialize empty statistics.
+
+        Args:
+            window: Number of most recent events the percentiles cover.
+        """
+        self.count: int = 0
+        self._recent: deque[float] = deque(maxlen=window)
+
+    def add(self, latency: float) -> None:
+        """
+        Record the latency of one event.
+
+        Args:
+            latency: Seconds from the event to the frame showing it.
+        """
+        self.count += 1
+        self._recent.append(latency)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get a latency percentile over the recent events.
+
+        Args:
+            percent: Percentile between 0 and 100.
+
+        Returns:
+            The latency in seconds, 0.0 if there were no events.
+        """
+        if not self._recent:
+            return 0.0
+        ordered = sorted(self._recent)
+        index = min(int(len(ordered) * percent / 100), len(ordered) - 1)
+        return ordered[index]
+
+    def summary(self) -> str:
+        """
+        Describe the recent latencies.
+
+        Returns:
+            Median, 95th and 99th percentile and maximum in milliseconds.
+        """
+        return (
+            f"{self.count} events, p50 {self.percentile(50) * 1000:.1f} ms, "
+            f"p95 {self.percentile(95) * 1000:.1f} ms, "
+            f"p99 {self.percentile(99) * 1000:.1f} ms, "
+            f"max {max(self._recent, default=0.0) * 1000:.1f} ms"
+        )
+
+
+class InputState:
+    """
+    Key-state map updated by window events and sampled once per logic step.
+
+    Only keys in the bindings are tracked; ``press`` and ``release`` return
+    whether a key was one of them.
+    """
+
+    def __init__(self, bindings: dict[int, Action], fire_buffer_time: float = 0.15) -> None:
+        """
+        Initialize with no keys held.
+
+        Args:
+            bindings: Action of each tracked key.
+            fire_buffer_time: Seconds of logic time a fire press is kept while it
+                cannot be used.
+        """
+        self.bindings = bindings
+        self.fire_buffer_time = fire_buffer_time
+        self.latency = LatencyStats()
+
+        # Held keys in the order they were pressed, and the logic time the last
+        # unused fire press has been waiting
+        self._held: dict[int, Action] = {}
+        self._fire_age: float | None = None
+
+        # Events not yet sampled, and events sampled but not yet drawn along
+        # with the number of the step that sampled them
+        self._unsampled: list[tuple[float, Action, bool]] = []
+        self._undrawn: list[tuple[int, float, Action, bool]] = []
+        self._steps: int = 0
+
+    @property
+    def held(self) -> Action:
+        """Actions of every key currently held."""
+        actions = Action(0)
+        for action in self._held.values():
+            actions |= action
+        return actions
+
+    def press(self, key: int) -> bool:
+        """
+        Record a key press.
+
+        Args:
+            key: The key that was pressed.
+
+        Returns:
+            True if the key is bound to an action.
+        """
+        action = self.bindings.get(key)
+        if action is None:
+            return False
+        now = time.perf_counter()
+        # Re-insert so the most recent press comes last
+        self._held.pop(key, None)
+        self._held[key] = action
+        if action & Action.FIRE:
+            self._fire_age = 0.0
+        self._unsampled.append((now, action, True))
+        return True
+
+    def release(self, key: int) -> bool:
+        """
+        Record a key release.
+
+        Args:
+            key: The key that was released.
+
+        Returns:
+            True if the key is bound to an action.
+        """
+        action = self.bindings.get(key)
+        if action is None:
+            return False
+        self._held.pop(key, None)
+        self._unsampled.append((time.perf_counter(), action, False))
+        return True
+
+    def release_all(self) -> None:
+        """Forget every held key, e.g. when releases can no longer be seen."""
+        self._held.clear()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Drop the buffered fire press and every event not yet drawn.
+
+        Events arriving while no logic steps run (on the game over screen or
+        while paused) would otherwise wait to be measured until play resumes,
+        and report the whole pause as latency.
+        """
+        self._fire_age = None
+        self._unsampled.clear()
+        self._undrawn.clear()
+
+    def sample(self, delta_time: float) -> InputSample:
+        """
+        Read the input for a logic step.
+
+        Args:
+            delta_time: Length of the step in seconds; a waiting fire press ages by it.
+
+        Returns:
+            Movement direction and whether to fire in this step.
+        """
+        # The direction key pressed last wins while several are held
+        direction = 0
+        for action in reversed(self._held.values()):
+            if action & Action.LEFT:
+                direction = -1
+                break
+            if action & Action.RIGHT:
+                direction = 1
+                break
+
+        fire = False
+        if self._fire_age is not None:
+            if self._fire_age <= self.fire_buffer_time:
+                fire = True
+                self._fire_age += delta_time
+            else:
+                self._fire_age = None
+
+        self._steps += 1
+        if self._unsampled:
+            self._undrawn.extend((self._steps, *event) for event in self._unsampled)
+            self._unsampled.clear()
+        return InputSample(direction=direction, fire=fire)
+
+    def consume_fire(self) -> None:
+        """Mark the buffered fire press as used."""
+        self._fire_age = None
+
+    def frame_drawn(self, pending_steps: int = 0) -> list[InputLatency]:
+        """
+        Record the latency of every sampled event, now that a frame shows it.
+
+        Args:
+            pending_steps: Number of most recent logic steps whose input the
+                frame does not show yet. In split mode the simulation process
+                applies input a step or two after it was sampled.
+
+        Returns:
+            The latencies recorded by this frame, usually none.
+        """
+        shown_step = self._steps - pending_steps
+        shown = 0
+        while shown < len(self._undrawn) and self._undrawn[shown][0] <= shown_step:
+            shown += 1
+        if not shown:
+            return []
+
+        now = time.perf_counter()
+        latencies = []
+        for _, timestamp, action, pressed in self._undrawn[:shown]:
+            self.latency.add(now - timestamp)
+            latencies.append(InputLatency(action, pressed, now - timestamp))
+        del self._undrawn[:shown]
+        return latencies
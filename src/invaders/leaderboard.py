@@ -0,0 +1,174 @@
+"""
+Local high-score table that never blocks the game loop.
+
+Every finished game is stored in a SQLite database in WAL mode. The
+database is only ever touched by a background thread: it loads the best
+scores after startup and writes new ones as games end. The game reads the
+cached top scores from memory, and a new score shows up in them the moment
+it is submitted, before it reaches the disk.
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    wave INTEGER NOT NULL,
+    played_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_rank ON scores (score DESC, played_at);
+"""
+
+
+@dataclass(frozen=True)
+class ScoreEntry:
+    """One finished game."""
+
+    score: int
+    wave: int
+    played_at: float  # Seconds since the epoch
+
+    @property
+    def sort_key(self) -> tuple[int, float]:
+        """Key ordering entries best first; earlier games win ties."""
+        return -self.score, self.played_at
+
+
+class Leaderboard:
+    """
+    The best scores of all games played on this machine.
+
+    ``top`` is available immediately (empty until the stored scores have
+    loaded) and ``submit`` returns without waiting for the database.
+    """
+
+    def __init__(self, path: str | Path, size: int = 10) -> None:
+        """
+        Start loading the stored scores in the background.
+
+        Args:
+            path: SQLite database file, created if missing.
+            size: Number of top scores kept in memory.
+        """
+        self.path = Path(path)
+        self.size = size
+        self.loaded = threading.Event()
+
+        self._top: list[ScoreEntry] = []
+        self._lock = threading.Lock()
+        self._writes: queue.Queue[ScoreEntry | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="invaders-leaderboard", daemon=True)
+        self._thread.start()
+
+    @property
+    def top(self) -> list[ScoreEntry]:
+        """The best scores, best first."""
+        with self._lock:
+            return list(self._top)
+
+    def submit(self, score: int, wave: int) -> ScoreEntry:
+        """
+        Record a finished game.
+
+        Args:
+            score: Final score.
+            wave: Wave the game ended on.
+
+        Returns:
+            The new entry, which is in ``top`` right away if it ranks.
+        """
+        entry = ScoreEntry(score=score, wave=wave, played_at=time.time())
+        with self._lock:
+            self._top = self._best([*self._top, entry])
+        self._writes.put(entry)
+        return entry
+
+    def rank(self, entry: ScoreEntry) -> int | None:
+        """
+        Get the position of an entry in the top scores.
+
+        Args:
+            entry: An entry returned by ``submit``.
+
+        Returns:
+            1 for the best score, or None if the entry is not in ``top``.
+        """
+        with self._lock:
+            for position, ranked in enumerate(self._top, start=1):
+                if ranked is entry:
+                    return position
+        return None
+
+    def _best(self, entries: list[ScoreEntry]) -> list[ScoreEntry]:
+        """Sort entries best first and keep the top ones."""
+        return sorted(entries, key=lambda entry: entry.sort_key)[: self.size]
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """Open the database, creating it if needed."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            logger.exception("Could not create leaderboard directory %s", self.path.parent)
+            return None
+        connection = None
+        try:
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+        except sqlite3.Error:
+            logger.exception("Could not open leaderboard %s", self.path)
+            if connection is not None:
+                connection.close()
+            return None
+        return connection
+
+    def _load(self, connection: sqlite3.Connection) -> list[ScoreEntry]:
+        """Read the stored top scores."""
+        try:
+            rows = connection.execute(
+                "SELECT score, wave, played_at FROM scores ORDER BY score DESC, played_at LIMIT ?",
+                (self.size,),
+            ).fetchall()
+        except sqlite3.Error:
+            logger.exception("Could not read leaderboard %s", self.path)
+            return []
+        return [ScoreEntry(score, wave, played_at) for score, wave, played_at in rows]
+
+    def _run(self) -> None:
+        """Load the top scores, then write submitted scores until closed."""
+        connection = self._connect()
+        stored = self._load(connection) if connection is not None else []
+        with self._lock:
+            # Games may have finished while loading; they are not stored yet
+            self._top = self._best([*self._top, *stored])
+        self.loaded.set()
+
+        # Without a database, scores still rank for this session
+        while (entry := self._writes.get()) is not None:
+            if connection is None:
+                continue
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT INTO scores (score, wave, played_at) VALUES (?, ?, ?)",
+                        (entry.score, entry.wave, entry.played_at),
+                    )
+            except sqlite3.Error:
+                logger.exception("Could not save score %d", entry.score)
+        if connection is not None:
+            connection.close()
+
+    def close(self) -> None:
+        """Finish writing submitted scores and stop the background thread."""
+        self._writes.put(None)
+        self._thread.join()
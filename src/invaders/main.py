@@ -1,16 +1,29 @@
 """Main entry point for the Invaders game."""
 
-import arcade
+import argparse
 
-from invaders.game import InvadersGame
+from invaders import __version__
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     """
     Main entry point for the Invaders game.
 
-    Creates the game window, sets up the game, and starts the game loop.
+    Parses the command line, creates the game window, sets up the game, and
+    starts the game loop. Arcade and the game are only imported once a window
+    is needed, so ``--version`` and ``--help`` return without loading them.
+
+    Args:
+        argv: Command line arguments, defaults to ``sys.argv[1:]``.
     """
+    parser = argparse.ArgumentParser(description="Play Invaders.")
+    parser.add_argument("--version", action="version", version=f"invaders {__version__}")
+    parser.parse_args(argv)
+
+    import arcade
+
+    from invaders.game import InvadersGame
+
     game = InvadersGame()
     game.setup()
     arcade.run()
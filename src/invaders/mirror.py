@@ -0,0 +1,145 @@
+"""Display-only sprites that mirror game entities published elsewhere."""
+
+from collections.abc import Iterable, Iterator
+
+import arcade
+
+from invaders.alien import ALIEN_SPRITES
+from invaders.bullet import ALIEN_BULLET_SPRITE, PLAYER_BULLET_SPRITE
+from invaders.hitbox import load_texture
+from invaders.player import DEFAULT_PLAYER_SPRITE
+from invaders.shared_state import Entity, EntityKind
+
+
+class EntityMirror:
+    """
+    Sprites that follow a stream of entity snapshots.
+
+    Used wherever the game is shown without running its rules, such as the
+    renderer in split mode and spectator viewers. Sprites are keyed by entity
+    id so they keep their identity (and interpolation) from one snapshot to
+    the next, and are pooled per kind when entities disappear.
+    """
+
+    def __init__(self, explosion_textures: list[arcade.Texture]) -> None:
+        """
+        Initialize an empty mirror.
+
+        Args:
+            explosion_textures: Frames used to draw explosions.
+        """
+        self.explosion_textures = explosion_textures
+        self._alien_textures = [load_texture(path) for path in ALIEN_SPRITES]
+
+        # Display sprites, one list per entity kind
+        self.player = arcade.Sprite(load_texture(DEFAULT_PLAYER_SPRITE), scale=0.5)
+        self.player_list: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList()
+        self.aliens: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList()
+        self.alien_bullets: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList()
+        self.player_bullets: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList()
+        self.explosions_list: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList()
+        self._lists = {
+            EntityKind.PLAYER: self.player_list,
+            EntityKind.ALIEN: self.aliens,
+            EntityKind.PLAYER_BULLET: self.player_bullets,
+            EntityKind.ALIEN_BULLET: self.alien_bullets,
+            EntityKind.EXPLOSION: self.explosions_list,
+        }
+
+        # Live sprites by entity id, with the kind and subtype they show
+        self._sprites: dict[int, tuple[EntityKind, arcade.Sprite, int]] = {}
+        self._pool: dict[EntityKind, list[arcade.Sprite]] = {kind: [] for kind in EntityKind}
+
+    @property
+    def sprite_lists(self) -> list[arcade.SpriteList[arcade.Sprite]]:
+        """Sprite lists of game objects in drawing order."""
+        return [
+            self.player_list,
+            self.aliens,
+            self.alien_bullets,
+            self.player_bullets,
+            self.explosions_list,
+        ]
+
+    def entities(self) -> Iterator[Entity]:
+        """
+        Iterate over the entities currently shown.
+
+        Yields:
+            (id, kind, x, y, subtype) for every mirrored entity.
+        """
+        for entity_id, (kind, sprite, subtype) in self._sprites.items():
+            yield entity_id, kind, sprite.center_x, sprite.center_y, subtype
+
+    def sync(self, entities: Iterable[Entity], alien_scale: float) -> list[Entity]:
+        """
+        Move sprites to a new snapshot, adding and removing them as needed.
+
+        Args:
+            entities: Every entity in the snapshot.
+            alien_scale: Scale of the current wave's aliens.
+
+        Returns:
+            The entities that were not in the previous snapshot.
+        """
+        # Sprites that left the game go back to the pool only after every new
+        # entity has been given one, so no sprite changes identity within a step
+        released: list[tuple[EntityKind, arcade.Sprite, int]] = []
+        live: dict[int, tuple[EntityKind, arcade.Sprite, int]] = {}
+        added: list[Entity] = []
+        for entity_id, kind, x, y, subtype in entities:
+            entry = self._sprites.pop(entity_id, None)
+            if entry is None or entry[0] is not kind:
+                if entry is not None:
+                    released.append(entry)
+                sprite = self._acquire(kind)
+                added.append((entity_id, kind, x, y, subtype))
+            else:
+                sprite = entry[1]
+            live[entity_id] = (kind, sprite, subtype)
+
+            sprite.position = (x, y)
+            if kind is EntityKind.ALIEN:
+                texture = self._alien_textures[subtype % len(self._alien_textures)]
+                if sprite.texture is not texture:
+                    sprite.texture = texture
+                if sprite.scale_x != alien_scale:
+                    sprite.scale = alien_scale
+            elif kind is EntityKind.EXPLOSION:
+                sprite.texture = self.explosion_textures[
+                    min(subtype, len(self.explosion_textures) - 1)
+                ]
+
+        released.extend(self._sprites.values())
+        self._sprites = live
+        for kind, sprite, _ in released:
+            self._release(kind, sprite)
+        return added
+
+    def clear(self) -> None:
+        """Remove every sprite."""
+        self.sync((), 0.0)
+
+    def _acquire(self, kind: EntityKind) -> arcade.Sprite:
+        """Take a display sprite for an entity kind from the pool, or create one."""
+        pool = self._pool[kind]
+        if kind is EntityKind.PLAYER:
+            sprite = self.player
+        elif pool:
+            sprite = pool.pop()
+        elif kind is EntityKind.ALIEN:
+            sprite = arcade.Sprite(self._alien_textures[0])
+        elif kind is EntityKind.PLAYER_BULLET:
+            sprite = arcade.Sprite(load_texture(PLAYER_BULLET_SPRITE), scale=0.5)
+        elif kind is EntityKind.ALIEN_BULLET:
+            sprite = arcade.Sprite(load_texture(ALIEN_BULLET_SPRITE), scale=0.5, angle=180)
+        else:
+            sprite = arcade.Sprite(self.explosion_textures[0], scale=0.5)
+        self._lists[kind].append(sprite)
+        return sprite
+
+    def _release(self, kind: EntityKind, sprite: arcade.Sprite) -> None:
+        """Remove a display sprite from view and keep it for reuse."""
+        sprite.remove_from_sprite_lists()
+        if kind is not EntityKind.PLAYER:
+            self._pool[kind].append(sprite)
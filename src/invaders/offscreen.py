@@ -0,0 +1,84 @@
+"""Offscreen render target for drawing the game at a reduced internal resolution."""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+
+import arcade
+from arcade.gl import geometry
+from arcade.types import LBWH, Rect
+
+
+class OffscreenBuffer:
+    """
+    A color framebuffer the scene can be drawn into and then scaled onto the window.
+
+    The buffer is recreated only when its requested size changes.
+    """
+
+    def __init__(self, ctx: arcade.ArcadeContext, width: int, height: int) -> None:
+        """
+        Initialize the offscreen buffer.
+
+        Args:
+            ctx: The window's OpenGL context.
+            width: Buffer width in pixels.
+            height: Buffer height in pixels.
+        """
+        self.ctx = ctx
+        self._quad = geometry.quad_2d_fs()
+        self._fbo = self._create_framebuffer(width, height)
+
+    def _create_framebuffer(self, width: int, height: int) -> arcade.gl.Framebuffer:
+        """Create a framebuffer with a single RGBA color attachment."""
+        texture = self.ctx.texture((max(width, 1), max(height, 1)), components=4)
+        return self.ctx.framebuffer(color_attachments=[texture])
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Buffer size in pixels."""
+        return self._fbo.size
+
+    @property
+    def rect(self) -> Rect:
+        """Viewport covering the whole buffer."""
+        width, height = self._fbo.size
+        return LBWH(0, 0, width, height)
+
+    @property
+    def framebuffer(self) -> arcade.gl.Framebuffer:
+        """The underlying framebuffer."""
+        return self._fbo
+
+    def resize(self, width: int, height: int) -> None:
+        """
+        Make sure the buffer has the given size.
+
+        Args:
+            width: Buffer width in pixels.
+            height: Buffer height in pixels.
+        """
+        if self._fbo.size != (max(width, 1), max(height, 1)):
+            self._fbo = self._create_framebuffer(width, height)
+
+    @contextmanager
+    def activate(self) -> Generator[None]:
+        """Clear the buffer and direct drawing into it for the duration of the block."""
+        with self._fbo.activate():
+            self._fbo.clear()
+            yield
+
+    def draw(self, viewport: Rect) -> None:
+        """
+        Draw the buffer contents stretched over a viewport of the active framebuffer.
+
+        Args:
+            viewport: Destination area in window pixels.
+        """
+        self.ctx.viewport = (
+            int(viewport.left),
+            int(viewport.bottom),
+            int(viewport.width),
+            int(viewport.height),
+        )
+        self._fbo.color_attachments[0].use(0)
+        self._quad.render(self.ctx.utility_textured_quad_program)
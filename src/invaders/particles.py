@@ -0,0 +1,340 @@
+"""
+Particle effects for debris, sparks and bullet trails.
+
+Every particle's position, velocity, remaining life, gravity, size and color
+live in preallocated NumPy arrays, with the live particles packed at the
+front. Spawning, integration, fading and culling each work on whole arrays
+at once, and all live particles are drawn as points in a single draw call,
+so the cost of an effect grows with array sizes rather than with Python
+objects or sprites. ``ParticlePool`` holds the arrays and needs no GPU;
+``ParticleSystem`` adds the buffer and program that draw them.
+
+Needs the optional ``numpy`` dependency (``pip install invaders[particles]``).
+"""
+
+import math
+import random
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import arcade
+import numpy as np
+import numpy.typing as npt
+from arcade.gl import BufferDescription
+from pyglet import gl
+
+from invaders.simulation import Effect
+
+_VERTEX_SHADER = """
+#version 330
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+uniform float u_scale;
+
+in vec2 in_pos;
+in vec4 in_color;
+in float in_size;
+
+out vec4 v_color;
+
+void main() {
+    gl_Position = window.projection * window.view * vec4(in_pos, 0.0, 1.0);
+    gl_PointSize = in_size * u_scale;
+    v_color = in_color;
+}
+"""
+
+_FRAGMENT_SHADER = """
+#version 330
+
+in vec4 v_color;
+
+out vec4 f_color;
+
+void main() {
+    // Round points with a soft edge
+    float edge = 1.0 - smoothstep(0.3, 0.5, length(gl_PointCoord - vec2(0.5)));
+    f_color = vec4(v_color.rgb, v_color.a * edge);
+}
+"""
+
+# One particle in the vertex buffer
+_VERTEX = np.dtype([("pos", np.float32, 2), ("color", np.uint8, 4), ("size", np.float32)])
+
+# Particles below this height have fallen off the screen
+_CULL_Y = -16.0
+
+
+@dataclass(frozen=True)
+class EffectStyle:
+    """How the particles of one kind of effect start out and move."""
+
+    count: float  # Particles per source at full intensity
+    speed: tuple[float, float]  # Initial speed range in pixels per second
+    life: tuple[float, float]  # Lifetime range in seconds
+    size: tuple[float, float]  # Point size range in pixels
+    gravity: float  # Vertical acceleration, negative pulls down
+    colors: tuple[tuple[int, int, int], ...]  # Picked at random per particle
+    angle: float = math.pi / 2  # Middle of the initial direction range
+    spread: float = 2 * math.pi  # Width of the initial direction range
+
+
+# Burst left by a destroyed alien
+DEBRIS = EffectStyle(
+    count=40,
+    speed=(60.0, 240.0),
+    life=(0.4, 1.0),
+    size=(2.0, 4.0),
+    gravity=-400.0,
+    colors=((255, 210, 90), (255, 130, 40), (210, 210, 210), (140, 140, 140)),
+)
+
+# Shower of sparks when the player is hit
+SPARKS = EffectStyle(
+    count=60,
+    speed=(120.0, 360.0),
+    life=(0.2, 0.5),
+    size=(2.0, 3.0),
+    gravity=0.0,
+    colors=((255, 255, 190), (255, 220, 90), (255, 140, 40)),
+)
+
+# Exhaust behind player bullets, drifting down
+PLAYER_TRAIL = EffectStyle(
+    count=1,
+    speed=(10.0, 40.0),
+    life=(0.15, 0.3),
+    size=(2.0, 3.0),
+    gravity=0.0,
+    colors=((120, 200, 255), (200, 240, 255)),
+    angle=-math.pi / 2,
+    spread=math.pi / 3,
+)
+
+# Exhaust behind alien bullets, drifting up
+ALIEN_TRAIL = EffectStyle(
+    count=1,
+    speed=(10.0, 40.0),
+    life=(0.15, 0.3),
+    size=(2.0, 3.0),
+    gravity=0.0,
+    colors=((255, 120, 120), (255, 200, 120)),
+    angle=math.pi / 2,
+    spread=math.pi / 3,
+)
+
+# Style of each effect the simulation asks for
+EFFECT_STYLES: dict[Effect, EffectStyle] = {Effect.DEBRIS: DEBRIS, Effect.SPARKS: SPARKS}
+
+
+class ParticlePool:
+    """
+    A fixed-capacity pool of particles, simulated on the CPU.
+
+    Call ``emit`` to spawn effects and ``update`` once per logic step;
+    ``vertices`` packs the live particles for drawing.
+    """
+
+    def __init__(self, capacity: int = 20_000, intensity: float = 1.0) -> None:
+        """
+        Allocate the particle arrays.
+
+        Args:
+            capacity: Most particles alive at once; new ones are dropped beyond it.
+            intensity: Multiplier on the particles spawned per effect.
+        """
+        self.capacity = capacity
+        self.intensity = intensity
+        self.count: int = 0
+
+        # Seeded from the game's generator so seeded runs look the same
+        self._rng = np.random.default_rng(random.getrandbits(64))
+
+        # Particle state; live particles are packed into [0, count)
+        self._pos = np.zeros((capacity, 2), np.float32)
+        self._vel = np.zeros((capacity, 2), np.float32)
+        self._life = np.zeros(capacity, np.float32)
+        self._max_life = np.ones(capacity, np.float32)
+        self._gravity = np.zeros(capacity, np.float32)
+        self._size = np.zeros(capacity, np.float32)
+        self._color = np.zeros((capacity, 3), np.uint8)
+        self._arrays: tuple[npt.NDArray[np.generic], ...] = (
+            self._pos,
+            self._vel,
+            self._life,
+            self._max_life,
+            self._gravity,
+            self._size,
+            self._color,
+        )
+
+        # Vertex data staged for drawing
+        self._vertices = np.zeros(capacity, _VERTEX)
+
+    def emit(self, style: EffectStyle, sources: npt.ArrayLike) -> int:
+        """
+        Spawn an effect at one or more points.
+
+        Args:
+            style: The kind of effect.
+            sources: One (x, y) point or a sequence of them.
+
+        Returns:
+            Number of particles spawned.
+        """
+        origins = np.asarray(sources, np.float32).reshape(-1, 2)
+        if not len(origins):
+            return 0
+
+        # Round the scaled count randomly so fractional intensities average out
+        rng = self._rng
+        wanted = len(origins) * style.count * self.intensity
+        count = min(int(wanted + rng.random()), self.capacity - self.count)
+        if count <= 0:
+            return 0
+
+        new = slice(self.count, self.count + count)
+        self._pos[new] = origins[np.arange(count) % len(origins)]
+        angle = rng.uniform(style.angle - style.spread / 2, style.angle + style.spread / 2, count)
+        speed = rng.uniform(*style.speed, count)
+        self._vel[new, 0] = np.cos(angle) * speed
+        self._vel[new, 1] = np.sin(angle) * speed
+        life = rng.uniform(*style.life, count)
+        self._life[new] = life
+        self._max_life[new] = life
+        self._gravity[new] = style.gravity
+        self._size[new] = rng.uniform(*style.size, count)
+        palette = np.array(style.colors, np.uint8)
+        self._color[new] = palette[rng.integers(len(palette), size=count)]
+
+        self.count += count
+        return count
+
+    def add_effects(self, effects: Iterable[tuple[Effect, float, float]]) -> None:
+        """
+        Spawn the effects queued by the simulation, one batch per kind.
+
+        Args:
+            effects: Kind and position of each effect.
+        """
+        sources: dict[Effect, list[tuple[float, float]]] = {}
+        for effect, x, y in effects:
+            sources.setdefault(effect, []).append((x, y))
+        for effect, points in sources.items():
+            self.emit(EFFECT_STYLES[effect], points)
+
+    def add_trails(
+        self,
+        player_bullets: arcade.SpriteList[arcade.Sprite],
+        alien_bullets: arcade.SpriteList[arcade.Sprite],
+    ) -> None:
+        """
+        Spawn trail particles behind every bullet.
+
+        Args:
+            player_bullets: Bullets fired by the player.
+            alien_bullets: Bullets fired by aliens.
+        """
+        if player_bullets:
+            self.emit(PLAYER_TRAIL, [bullet.position for bullet in player_bullets])
+        if alien_bullets:
+            self.emit(ALIEN_TRAIL, [bullet.position for bullet in alien_bullets])
+
+    def update(self, delta_time: float) -> None:
+        """
+        Move and age every particle, removing the ones that are gone.
+
+        Args:
+            delta_time: Time step in seconds.
+        """
+        live = self.count
+        if not live:
+            return
+
+        vel = self._vel[:live]
+        pos = self._pos[:live]
+        life = self._life[:live]
+        vel[:, 1] += self._gravity[:live] * delta_time
+        pos += vel * delta_time
+        life -= delta_time
+
+        # Compact the survivors to the front of every array
+        alive = (life > 0.0) & (pos[:, 1] > _CULL_Y)
+        survivors = int(np.count_nonzero(alive))
+        if survivors < live:
+            for array in self._arrays:
+                array[:survivors] = array[:live][alive]
+            self.count = survivors
+
+    def clear(self) -> None:
+        """Remove every particle."""
+        self.count = 0
+
+    def vertices(self) -> npt.NDArray[np.void]:
+        """
+        Pack the live particles into vertex data, fading out over their life.
+
+        Returns:
+            One vertex per live particle, valid until the next call.
+        """
+        live = self.count
+        vertices = self._vertices[:live]
+        vertices["pos"] = self._pos[:live]
+        vertices["size"] = self._size[:live]
+        color = vertices["color"]
+        color[:, :3] = self._color[:live]
+        color[:, 3] = self._life[:live] / self._max_life[:live] * 255.0
+        return vertices
+
+
+class ParticleSystem(ParticlePool):
+    """
+    A particle pool drawn in one call.
+
+    Call ``draw`` inside the game camera.
+    """
+
+    def __init__(
+        self, ctx: arcade.ArcadeContext, capacity: int = 20_000, intensity: float = 1.0
+    ) -> None:
+        """
+        Allocate the particle arrays and GPU resources.
+
+        Args:
+            ctx: The window's OpenGL context.
+            capacity: Most particles alive at once; new ones are dropped beyond it.
+            intensity: Multiplier on the particles spawned per effect.
+        """
+        super().__init__(capacity, intensity)
+        self.ctx = ctx
+        self._buffer = ctx.buffer(reserve=capacity * _VERTEX.itemsize)
+        self._geometry = ctx.geometry(
+            [BufferDescription(self._buffer, "2f 4f1 1f", ["in_pos", "in_color", "in_size"])],
+            mode=ctx.POINTS,
+        )
+        self._program = ctx.program(vertex_shader=_VERTEX_SHADER, fragment_shader=_FRAGMENT_SHADER)
+
+    def draw(self, scale: float = 1.0) -> None:
+        """
+        Draw every live particle in one call.
+
+        Args:
+            scale: Window pixels per game pixel, so points keep their size when scaled.
+        """
+        live = self.count
+        if not live:
+            return
+        self._buffer.write(self.vertices())
+
+        self._program["u_scale"] = scale
+        blend_func = self.ctx.blend_func
+        self.ctx.blend_func = self.ctx.BLEND_ADDITIVE
+        try:
+            with self.ctx.enabled(self.ctx.BLEND, gl.GL_PROGRAM_POINT_SIZE):
+                self._geometry.render(self._program, vertices=live)
+        finally:
+            self.ctx.blend_func = blend_func
@@ -2,6 +2,7 @@
 
 import arcade
 
+from invaders.hitbox import load_texture
 from invaders.settings import SETTINGS
 
 # Default sprite path for the player ship
@@ -23,7 +24,7 @@ class Player(arcade.Sprite):
             image_path: Optional path to player sprite image. Uses default Arcade sprite if None.
         """
         sprite_path = image_path or DEFAULT_PLAYER_SPRITE
-        super().__init__(sprite_path, scale=0.5)
+        super().__init__(load_texture(sprite_path), scale=0.5)
 
         self.lives: int = SETTINGS.player_lives
         self.change_x: float = 0.0
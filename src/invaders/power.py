@@ -0,0 +1,103 @@
+"""Power saving for static screens and unfocused or minimized windows."""
+
+from enum import Enum
+
+
+class PowerMode(Enum):
+    """How much work the game loop should be doing."""
+
+    ACTIVE = "active"  # Gameplay running at full rate
+    IDLE = "idle"  # Static screen, redraw only on input or change
+    BACKGROUND = "background"  # Unfocused or minimized, game paused
+
+
+class PowerManager:
+    """
+    Tracks window focus, visibility and static screens to pick a power mode.
+
+    The game reports what it knows through ``focused``, ``visible`` and
+    ``static`` and asks ``should_draw`` before each redraw. Outside of active
+    play, frames are only drawn after ``invalidate`` has been called.
+    """
+
+    def __init__(
+        self,
+        active_interval: float,
+        idle_interval: float,
+        background_interval: float,
+        pause_when_unfocused: bool = True,
+    ) -> None:
+        """
+        Initialize the power manager in active mode.
+
+        Args:
+            active_interval: Update and draw interval during gameplay, in seconds.
+            idle_interval: Update interval on static screens, in seconds.
+            background_interval: Update interval while paused in the background.
+            pause_when_unfocused: Pause when the window loses keyboard focus,
+                not only when it is minimized.
+        """
+        self.intervals: dict[PowerMode, float] = {
+            PowerMode.ACTIVE: active_interval,
+            PowerMode.IDLE: idle_interval,
+            PowerMode.BACKGROUND: background_interval,
+        }
+        self.pause_when_unfocused: bool = pause_when_unfocused
+
+        self.focused: bool = True
+        self.visible: bool = True
+        self.static: bool = False
+
+        self._mode: PowerMode = PowerMode.ACTIVE
+        self._needs_redraw: bool = True
+
+    @property
+    def mode(self) -> PowerMode:
+        """The power mode in effect since the last ``refresh``."""
+        return self._mode
+
+    @property
+    def interval(self) -> float:
+        """Update and draw interval for the current mode, in seconds."""
+        return self.intervals[self._mode]
+
+    def refresh(self) -> bool:
+        """
+        Re-evaluate the power mode from the current window and game state.
+
+        Returns:
+            True if the mode changed.
+        """
+        if not self.visible or (self.pause_when_unfocused and not self.focused):
+            mode = PowerMode.BACKGROUND
+        elif self.static:
+            mode = PowerMode.IDLE
+        else:
+            mode = PowerMode.ACTIVE
+
+        if mode is self._mode:
+            return False
+
+        self._mode = mode
+        self.invalidate()
+        return True
+
+    def invalidate(self) -> None:
+        """Request a redraw on the next frame."""
+        self._needs_redraw = True
+
+    def should_draw(self) -> bool:
+        """
+        Check whether the next frame should be drawn, consuming any redraw request.
+
+        Returns:
+            True if the window should be redrawn.
+        """
+        if self._mode is PowerMode.ACTIVE:
+            return True
+        if not self.visible:
+            return False
+
+        needs_redraw = self._needs_redraw
+        self._needs_redraw = False
+        return needs_redraw
@@ -0,0 +1,211 @@
+"""Adaptive visual quality driven by measured frame time."""
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    """A set of optional visual work to keep at a given quality stage."""
+
+    name: str
+    star_layers: int  # Parallax layers kept, nearest first
+    explosion_frame_stride: int  # Play every Nth explosion frame
+    particle_intensity: float  # Fraction of effect particles spawned
+    sound_interval: float  # Minimum seconds between plays of the same sound
+    render_scale: float  # Internal resolution relative to the game size
+
+
+# Ordered from full quality to the most aggressive shedding
+QUALITY_LEVELS: tuple[QualityLevel, ...] = (
+    QualityLevel(
+        "full",
+        star_layers=3,
+        explosion_frame_stride=1,
+        particle_intensity=1.0,
+        sound_interval=0.0,
+        render_scale=1.0,
+    ),
+    QualityLevel(
+        "fewer-stars",
+        star_layers=2,
+        explosion_frame_stride=1,
+        particle_intensity=1.0,
+        sound_interval=0.0,
+        render_scale=1.0,
+    ),
+    QualityLevel(
+        "short-explosions",
+        star_layers=2,
+        explosion_frame_stride=2,
+        particle_intensity=0.5,
+        sound_interval=0.0,
+        render_scale=1.0,
+    ),
+    QualityLevel(
+        "coalesced-sounds",
+        star_layers=1,
+        explosion_frame_stride=2,
+        particle_intensity=0.5,
+        sound_interval=0.1,
+        render_scale=1.0,
+    ),
+    QualityLevel(
+        "low-resolution",
+        star_layers=1,
+        explosion_frame_stride=3,
+        particle_intensity=0.25,
+        sound_interval=0.1,
+        render_scale=0.5,
+    ),
+)
+
+
+@dataclass(frozen=True)
+class QualityDecision:
+    """A record of one quality level change."""
+
+    time: float  # Governor clock reading when the change was made
+    old_level: int
+    new_level: int
+    average_frame_time: float
+    reason: str
+
+
+class QualityGovernor:
+    """
+    Sheds or restores optional visual work based on a rolling frame-time window.
+
+    When the average frame time exceeds the budget, the governor steps down one
+    quality level. When there is comfortable headroom again it steps back up.
+    A cooldown between changes keeps it from oscillating.
+    """
+
+    def __init__(
+        self,
+        budget: float,
+        window: int = 60,
+        cooldown: float = 2.0,
+        headroom: float = 0.7,
+        levels: tuple[QualityLevel, ...] = QUALITY_LEVELS,
+        history: int = 100,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Initialize the governor at full quality.
+
+        Args:
+            budget: Target work time per frame in seconds.
+            window: Number of recent frames averaged for decisions.
+            cooldown: Minimum seconds between two level changes.
+            headroom: Fraction of the budget the average must drop below
+                before quality is restored.
+            levels: Quality stages ordered from best to cheapest.
+            history: Number of past decisions kept in ``decisions``.
+            clock: Wall clock used for the cooldown, in seconds.
+        """
+        self.budget: float = budget
+        self.cooldown: float = cooldown
+        self.headroom: float = headroom
+        self.levels: tuple[QualityLevel, ...] = levels
+        self.enabled: bool = True
+        self.decisions: deque[QualityDecision] = deque(maxlen=history)
+
+        # Called with the new level whenever it changes
+        self.on_change: Callable[[QualityLevel], None] | None = None
+
+        self._window: int = window
+        self._frame_times: deque[float] = deque(maxlen=window)
+        self._level_index: int = 0
+        self._clock: Callable[[], float] = clock
+        self._last_change: float = clock()
+
+    @property
+    def level(self) -> QualityLevel:
+        """The quality level currently in effect."""
+        return self.levels[self._level_index]
+
+    @property
+    def level_index(self) -> int:
+        """Index of the current level in ``levels``, 0 being full quality."""
+        return self._level_index
+
+    @property
+    def average_frame_time(self) -> float:
+        """Mean frame time over the rolling window, or 0 if empty."""
+        if not self._frame_times:
+            return 0.0
+        return sum(self._frame_times) / len(self._frame_times)
+
+    def record(self, frame_time: float) -> QualityLevel | None:
+        """
+        Add a frame time measurement and adjust quality if needed.
+
+        Args:
+            frame_time: Work time of the last frame in seconds.
+
+        Returns:
+            The new quality level if it changed, None otherwise.
+        """
+        self._frame_times.append(frame_time)
+
+        if not self.enabled or len(self._frame_times) < self._window:
+            return None
+        if self._clock() - self._last_change < self.cooldown:
+            return None
+
+        average = self.average_frame_time
+        if average > self.budget and self._level_index < len(self.levels) - 1:
+            return self._change(self._level_index + 1, average, "over budget")
+        if average < self.budget * self.headroom and self._level_index > 0:
+            return self._change(self._level_index - 1, average, "headroom")
+        return None
+
+    def set_level(self, index: int, reason: str = "manual") -> QualityLevel:
+        """
+        Force a quality level, e.g. from a settings menu or test.
+
+        Args:
+            index: Index into ``levels``.
+            reason: Why the level was set, recorded in ``decisions``.
+
+        Returns:
+            The quality level now in effect.
+        """
+        if not 0 <= index < len(self.levels):
+            raise ValueError(f"quality level {index} out of range 0..{len(self.levels) - 1}")
+        if index != self._level_index:
+            self._change(index, self.average_frame_time, reason)
+        return self.level
+
+    def _change(self, index: int, average: float, reason: str) -> QualityLevel:
+        """Switch to another level, log it and restart the measurement window."""
+        now = self._clock()
+        decision = QualityDecision(
+            time=now,
+            old_level=self._level_index,
+            new_level=index,
+            average_frame_time=average,
+            reason=reason,
+        )
+        self.decisions.append(decision)
+        logger.info(
+            "Quality %s -> %s (%s, avg frame %.1f ms, budget %.1f ms)",
+            self.level.name,
+            self.levels[index].name,
+            reason,
+            average * 1000,
+            self.budget * 1000,
+        )
+
+        self._level_index = index
+        self._last_change = now
+        self._frame_times.clear()
+        if self.on_change is not None:
+            self.on_change(self.level)
+        return self.level
@@ -2,6 +2,12 @@
 
 from dataclasses import dataclass
 
+# Frame file formats for recording
+CAPTURE_FORMATS = ("png", "yuv")
+
+# What to do with a recorded frame when the writer has no free buffer
+CAPTURE_POLICIES = ("drop", "wait")
+
 
 @dataclass(frozen=True)
 class GameSettings:
@@ -16,6 +22,9 @@ class GameSettings:
     player_speed: float = 300.0
     player_lives: int = 3
 
+    # Input settings
+    fire_buffer_time: float = 0.15  # Game seconds a fire press is kept until the player can shoot
+
     # Bullet settings
     bullet_speed: float = 500.0
     bullet_scale: float = 0.5
@@ -27,10 +36,66 @@ class GameSettings:
     alien_columns: int = 10
     alien_spacing: float = 60.0
 
+    # Wave settings
+    endless_waves: bool = True  # Start a new, bigger wave instead of winning
+    max_alien_rows: int = 20
+    max_alien_columns: int = 50
+    max_wave_difficulty: float = 3.0  # Cap on the speed and fire rate multiplier
+    aliens_spawned_per_frame: int = 40  # Spread big waves over several frames
+
+    # Collision settings
+    collision_mode: str = "aabb"  # "aabb" for upright sprites, or "polygon"
+    hit_box_cache_path: str | None = None  # Persist computed hit boxes here if set
+
     # Game settings
     alien_shoot_interval: float = 2.0
     alien_bullet_speed: float = 300.0
 
+    # Timing settings
+    logic_rate: float = 60.0  # Fixed simulation steps per second
+    render_rate: float = 60.0  # Draw calls per second, 0 for uncapped
+    vsync: bool = False
+    max_logic_steps: int = 5  # Catch-up limit per rendered frame
+
+    # Adaptive quality settings
+    adaptive_quality: bool = True
+    frame_budget: float = 1 / 60  # Work time per frame before visuals are shed
+
+    # Power saving settings
+    idle_rate: float = 10.0  # Update rate on game over and victory screens
+    background_rate: float = 4.0  # Update rate while unfocused or minimized
+    pause_when_unfocused: bool = True
+
+    # Particle settings
+    particles: bool = True  # Debris, sparks and bullet trails, if numpy is installed
+    max_particles: int = 20_000  # Particles alive at once
+    particle_intensity: float = 1.0  # Multiplier on particles spawned per effect
+
+    # Process settings
+    split_processes: bool = False  # Run the simulation in its own process
+    max_shared_entities: int = 4096  # Entities per frame in the shared state buffer
+
+    # Spectator settings
+    spectator_port: int | None = None  # Stream the game to viewers on this port if set
+    spectator_host: str = "127.0.0.1"
+    spectator_queue_size: int = 120  # Messages buffered per viewer before it is resynced
+
+    # Capture settings
+    capture_path: str | None = None  # Record frames here if set (directory, or file for YUV)
+    capture_format: str = "png"  # "png" sequence or raw "yuv" (I420)
+    capture_ring_size: int = 4  # Frames in flight between the GPU and the writer
+    capture_policy: str = "drop"  # "drop" frames or "wait" when the writer falls behind
+
+    # Telemetry settings
+    telemetry_path: str | None = None  # Write gameplay event logs to this directory if set
+    telemetry_flush_interval: float = 1.0  # Seconds between batches written to disk
+    telemetry_file_bytes: int = 4 * 1024 * 1024  # Uncompressed bytes per log file
+    telemetry_max_files: int = 50  # Log files kept, oldest deleted first
+
+    # Leaderboard settings
+    leaderboard_path: str | None = None  # Keep high scores in this SQLite file if set
+    leaderboard_size: int = 10  # Top scores kept in memory and shown after a game
+
 
 # Default game settings instance
 SETTINGS = GameSettings()
@@ -0,0 +1,396 @@
+"""
+Game state and input shared between processes through shared memory.
+
+In split mode the simulation runs in its own process and publishes every
+logic step into a double buffer: two slots, each guarded by a sequence
+counter (a seqlock). The writer fills the slot the reader is not looking at
+and then flips the ``latest`` index; the reader maps the slot's entity
+arrays directly with ``memoryview.cast`` and retries if the counter changed
+while it was reading. Nothing here imports Arcade.
+"""
+
+import itertools
+import struct
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+from multiprocessing import shared_memory
+
+from invaders.settings import SETTINGS
+
+# Global header: index of the most recently published slot
+_LATEST = struct.Struct("<Q")
+
+# Slot header: sequence, frame, score, lives, wave, flags, restarts, input
+# sequence, last fire request handled and fired, alien scale, entity count and
+# one counter per sound effect
+SOUND_COUNT = 5
+_SLOT_HEADER = struct.Struct(f"<QQiiiIIIIIfI{SOUND_COUNT}I")
+
+_FLAG_GAME_OVER = 1
+_FLAG_GAME_WON = 2
+
+# Input block: sequence, steering direction, fire and restart counters, paused, quit
+_INPUT = struct.Struct("<IiII??")
+
+
+def _align(offset: int, size: int = 8) -> int:
+    """Round an offset up to a multiple of ``size``."""
+    return (offset + size - 1) // size * size
+
+
+def _attach(name: str | None, size: int) -> shared_memory.SharedMemory:
+    """Create a new (zero-filled) shared memory block, or attach to one by name."""
+    if name is not None:
+        return shared_memory.SharedMemory(name=name)
+    return shared_memory.SharedMemory(create=True, size=size)
+
+
+def _buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    """Get the buffer of an open shared memory block."""
+    if shm.buf is None:
+        raise ValueError(f"Shared memory block {shm.name} is closed")
+    return shm.buf
+
+
+class EntityKind(IntEnum):
+    """Kinds of entities stored in the shared state."""
+
+    PLAYER = 0
+    ALIEN = 1
+    PLAYER_BULLET = 2
+    ALIEN_BULLET = 3
+    EXPLOSION = 4
+
+
+# One game entity: (id, kind, x, y, subtype). The subtype is the alien type or
+# explosion frame, 0 for other kinds.
+Entity = tuple[int, EntityKind, float, float, int]
+
+# Entity ids handed out so far; 0 is kept for the player
+_entity_ids = itertools.count(1)
+
+
+def next_entity_id() -> int:
+    """
+    Get an id for a new entity, never reused within the process.
+
+    Object ids are no substitute: CPython reuses the address of a freed
+    object straight away, so a new entity could take over an id from the
+    previous step and be mistaken for the old one moving.
+
+    Returns:
+        A positive id not returned before.
+    """
+    return next(_entity_ids)
+
+
+@dataclass
+class SlotLayout:
+    """Byte offsets of the arrays in one slot of the shared state."""
+
+    capacity: int
+
+    def __post_init__(self) -> None:
+        """Compute offsets for a slot holding ``capacity`` entities."""
+        self.ids = _align(_SLOT_HEADER.size)
+        self.xs = self.ids + 8 * self.capacity
+        self.ys = self.xs + 4 * self.capacity
+        self.kinds = self.ys + 4 * self.capacity
+        self.subtypes = self.kinds + self.capacity
+        self.size = _align(self.subtypes + self.capacity)
+
+
+class StateFrame:
+    """
+    Zero-copy view of one published slot.
+
+    The entity arrays are memoryviews over shared memory, so they are only
+    valid until ``SharedState.read`` reports whether the read was consistent.
+    """
+
+    def __init__(self, buf: memoryview, offset: int, layout: SlotLayout) -> None:
+        """
+        Map a slot of the shared buffer.
+
+        Args:
+            buf: The whole shared buffer.
+            offset: Byte offset of the slot.
+            layout: Layout of the slot.
+        """
+        self._buf = buf
+        self._offset = offset
+        self._layout = layout
+
+        self.sequence: int = 0
+        self.frame: int = 0
+        self.score: int = 0
+        self.lives: int = 0
+        self.wave: int = 0
+        self.game_over: bool = False
+        self.game_won: bool = False
+        self.restarts: int = 0
+        self.inputs: int = 0  # Sequence of the controls applied
+        self.fires: int = 0  # Last fire request handled
+        self.fired: int = 0  # Last fire request that fired a bullet
+        self.alien_scale: float = 0.0
+        self.count: int = 0
+        self.sound_counts: list[int] = [0] * SOUND_COUNT
+
+        def array(start: int, item_size: int) -> memoryview:
+            return buf[offset + start : offset + start + item_size * layout.capacity]
+
+        self.ids = array(layout.ids, 8).cast("Q")
+        self.xs = array(layout.xs, 4).cast("f")
+        self.ys = array(layout.ys, 4).cast("f")
+        self.kinds = array(layout.kinds, 1).cast("B")
+        self.subtypes = array(layout.subtypes, 1).cast("B")
+
+    def read_header(self) -> None:
+        """Read the slot header into this frame's attributes."""
+        (
+            self.sequence,
+            self.frame,
+            self.score,
+            self.lives,
+            self.wave,
+            flags,
+            self.restarts,
+            self.inputs,
+            self.fires,
+            self.fired,
+            self.alien_scale,
+            self.count,
+            *sounds,
+        ) = _SLOT_HEADER.unpack_from(self._buf, self._offset)
+        self.game_over = bool(flags & _FLAG_GAME_OVER)
+        self.game_won = bool(flags & _FLAG_GAME_WON)
+        self.sound_counts = sounds
+
+    def write_header(self, sequence: int) -> None:
+        """
+        Write this frame's attributes into the slot header.
+
+        Args:
+            sequence: Sequence counter to store; odd while a write is in progress.
+        """
+        flags = (_FLAG_GAME_OVER if self.game_over else 0) | (
+            _FLAG_GAME_WON if self.game_won else 0
+        )
+        _SLOT_HEADER.pack_into(
+            self._buf,
+            self._offset,
+            sequence,
+            self.frame,
+            self.score,
+            self.lives,
+            self.wave,
+            flags,
+            self.restarts,
+            self.inputs,
+            self.fires,
+            self.fired,
+            self.alien_scale,
+            self.count,
+            *self.sound_counts,
+        )
+
+    def current_sequence(self) -> int:
+        """Read the slot's sequence counter as it is right now."""
+        sequence: int = _SLOT_HEADER.unpack_from(self._buf, self._offset)[0]
+        return sequence
+
+    def add(self, entity: Entity) -> None:
+        """
+        Append an entity to the slot. Entities beyond capacity are dropped.
+
+        Args:
+            entity: The entity; its id must stay the same while it lives.
+        """
+        i = self.count
+        if i >= self._layout.capacity:
+            return
+        entity_id, kind, x, y, subtype = entity
+        self.ids[i] = entity_id & 0xFFFFFFFFFFFFFFFF
+        self.xs[i] = x
+        self.ys[i] = y
+        self.kinds[i] = kind
+        self.subtypes[i] = min(subtype, 255)
+        self.count = i + 1
+
+    def entities(self) -> Iterator[Entity]:
+        """
+        Iterate over the entities in the slot.
+
+        Yields:
+            (id, kind, x, y, subtype) for every entity.
+        """
+        ids, xs, ys, kinds, subtypes = self.ids, self.xs, self.ys, self.kinds, self.subtypes
+        for i in range(self.count):
+            yield ids[i], EntityKind(kinds[i]), xs[i], ys[i], subtypes[i]
+
+    def release(self) -> None:
+        """Release the memoryviews so the shared memory can be closed."""
+        for view in (self.ids, self.xs, self.ys, self.kinds, self.subtypes):
+            view.release()
+
+
+class SharedState:
+    """
+    Double-buffered game state in a named shared memory block.
+
+    Exactly one process writes with ``frame`` and any number read with ``read``.
+    """
+
+    def __init__(self, name: str | None = None, capacity: int | None = None) -> None:
+        """
+        Create a new shared state block, or attach to an existing one.
+
+        Args:
+            name: Name of an existing block to attach to, or None to create one.
+            capacity: Maximum entities per slot, defaults to the configured limit.
+                Must match between the creating and attaching processes.
+        """
+        self.layout = SlotLayout(capacity or SETTINGS.max_shared_entities)
+        self._slot_offset = _align(_LATEST.size)
+        size = self._slot_offset + 2 * self.layout.size
+
+        self._shm = _attach(name, size)
+        self._owner = name is None
+
+        self._buf = buf = _buffer(self._shm)
+        self._slots = [
+            StateFrame(buf, self._slot_offset + i * self.layout.size, self.layout) for i in (0, 1)
+        ]
+        self._sequence = 0
+        self._sound_counts = [0] * SOUND_COUNT
+
+    @property
+    def name(self) -> str:
+        """Name other processes use to attach to this block."""
+        return self._shm.name
+
+    @contextmanager
+    def frame(self) -> Iterator[StateFrame]:
+        """
+        Write a new frame into the back slot and publish it on exit.
+
+        Sound counters are cumulative: increments made to ``sound_counts``
+        are carried over into every later frame.
+
+        Yields:
+            The back slot, emptied, for the caller to fill in.
+        """
+        latest: int = _LATEST.unpack_from(self._buf)[0]
+        back = self._slots[1 - latest]
+
+        self._sequence += 1
+        back.frame = self._sequence
+        back.count = 0
+        back.sound_counts = list(self._sound_counts)
+        back.write_header(2 * self._sequence - 1)
+
+        yield back
+
+        self._sound_counts = list(back.sound_counts)
+        back.write_header(2 * self._sequence)
+        _LATEST.pack_into(self._buf, 0, 1 - latest)
+
+    def read(self) -> StateFrame | None:
+        """
+        Map the most recently published slot.
+
+        Call ``is_consistent`` with the result after using it.
+
+        Returns:
+            The slot, or None if nothing has been published or a write is in progress.
+        """
+        latest: int = _LATEST.unpack_from(self._buf)[0]
+        slot = self._slots[latest]
+        slot.read_header()
+        if slot.sequence == 0 or slot.sequence % 2:
+            return None
+        return slot
+
+    @staticmethod
+    def is_consistent(frame: StateFrame) -> bool:
+        """
+        Check that a slot was not overwritten while it was being read.
+
+        Args:
+            frame: A slot returned by ``read``.
+
+        Returns:
+            True if the data read from the slot is a complete frame.
+        """
+        return frame.current_sequence() == frame.sequence
+
+    def close(self) -> None:
+        """Detach from the block, removing it if this process created it."""
+        for slot in self._slots:
+            slot.release()
+        self._slots.clear()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+@dataclass
+class Controls:
+    """Player input as seen by the simulation process."""
+
+    sequence: int = 0  # Raised on every write, echoed back in published frames
+    direction: int = 0
+    fires: int = 0
+    restarts: int = 0
+    paused: bool = False
+    quit: bool = False
+
+
+class SharedInput:
+    """Player input in a named shared memory block, written by the renderer."""
+
+    def __init__(self, name: str | None = None) -> None:
+        """
+        Create a new input block, or attach to an existing one.
+
+        Args:
+            name: Name of an existing block to attach to, or None to create one.
+        """
+        self._shm = _attach(name, _INPUT.size)
+        self._owner = name is None
+        self._buf = _buffer(self._shm)
+
+    @property
+    def name(self) -> str:
+        """Name other processes use to attach to this block."""
+        return self._shm.name
+
+    def read(self) -> Controls:
+        """Read the current controls."""
+        return Controls(*_INPUT.unpack_from(self._buf))
+
+    def write(self, controls: Controls) -> None:
+        """
+        Replace the current controls.
+
+        Args:
+            controls: Controls to publish.
+        """
+        _INPUT.pack_into(
+            self._buf,
+            0,
+            controls.sequence,
+            controls.direction,
+            controls.fires,
+            controls.restarts,
+            controls.paused,
+            controls.quit,
+        )
+
+    def close(self) -> None:
+        """Detach from the block, removing it if this process created it."""
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
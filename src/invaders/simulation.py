@@ -0,0 +1,484 @@
+"""
+Game rules and state, independent of any window.
+
+The game objects are Arcade sprites and collisions use their texture hit
+boxes, so importing this module loads Arcade (and pyglet) even though it
+never opens a window.
+"""
+
+import time
+from collections.abc import Iterator
+from enum import IntEnum
+
+import arcade
+
+from invaders.alien import Alien, AlienFormation
+from invaders.bullet import Bullet
+from invaders.explosion import Explosion, load_explosion_textures
+from invaders.hitbox import check_for_collision, check_for_collision_with_list
+from invaders.player import Player
+from invaders.settings import SETTINGS
+from invaders.shared_state import Controls, Entity, EntityKind, SharedInput, SharedState
+from invaders.telemetry import Event, EventLog, open_event_log
+from invaders.timing import FixedStepClock
+from invaders.waves import WaveSpec, generate_waves
+
+# Entity id of the player in published frames
+PLAYER_ID = 0
+
+
+class Sound(IntEnum):
+    """Sound effects the simulation asks the window to play."""
+
+    LASER = 0
+    EXPLOSION = 1
+    HIT = 2
+    GAME_OVER = 3
+    VICTORY = 4
+
+
+class Effect(IntEnum):
+    """Visual effects the simulation asks the window to show."""
+
+    DEBRIS = 0  # An alien was destroyed
+    SPARKS = 1  # The player was hit
+
+
+class GameSimulation:
+    """
+    The state and rules of one game of Invaders.
+
+    Owns the player, the alien formation, bullets and explosions and advances
+    them one logic step at a time. It never draws or plays audio; sounds and
+    effects are queued in ``sounds`` and ``effects`` for whoever presents the
+    game.
+    """
+
+    def __init__(self, telemetry: EventLog | None = None) -> None:
+        """
+        Initialize an empty simulation. Call ``setup`` to start a game.
+
+        Args:
+            telemetry: Event log for shots, kills, hits, deaths and wave outcomes.
+        """
+        # Game objects
+        self.player: Player
+        self.player_list: arcade.SpriteList[arcade.Sprite]
+        self.alien_formation: AlienFormation
+        self.waves: Iterator[WaveSpec]
+        self.player_bullets: arcade.SpriteList[arcade.Sprite]
+        self.explosions_list: arcade.SpriteList[arcade.Sprite]
+
+        # Explosion textures (loaded once) and the frames played at the current quality
+        self.explosion_textures: list[arcade.Texture] = []
+        self.explosion_frames: list[arcade.Texture] = []
+
+        # Game state
+        self.score: int = 0
+        self.game_over: bool = False
+        self.game_won: bool = False
+        self.paused: bool = False
+
+        # Sounds and effects (with their position) triggered since the presenter last drained them
+        self.sounds: list[Sound] = []
+        self.effects: list[tuple[Effect, float, float]] = []
+
+        # Gameplay events, and game time for wave durations
+        self.telemetry = telemetry
+        self.time: float = 0.0
+        self._wave_start: float = 0.0
+
+    def setup(self) -> None:
+        """
+        Set up a new game.
+
+        Initializes or resets all game objects and state. Call this
+        to start a new game or restart after game over.
+        """
+        # Load explosion textures (only once)
+        if not self.explosion_textures:
+            self.explosion_textures = load_explosion_textures()
+            self.explosion_frames = self.explosion_textures
+
+        # Create player at bottom center of screen
+        self.player = Player()
+        self.player.center_x = SETTINGS.screen_width / 2
+        self.player.center_y = 50
+
+        # Create player sprite list
+        self.player_list = arcade.SpriteList()
+        self.player_list.append(self.player)
+
+        # Create alien formation; aliens of each wave are spawned over the next frames
+        self.waves = generate_waves()
+        self.alien_formation = AlienFormation()
+        self.alien_formation.start_wave(next(self.waves))
+
+        # Create player bullet list
+        self.player_bullets = arcade.SpriteList()
+
+        # Create explosions list
+        self.explosions_list = arcade.SpriteList()
+
+        # Reset game state
+        self.score = 0
+        self.game_over = False
+        self.game_won = False
+        self.sounds.clear()
+        self.effects.clear()
+        self.time = 0.0
+        self._wave_start = 0.0
+
+    @property
+    def lives(self) -> int:
+        """Lives the player has left."""
+        return self.player.lives
+
+    @property
+    def wave_number(self) -> int:
+        """Number of the current wave, 0 before the first one starts."""
+        wave = self.alien_formation.wave
+        return wave.number if wave is not None else 0
+
+    @property
+    def aliens(self) -> arcade.SpriteList[arcade.Sprite]:
+        """The aliens currently in play."""
+        return self.alien_formation.aliens
+
+    @property
+    def alien_bullets(self) -> arcade.SpriteList[arcade.Sprite]:
+        """Bullets fired by aliens."""
+        return self.alien_formation.bullets
+
+    @property
+    def sprite_lists(self) -> list[arcade.SpriteList[arcade.Sprite]]:
+        """Sprite lists of game objects in drawing order."""
+        return [
+            self.player_list,
+            self.alien_formation.aliens,
+            self.alien_formation.bullets,
+            self.player_bullets,
+            self.explosions_list,
+        ]
+
+    @property
+    def moving_sprite_lists(self) -> list[arcade.SpriteList[arcade.Sprite]]:
+        """Sprite lists of game objects that move between logic steps."""
+        return self.sprite_lists[:-1]
+
+    def steer(self, direction: int) -> None:
+        """
+        Set the player's horizontal movement.
+
+        Args:
+            direction: -1 to move left, 1 to move right, 0 to stop.
+        """
+        if direction < 0:
+            self.player.move_left()
+        elif direction > 0:
+            self.player.move_right()
+        else:
+            self.player.stop()
+
+    def fire(self) -> bool:
+        """
+        Fire a bullet from the player's position.
+
+        Returns:
+            True if a bullet was fired, False if too many are in flight.
+        """
+        # Limit to one player bullet at a time (classic Space Invaders behavior)
+        if len(self.player_bullets) < 3:
+            bullet = Bullet(
+                x=self.player.center_x,
+                y=self.player.top,
+                speed=SETTINGS.bullet_speed,
+                is_player_bullet=True,
+            )
+            self.player_bullets.append(bullet)
+            self.sounds.append(Sound.LASER)
+            if self.telemetry is not None:
+                self.telemetry.emit(Event.SHOT, bullet.center_x)
+            return True
+        return False
+
+    def update(self, delta_time: float) -> None:
+        """
+        Run one fixed step of game logic.
+
+        Args:
+            delta_time: Fixed logic step in seconds.
+        """
+        if self.game_over or self.game_won or self.paused:
+            return
+        self.time += delta_time
+
+        # Update player
+        self.player.update(delta_time)
+
+        # Spawn the current wave a few aliens at a time
+        if self.alien_formation.spawning:
+            self.alien_formation.spawn(SETTINGS.aliens_spawned_per_frame)
+
+        # Update aliens
+        self.alien_formation.update(delta_time)
+        if self.alien_formation.wave is not None:
+            self.alien_formation.maybe_shoot(shoot_chance=self.alien_formation.wave.shoot_chance)
+
+        # Update player bullets
+        self.player_bullets.update(delta_time)
+
+        # Update explosions
+        self.explosions_list.update(delta_time)
+
+        # Remove off-screen player bullets
+        for bullet in list(self.player_bullets):
+            if isinstance(bullet, Bullet) and bullet.is_off_screen(SETTINGS.screen_height):
+                bullet.remove_from_sprite_lists()
+
+        # Check collisions
+        self._check_collisions()
+
+        # Check win/lose conditions
+        self._check_game_state()
+
+    def _check_collisions(self) -> None:
+        """Check and handle all sprite collisions."""
+        # Player bullets hitting aliens
+        for bullet in list(self.player_bullets):
+            if isinstance(bullet, Bullet):
+                hit_aliens = check_for_collision_with_list(
+                    bullet,
+                    self.alien_formation.aliens,
+                    SETTINGS.collision_mode,
+                )
+                for alien in hit_aliens:
+                    # Create explosion at alien position
+                    explosion = Explosion(
+                        self.explosion_frames,
+                        x=alien.center_x,
+                        y=alien.center_y,
+                    )
+                    self.explosions_list.append(explosion)
+                    self.sounds.append(Sound.EXPLOSION)
+                    self.effects.append((Effect.DEBRIS, alien.center_x, alien.center_y))
+
+                    # Remove bullet and alien, keeping the alien for reuse
+                    bullet.remove_from_sprite_lists()
+                    if isinstance(alien, Alien):
+                        self.alien_formation.kill(alien)
+                    else:
+                        alien.remove_from_sprite_lists()
+                    # Update score
+                    self.score += 10
+                    if self.telemetry is not None:
+                        self.telemetry.emit(
+                            Event.KILL,
+                            alien.alien_type if isinstance(alien, Alien) else 0,
+                            alien.center_x,
+                            alien.center_y,
+                            self.wave_number,
+                        )
+                    break
+
+        # Alien bullets hitting player
+        for bullet in list(self.alien_formation.bullets):
+            if isinstance(bullet, Bullet):
+                if check_for_collision(bullet, self.player, SETTINGS.collision_mode):
+                    bullet.remove_from_sprite_lists()
+                    self.player.hit()
+                    self.sounds.append(Sound.HIT)
+                    self.effects.append((Effect.SPARKS, self.player.center_x, self.player.center_y))
+                    if self.telemetry is not None:
+                        self.telemetry.emit(Event.HIT, self.player.lives, self.player.center_x)
+                    if not self.player.is_alive():
+                        self._lose("shot")
+
+        # Aliens colliding with player
+        if check_for_collision_with_list(
+            self.player,
+            self.alien_formation.aliens,
+            SETTINGS.collision_mode,
+        ):
+            self._lose("collision")
+
+    def _check_game_state(self) -> None:
+        """Check for win/lose conditions."""
+        # Wave cleared: move on to the next one, or win in classic mode
+        if self.alien_formation.is_empty():
+            self.sounds.append(Sound.VICTORY)
+            self._end_wave("cleared")
+            if SETTINGS.endless_waves:
+                self.alien_formation.start_wave(next(self.waves))
+            else:
+                self.game_won = True
+
+        # Lose: aliens reached the bottom
+        if self.alien_formation.reached_bottom(y_threshold=80):
+            self._lose("invasion")
+
+    def _lose(self, cause: str) -> None:
+        """
+        End the game as lost, once per game.
+
+        Args:
+            cause: What ended the game: "shot", "collision" or "invasion".
+        """
+        if self.game_over:
+            return
+        self.game_over = True
+        self.sounds.append(Sound.GAME_OVER)
+        if self.telemetry is not None:
+            self.telemetry.emit(Event.DEATH, cause, self.score, self.wave_number)
+        self._end_wave("lost")
+
+    def _end_wave(self, outcome: str) -> None:
+        """
+        Report how the current wave ended.
+
+        Args:
+            outcome: "cleared" or "lost".
+        """
+        if self.telemetry is not None:
+            seconds = round(self.time - self._wave_start, 2)
+            self.telemetry.emit(Event.WAVE, self.wave_number, outcome, seconds, self.score)
+        self._wave_start = self.time
+
+    @property
+    def input_steps_pending(self) -> int:
+        """Number of recent logic steps whose input the state does not show; none in process."""
+        return 0
+
+    @property
+    def alien_scale(self) -> float:
+        """Sprite scale of the current wave's aliens."""
+        wave = self.alien_formation.wave
+        return wave.scale if wave is not None else 0.0
+
+    def entities(self) -> Iterator[Entity]:
+        """
+        Iterate over every entity in the game.
+
+        Entities keep the id handed out when they were created (or, for
+        aliens, recycled); there is only ever one player.
+
+        Yields:
+            (id, kind, x, y, subtype) for every entity.
+        """
+        player = self.player
+        if player.is_alive():
+            yield PLAYER_ID, EntityKind.PLAYER, player.center_x, player.center_y, 0
+        for alien in self.alien_formation.aliens:
+            if isinstance(alien, Alien):
+                yield (
+                    alien.entity_id,
+                    EntityKind.ALIEN,
+                    alien.center_x,
+                    alien.center_y,
+                    alien.alien_type,
+                )
+        for bullets, kind in (
+            (self.player_bullets, EntityKind.PLAYER_BULLET),
+            (self.alien_formation.bullets, EntityKind.ALIEN_BULLET),
+        ):
+            for bullet in bullets:
+                if isinstance(bullet, Bullet):
+                    yield bullet.entity_id, kind, bullet.center_x, bullet.center_y, 0
+        for explosion in self.explosions_list:
+            if isinstance(explosion, Explosion):
+                yield (
+                    explosion.entity_id,
+                    EntityKind.EXPLOSION,
+                    explosion.center_x,
+                    explosion.center_y,
+                    explosion.current_texture,
+                )
+
+    def publish(self, state: SharedState, controls: Controls, fired: int) -> None:
+        """
+        Write the current state into a shared-memory buffer for a renderer.
+
+        Args:
+            state: The shared state to write to.
+            controls: The renderer's controls applied up to this state, every
+                fire and restart request in them handled.
+            fired: The last fire request that fired a bullet.
+        """
+        with state.frame() as frame:
+            frame.score = self.score
+            frame.lives = self.player.lives
+            frame.wave = self.wave_number
+            frame.game_over = self.game_over
+            frame.game_won = self.game_won
+            frame.restarts = controls.restarts
+            frame.inputs = controls.sequence
+            frame.fires = controls.fires
+            frame.fired = fired
+            frame.alien_scale = self.alien_scale
+            for sound in self.sounds:
+                frame.sound_counts[sound] += 1
+            self.sounds.clear()
+            # The renderer recreates effects from new explosions and hit sounds
+            self.effects.clear()
+
+            for entity in self.entities():
+                frame.add(entity)
+
+
+def run_simulation_process(state_name: str, input_name: str) -> None:
+    """
+    Run the simulation in real time, publishing every step to shared memory.
+
+    This is the target of the simulation process in split mode. It exits
+    when the renderer sets the quit flag in the shared input block.
+
+    Args:
+        state_name: Name of the shared state buffer to write.
+        input_name: Name of the shared input block to read.
+    """
+    state = SharedState(name=state_name)
+    inputs = SharedInput(name=input_name)
+    telemetry = open_event_log()
+    sim = GameSimulation(telemetry)
+    sim.setup()
+    clock = FixedStepClock(SETTINGS.logic_rate, SETTINGS.max_logic_steps)
+
+    fires_handled = 0
+    fired = 0
+    restarts_handled = 0
+    last = time.perf_counter()
+    try:
+        while True:
+            controls = inputs.read()
+            if controls.quit:
+                break
+
+            now = time.perf_counter()
+            steps = clock.advance(now - last)
+            last = now
+
+            if controls.restarts != restarts_handled:
+                restarts_handled = controls.restarts
+                fires_handled = controls.fires
+                sim.setup()
+            sim.paused = controls.paused
+
+            for _ in range(steps):
+                sim.steer(controls.direction)
+                if controls.fires != fires_handled:
+                    # One shot per request; the renderer asks again if this one is refused
+                    fires_handled = controls.fires
+                    if sim.fire():
+                        fired = fires_handled
+                sim.update(clock.step)
+
+            if steps:
+                sim.publish(state, controls, fired)
+
+            # Sleep until the next logic step is due
+            time.sleep(clock.step * (1.0 - clock.alpha))
+    finally:
+        state.close()
+        inputs.close()
+        if telemetry is not None:
+            telemetry.close()
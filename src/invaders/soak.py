@@ -0,0 +1,417 @@
+"""
+Long-running soak test with memory and leak tracking.
+
+Drives the game with a scripted autopilot through many restarts and samples
+Python allocations, live objects by type, sprite list sizes and texture atlas
+usage. At the end, growth trends are fitted and a verdict is reported.
+
+Run without a display using Arcade's headless mode::
+
+    ARCADE_HEADLESS=1 python -m invaders.soak --hours 24 --json soak.json
+
+Arcade is only imported once the game window is created, so the trend
+analysis and the command line load without it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING
+
+from invaders.settings import SETTINGS
+
+if TYPE_CHECKING:
+    from invaders.game import InvadersGame
+
+# Fraction of samples ignored while caches and pools warm up
+WARMUP_FRACTION = 0.2
+
+# Object types below this count are left out of samples to keep reports small
+MIN_TRACKED_OBJECTS = 10
+
+
+@dataclass
+class SoakSample:
+    """Resource usage measured at one point of a soak run."""
+
+    frame: int
+    elapsed: float  # Wall-clock seconds since the run started
+    restarts: int
+    traced_bytes: int
+    object_counts: dict[str, int]
+    sprite_lists: dict[str, int]
+    atlas_textures: int
+    atlas_images: int
+    atlas_size: tuple[int, int]
+
+
+@dataclass
+class SoakReport:
+    """Growth trends and verdict for a finished soak run."""
+
+    verdict: str  # "pass", "fail" or "inconclusive"
+    frames: int
+    restarts: int
+    duration: float
+    traced_bytes_per_hour: float
+    atlas_textures_per_hour: float
+    sprite_growth_per_hour: dict[str, float]
+    growing_types: dict[str, float]
+    samples: list[SoakSample] = field(default_factory=list)
+
+
+class Autopilot:
+    """
+    Scripted player that chases the lowest alien, fires steadily and restarts.
+
+    Input goes through the window's key handlers so the same code paths as a
+    human player are exercised.
+    """
+
+    def __init__(self, game: InvadersGame, fire_every: int = 10) -> None:
+        """
+        Initialize the autopilot.
+
+        Args:
+            game: The game to drive.
+            fire_every: Press fire once every this many frames.
+        """
+        self.game = game
+        self.fire_every = fire_every
+        self.frames: int = 0
+        self.restarts: int = 0
+        self._held: int | None = None
+
+    def step(self) -> bool:
+        """
+        Send this frame's input to the game.
+
+        Returns:
+            True if the game was restarted this frame.
+        """
+        from arcade import key
+
+        game = self.game
+        sim = game.sim
+        self.frames += 1
+
+        if sim.game_over or sim.game_won:
+            self._hold(None)
+            game.on_key_press(key.R, 0)
+            game.on_key_release(key.R, 0)
+            self.restarts += 1
+            return True
+
+        # Chase the lowest alien, nearest first
+        aliens = sim.aliens
+        player_x = sim.player.center_x
+        if len(aliens) > 0:
+            target = min(aliens, key=lambda a: (a.center_y, abs(a.center_x - player_x)))
+            offset = target.center_x - player_x
+            if offset > 5:
+                self._hold(key.RIGHT)
+            elif offset < -5:
+                self._hold(key.LEFT)
+            else:
+                self._hold(None)
+
+        if self.frames % self.fire_every == 0:
+            game.on_key_press(key.SPACE, 0)
+            game.on_key_release(key.SPACE, 0)
+        return False
+
+    def _hold(self, key: int | None) -> None:
+        """Release the currently held movement key and press another one."""
+        if key == self._held:
+            return
+        if self._held is not None:
+            self.game.on_key_release(self._held, 0)
+        if key is not None:
+            self.game.on_key_press(key, 0)
+        self._held = key
+
+
+def traced_game_memory() -> int:
+    """
+    Sum traced allocations, leaving out the soak harness's own bookkeeping.
+
+    Returns:
+        Traced bytes allocated outside this module and tracemalloc.
+    """
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+        ]
+    )
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def take_sample(game: InvadersGame, frame: int, elapsed: float, restarts: int) -> SoakSample:
+    """
+    Measure the game's current resource usage.
+
+    Args:
+        game: The game being soaked.
+        frame: Frames run so far.
+        elapsed: Wall-clock seconds since the run started.
+        restarts: Number of restarts so far.
+
+    Returns:
+        The measured sample.
+    """
+    from arcade.texture_atlas import DefaultTextureAtlas
+
+    gc.collect()
+
+    counts = Counter(f"{type(obj).__module__}.{type(obj).__qualname__}" for obj in gc.get_objects())
+    object_counts = {name: n for name, n in counts.items() if n >= MIN_TRACKED_OBJECTS}
+
+    names = ("player", "aliens", "alien_bullets", "player_bullets", "explosions")
+    sprite_lists = {
+        name: len(sprite_list)
+        for name, sprite_list in zip(names, game.sim.sprite_lists, strict=True)
+    }
+    sprite_lists["stars"] = sum(len(layer.stars) for layer in game.starfield.layers)
+
+    atlas = game.ctx.default_atlas
+    atlas_textures = atlas_images = 0
+    if isinstance(atlas, DefaultTextureAtlas):
+        atlas_textures = len(atlas.textures)
+        atlas_images = len(atlas.images)
+
+    return SoakSample(
+        frame=frame,
+        elapsed=elapsed,
+        restarts=restarts,
+        traced_bytes=traced_game_memory(),
+        object_counts=object_counts,
+        sprite_lists=sprite_lists,
+        atlas_textures=atlas_textures,
+        atlas_images=atlas_images,
+        atlas_size=atlas.size,
+    )
+
+
+def growth_per_hour(times: list[float], values: list[float]) -> float:
+    """
+    Fit a least-squares line and return its slope in units per hour.
+
+    Args:
+        times: Sample times in seconds.
+        values: Measured values at those times.
+
+    Returns:
+        Growth rate per hour, 0 if there are too few distinct times.
+    """
+    n = len(times)
+    if n < 2:
+        return 0.0
+    mean_t = sum(times) / n
+    mean_v = sum(values) / n
+    var_t = sum((t - mean_t) ** 2 for t in times)
+    if var_t == 0:
+        return 0.0
+    cov = sum((t - mean_t) * (v - mean_v) for t, v in zip(times, values, strict=True))
+    return cov / var_t * 3600
+
+
+def analyze(
+    samples: list[SoakSample],
+    max_bytes_per_hour: float,
+    max_objects_per_hour: float,
+) -> SoakReport:
+    """
+    Fit growth trends to the samples taken after warmup and decide a verdict.
+
+    Args:
+        samples: Samples in the order they were taken.
+        max_bytes_per_hour: Traced memory growth allowed before failing.
+        max_objects_per_hour: Growth allowed for any object type or sprite list.
+
+    Returns:
+        The soak report.
+    """
+    steady = samples[int(len(samples) * WARMUP_FRACTION) :]
+    times = [s.elapsed for s in steady]
+
+    traced = growth_per_hour(times, [s.traced_bytes for s in steady])
+    atlas = growth_per_hour(times, [s.atlas_textures for s in steady])
+
+    sprite_growth = {
+        name: growth_per_hour(times, [s.sprite_lists[name] for s in steady])
+        for name in (steady[0].sprite_lists if steady else {})
+    }
+
+    type_names = {name for s in steady for name in s.object_counts}
+    growing = {}
+    for name in sorted(type_names):
+        rate = growth_per_hour(times, [s.object_counts.get(name, 0) for s in steady])
+        if rate > max_objects_per_hour:
+            growing[name] = rate
+
+    if len(steady) < 3:
+        verdict = "inconclusive"
+    elif (
+        traced > max_bytes_per_hour
+        or atlas > max_objects_per_hour
+        or growing
+        or any(rate > max_objects_per_hour for rate in sprite_growth.values())
+    ):
+        verdict = "fail"
+    else:
+        verdict = "pass"
+
+    last = samples[-1] if samples else None
+    return SoakReport(
+        verdict=verdict,
+        frames=last.frame if last else 0,
+        restarts=last.restarts if last else 0,
+        duration=last.elapsed if last else 0.0,
+        traced_bytes_per_hour=traced,
+        atlas_textures_per_hour=atlas,
+        sprite_growth_per_hour=sprite_growth,
+        growing_types=growing,
+        samples=samples,
+    )
+
+
+def run_soak(
+    duration: float,
+    sample_interval: float,
+    max_frames: int | None = None,
+    seed: int = 0,
+) -> list[SoakSample]:
+    """
+    Run the game's real event loop under the autopilot and collect resource samples.
+
+    Samples are taken right after a restart once the interval has passed, so
+    each one sees a freshly set up game. If a single game runs much longer than
+    the interval, a sample is taken mid-game instead.
+
+    Args:
+        duration: Wall-clock seconds to run for.
+        sample_interval: Wall-clock seconds between samples.
+        max_frames: Optional cap on the number of autopilot frames.
+        seed: Seed for the game's random number generator.
+
+    Returns:
+        The samples taken, including one at the start and one at the end.
+    """
+    import pyglet
+
+    from invaders.game import InvadersGame
+
+    random.seed(seed)
+    tracemalloc.start()
+
+    game = InvadersGame()
+    game.setup()
+    autopilot = Autopilot(game)
+
+    start = time.perf_counter()
+    samples = [take_sample(game, 0, 0.0, 0)]
+    last_sample = start
+
+    def on_frame(delta_time: float) -> None:
+        nonlocal last_sample
+        restarted = autopilot.step()
+
+        now = time.perf_counter()
+        since_sample = now - last_sample
+        done = now - start >= duration or (
+            max_frames is not None and autopilot.frames >= max_frames
+        )
+        if (
+            done
+            or (restarted and since_sample >= sample_interval)
+            or since_sample >= sample_interval * 4
+        ):
+            samples.append(take_sample(game, autopilot.frames, now - start, autopilot.restarts))
+            last_sample = now
+        if done:
+            pyglet.app.exit()
+
+    pyglet.clock.schedule_interval(on_frame, 1 / SETTINGS.logic_rate)
+    try:
+        pyglet.app.run(None)
+    finally:
+        pyglet.clock.unschedule(on_frame)
+        game.close()
+        tracemalloc.stop()
+
+    return samples
+
+
+def print_report(report: SoakReport) -> None:
+    """
+    Print a human-readable summary of a soak report.
+
+    Args:
+        report: The report to print.
+    """
+    print(f"Soak verdict: {report.verdict.upper()}")
+    print(f"  frames: {report.frames}  restarts: {report.restarts}")
+    print(f"  duration: {report.duration / 3600:.2f} h  samples: {len(report.samples)}")
+    print(f"  traced memory: {report.traced_bytes_per_hour / 1024:+.1f} KiB/h")
+    print(f"  atlas textures: {report.atlas_textures_per_hour:+.1f} /h")
+    for name, rate in report.sprite_growth_per_hour.items():
+        print(f"  sprites[{name}]: {rate:+.1f} /h")
+    for name, rate in report.growing_types.items():
+        print(f"  growing type {name}: {rate:+.1f} objects/h")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command line entry point for the soak test.
+
+    Args:
+        argv: Command line arguments, defaults to ``sys.argv[1:]``.
+
+    Returns:
+        Process exit code, non-zero when the soak fails.
+    """
+    parser = argparse.ArgumentParser(description="Soak test the game for memory leaks.")
+    parser.add_argument("--hours", type=float, default=1.0, help="wall-clock hours to run")
+    parser.add_argument("--frames", type=int, default=None, help="stop after this many frames")
+    parser.add_argument("--sample-interval", type=float, default=60.0, help="seconds per sample")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument(
+        "--max-kib-per-hour", type=float, default=1024.0, help="allowed traced memory growth"
+    )
+    parser.add_argument(
+        "--max-objects-per-hour", type=float, default=1000.0, help="allowed growth per type"
+    )
+    parser.add_argument("--json", metavar="PATH", help="write samples and trends as JSON")
+    args = parser.parse_args(argv)
+
+    samples = run_soak(
+        duration=args.hours * 3600,
+        sample_interval=args.sample_interval,
+        max_frames=args.frames,
+        seed=args.seed,
+    )
+    report = analyze(
+        samples,
+        max_bytes_per_hour=args.max_kib_per_hour * 1024,
+        max_objects_per_hour=args.max_objects_per_hour,
+    )
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(asdict(report), f, indent=2)
+
+    return 1 if report.verdict == "fail" else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,497 @@
+"""
+Spectator server streaming game state to local viewers.
+
+Every logic step the game hands a ``Snapshot`` to ``SpectatorServer``, which
+sends new viewers a full keyframe and everyone else a delta holding only the
+entities that appeared, moved or changed and the ids of those that went
+away. A viewer joining while no steps run (game over, paused, idle) raises
+``needs_snapshot`` so the game publishes the current state right away.
+The server runs an asyncio loop on its own thread; each viewer has a
+bounded queue, and a viewer that falls behind has its backlog replaced by a
+fresh keyframe instead of slowing down the game. Nothing here imports Arcade.
+
+Wire format, little-endian, one length-prefixed message per step::
+
+    u32 length | u8 type | u64 tick | i32 score | u8 lives | u16 wave | u8 flags
+    | f32 alien scale | u16 removed | u16 changed
+    | removed x u32 id | changed x (u32 id, u8 kind, u8 subtype, i16 x, i16 y)
+
+Positions are sent in quarter pixels. Keyframes have no removed ids and
+replace the viewer's whole world.
+"""
+
+import asyncio
+import contextlib
+import logging
+import struct
+import threading
+import time
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+from invaders.shared_state import Entity, EntityKind
+
+logger = logging.getLogger(__name__)
+
+_LENGTH = struct.Struct("<I")
+_HEADER = struct.Struct("<BQiBHBfHH")
+_REMOVED = struct.Struct("<I")
+_CHANGED = struct.Struct("<IBBhh")
+
+_FLAG_GAME_OVER = 1
+_FLAG_GAME_WON = 2
+
+# Positions are sent as fixed point with this many steps per pixel
+POSITION_SCALE = 4
+
+# Entities per message are counted in 16 bits
+MAX_ENTITIES = 0xFFFF
+
+# Seconds viewers get to drain their queues when the server stops
+SHUTDOWN_TIMEOUT = 1.0
+
+# Wire entity: (kind, subtype, quantized x, quantized y)
+_WireEntity = tuple[int, int, int, int]
+
+
+class MessageType(IntEnum):
+    """Kinds of messages sent to viewers."""
+
+    KEYFRAME = 1
+    DELTA = 2
+
+
+@dataclass
+class Snapshot:
+    """Game state for one logic step, as handed to the spectator server."""
+
+    score: int
+    lives: int
+    wave: int
+    game_over: bool
+    game_won: bool
+    alien_scale: float
+    entities: list[Entity]
+
+
+@dataclass
+class WorldState:
+    """A viewer's copy of the game, rebuilt from keyframes and deltas."""
+
+    tick: int = 0
+    score: int = 0
+    lives: int = 0
+    wave: int = 0
+    game_over: bool = False
+    game_won: bool = False
+    alien_scale: float = 0.0
+    entities: dict[int, Entity] = field(default_factory=dict)
+
+    def apply(self, message: bytes) -> MessageType:
+        """
+        Update the world from one message body.
+
+        Args:
+            message: Message body, without the length prefix.
+
+        Returns:
+            The type of message applied.
+        """
+        (
+            message_type,
+            self.tick,
+            self.score,
+            self.lives,
+            self.wave,
+            flags,
+            self.alien_scale,
+            removed,
+            changed,
+        ) = _HEADER.unpack_from(message)
+        self.game_over = bool(flags & _FLAG_GAME_OVER)
+        self.game_won = bool(flags & _FLAG_GAME_WON)
+
+        kind = MessageType(message_type)
+        if kind is MessageType.KEYFRAME:
+            self.entities.clear()
+
+        offset = _HEADER.size
+        for (entity_id,) in _REMOVED.iter_unpack(
+            message[offset : offset + removed * _REMOVED.size]
+        ):
+            self.entities.pop(entity_id, None)
+        offset += removed * _REMOVED.size
+
+        end = offset + changed * _CHANGED.size
+        for entity_id, entity_kind, subtype, x, y in _CHANGED.iter_unpack(message[offset:end]):
+            self.entities[entity_id] = (
+                entity_id,
+                EntityKind(entity_kind),
+                x / POSITION_SCALE,
+                y / POSITION_SCALE,
+                subtype,
+            )
+        return kind
+
+
+def _clamp16(value: int) -> int:
+    """Clamp a fixed point coordinate to the 16 bits it is sent in."""
+    return max(-0x8000, min(0x7FFF, value))
+
+
+class DeltaEncoder:
+    """
+    Turns a sequence of snapshots into keyframe and delta messages.
+
+    Game entity ids (fixed for the life of an entity) are mapped to small
+    sequential wire ids, and only changes in the quantized state are sent.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an encoder with no state."""
+        self.tick: int = 0
+        self._header: tuple[int, int, int, int, float] = (0, 0, 0, 0, 0.0)
+        self._wire_ids: dict[int, int] = {}  # Game entity id to wire id
+        self._entity_ids: dict[int, int] = {}  # Wire id to game entity id
+        self._next_wire_id: int = 1
+        self._entities: dict[int, _WireEntity] = {}
+        self._keyframe: bytes | None = None
+
+    def encode(self, snapshot: Snapshot) -> bytes:
+        """
+        Advance to a new snapshot.
+
+        Args:
+            snapshot: The game state of the next tick.
+
+        Returns:
+            The length-prefixed delta from the previous snapshot.
+        """
+        self.tick += 1
+        flags = (_FLAG_GAME_OVER if snapshot.game_over else 0) | (
+            _FLAG_GAME_WON if snapshot.game_won else 0
+        )
+        self._header = (
+            snapshot.score,
+            min(snapshot.lives, 0xFF),
+            min(snapshot.wave, 0xFFFF),
+            flags,
+            snapshot.alien_scale,
+        )
+        self._keyframe = None
+
+        previous = self._entities
+        wire_ids = self._wire_ids
+        current: dict[int, _WireEntity] = {}
+        changed: list[tuple[int, _WireEntity]] = []
+        for entity_id, kind, x, y, subtype in snapshot.entities[:MAX_ENTITIES]:
+            wire_id = wire_ids.get(entity_id)
+            if wire_id is None:
+                wire_id = wire_ids[entity_id] = self._next_wire_id
+                self._entity_ids[wire_id] = entity_id
+                self._next_wire_id = (self._next_wire_id + 1) & 0xFFFFFFFF or 1
+            qx = round(x * POSITION_SCALE)
+            qy = round(y * POSITION_SCALE)
+            if not (-0x8000 <= qx <= 0x7FFF and -0x8000 <= qy <= 0x7FFF):
+                qx, qy = _clamp16(qx), _clamp16(qy)
+            entity = (kind, subtype if subtype <= 0xFF else 0xFF, qx, qy)
+            current[wire_id] = entity
+            if previous.get(wire_id) != entity:
+                changed.append((wire_id, entity))
+
+        removed = [wire_id for wire_id in previous if wire_id not in current]
+        for wire_id in removed:
+            del wire_ids[self._entity_ids.pop(wire_id)]
+        self._entities = current
+        return self._message(MessageType.DELTA, removed[:MAX_ENTITIES], changed)
+
+    def keyframe(self) -> bytes:
+        """
+        Encode the current state in full.
+
+        Returns:
+            The length-prefixed keyframe, cached until the next snapshot.
+        """
+        if self._keyframe is None:
+            self._keyframe = self._message(MessageType.KEYFRAME, [], list(self._entities.items()))
+        return self._keyframe
+
+    def _message(
+        self,
+        message_type: MessageType,
+        removed: list[int],
+        changed: list[tuple[int, _WireEntity]],
+    ) -> bytes:
+        """Pack a message with the current header."""
+        parts = [
+            _HEADER.pack(message_type, self.tick, *self._header, len(removed), len(changed)),
+            *(_REMOVED.pack(wire_id) for wire_id in removed),
+            *(_CHANGED.pack(wire_id, *entity) for wire_id, entity in changed),
+        ]
+        body = b"".join(parts)
+        return _LENGTH.pack(len(body)) + body
+
+
+@dataclass(eq=False)
+class _Client:
+    """A connected viewer and its queue of pending messages."""
+
+    queue: asyncio.Queue[bytes]
+    writer: asyncio.StreamWriter
+    peer: str
+    task: asyncio.Task[None] | None = None
+    resyncs: int = 0
+
+    def replace_backlog(self, message: bytes) -> None:
+        """Drop every pending message and queue ``message`` instead."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+
+
+class SpectatorServer:
+    """
+    Streams snapshots to viewers from a background thread.
+
+    ``publish`` is cheap to call from the game loop: it hands the snapshot to
+    the server's event loop, where it is encoded once and queued for every
+    viewer.
+    """
+
+    def __init__(self, host: str, port: int, queue_size: int) -> None:
+        """
+        Initialize the server. Call ``start`` to begin listening.
+
+        Args:
+            host: Interface to listen on, normally the loopback address.
+            port: TCP port to listen on, 0 to pick a free one.
+            queue_size: Messages buffered per viewer before it is resynced.
+        """
+        self.host = host
+        self.port = port
+        self.queue_size = queue_size
+        self.encoder = DeltaEncoder()
+
+        self._clients: set[_Client] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopped: asyncio.Event | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._error: BaseException | None = None
+        self._joined = threading.Event()
+
+    @property
+    def has_clients(self) -> bool:
+        """Whether any viewer is connected."""
+        return bool(self._clients)
+
+    @property
+    def needs_snapshot(self) -> bool:
+        """Whether a viewer joined since the last ``publish`` and is waiting for the game."""
+        return self._joined.is_set()
+
+    def start(self) -> None:
+        """
+        Start the server thread and wait until it is listening.
+
+        Raises:
+            OSError: If the server could not bind to its address.
+        """
+        self._thread = threading.Thread(target=self._run, name="invaders-spectator", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    def publish(self, snapshot: Snapshot) -> None:
+        """
+        Send a snapshot to every viewer.
+
+        Args:
+            snapshot: The game state of the step just run.
+        """
+        self._joined.clear()
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._broadcast, snapshot)
+
+    def stop(self) -> None:
+        """Disconnect every viewer and stop the server thread."""
+        if self._loop is not None and self._stopped is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        """Run the server's event loop until stopped."""
+        try:
+            asyncio.run(self._serve())
+        except BaseException as error:
+            self._error = error
+        finally:
+            self._ready.set()
+
+    async def _serve(self) -> None:
+        """Listen for viewers until stopped."""
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        server = await asyncio.start_server(self._accept, self.host, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        logger.info("Spectator server listening on %s:%d", self.host, self.port)
+        self._ready.set()
+
+        async with server:
+            await self._stopped.wait()
+            server.close()
+
+            # Let viewers finish what they are sending, then cut off any that are stuck
+            clients = list(self._clients)
+            for client in clients:
+                client.replace_backlog(b"")
+            tasks = [client.task for client in clients if client.task is not None]
+            if tasks:
+                _, pending = await asyncio.wait(tasks, timeout=SHUTDOWN_TIMEOUT)
+                for client in clients:
+                    if client.task in pending:
+                        client.writer.transport.abort()
+                await asyncio.wait(tasks)
+        self._loop = None
+
+    def _broadcast(self, snapshot: Snapshot) -> None:
+        """Encode a snapshot and queue it for every viewer."""
+        delta = self.encoder.encode(snapshot)
+        for client in self._clients:
+            if client.queue.full():
+                # Viewer fell behind: drop its backlog and start it over from a keyframe
+                client.replace_backlog(self.encoder.keyframe())
+                client.resyncs += 1
+            else:
+                client.queue.put_nowait(delta)
+
+    def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Register a new viewer and start sending to it, beginning with a keyframe."""
+        client = _Client(
+            queue=asyncio.Queue(self.queue_size),
+            writer=writer,
+            peer=str(writer.get_extra_info("peername")),
+        )
+        client.queue.put_nowait(self.encoder.keyframe())
+        client.task = asyncio.get_running_loop().create_task(self._send(client))
+        self._clients.add(client)
+        # The keyframe may be from long ago if the game is not stepping; ask for a fresh state
+        self._joined.set()
+        logger.info("Spectator connected: %s", client.peer)
+
+    async def _send(self, client: _Client) -> None:
+        """Send messages to one viewer until it disconnects or the server stops."""
+        writer = client.writer
+        try:
+            while message := await client.queue.get():
+                writer.write(message)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.discard(client)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+            logger.info("Spectator disconnected: %s (%d resyncs)", client.peer, client.resyncs)
+
+
+async def read_message(reader: asyncio.StreamReader) -> bytes:
+    """
+    Read one message body from a spectator stream.
+
+    Args:
+        reader: Stream connected to a spectator server.
+
+    Returns:
+        The message body, without the length prefix.
+
+    Raises:
+        asyncio.IncompleteReadError: If the server closed the connection.
+    """
+    (length,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+    return await reader.readexactly(length)
+
+
+async def watch(host: str, port: int) -> AsyncGenerator[tuple[WorldState, MessageType, int]]:
+    """
+    Connect to a spectator server and follow the game.
+
+    Args:
+        host: Server address.
+        port: Server port.
+
+    Yields:
+        The updated world, the type of message that updated it and the
+        message size in bytes, for every message received. The same world
+        object is yielded every time.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    world = WorldState()
+    try:
+        while True:
+            try:
+                message = await read_message(reader)
+            except asyncio.IncompleteReadError:
+                return
+            yield world, world.apply(message), _LENGTH.size + len(message)
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+@dataclass
+class StreamStats:
+    """Traffic seen by a viewer over some time."""
+
+    duration: float
+    keyframes: int = 0
+    deltas: int = 0
+    total_bytes: int = 0
+    max_entities: int = 0
+    last_tick: int = 0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Average bandwidth in bytes per second."""
+        return self.total_bytes / self.duration if self.duration > 0 else 0.0
+
+
+async def measure(host: str, port: int, duration: float) -> StreamStats:
+    """
+    Follow a game for a while and count what was received.
+
+    Args:
+        host: Server address.
+        port: Server port.
+        duration: Seconds to watch for.
+
+    Returns:
+        The traffic statistics.
+    """
+    stats = StreamStats(duration=duration)
+    deadline = time.monotonic() + duration
+    stream = watch(host, port)
+    try:
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                world, message_type, size = await asyncio.wait_for(anext(stream), remaining)
+            except StopAsyncIteration:
+                break  # Server closed the stream
+            except TimeoutError:
+                break
+            if message_type is MessageType.KEYFRAME:
+                stats.keyframes += 1
+            else:
+                stats.deltas += 1
+            stats.total_bytes += size
+            stats.max_entities = max(stats.max_entities, len(world.entities))
+            stats.last_tick = world.tick
+    finally:
+        await stream.aclose()
+    return stats
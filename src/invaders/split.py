@@ -0,0 +1,249 @@
+"""Renderer side of split mode: the simulation runs in a separate process."""
+
+import logging
+import multiprocessing
+from collections import deque
+from collections.abc import Iterator
+
+import arcade
+
+from invaders.mirror import EntityMirror
+from invaders.settings import SETTINGS
+from invaders.shared_state import Controls, Entity, EntityKind, SharedInput, SharedState
+from invaders.simulation import Effect, Sound, run_simulation_process
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the simulation process to exit before killing it
+SHUTDOWN_TIMEOUT = 2.0
+
+
+class RemoteSimulation:
+    """
+    Mirror of a ``GameSimulation`` running in another process.
+
+    Offers the same interface the window uses for an in-process simulation.
+    Input is written to a shared input block; ``update`` maps the latest
+    published state and moves display-only sprites to match it.
+    """
+
+    def __init__(self, explosion_textures: list[arcade.Texture]) -> None:
+        """
+        Create the shared memory blocks. The process starts on the first ``setup``.
+
+        Args:
+            explosion_textures: Frames used to draw explosions.
+        """
+        self.state = SharedState()
+        self.inputs = SharedInput()
+        self._controls = Controls()
+        self._process: multiprocessing.process.BaseProcess | None = None
+
+        # How far the process has got with the controls, as of the last frame read
+        self._inputs_shown: int = 0
+        self._fires_handled: int = 0
+        self._fired: int = 0
+
+        # Logic steps run, and the step and controls sequence of writes not shown yet
+        self._steps: int = 0
+        self._unshown: deque[tuple[int, int]] = deque()
+
+        # Last fired request reported by ``fire``, and the step it was last called in
+        self._fire_claimed: int = 0
+        self._fire_step: int = 0
+
+        # Display sprites following the published entities
+        self.mirror = EntityMirror(explosion_textures)
+
+        # State from the last frame read
+        self._frame: int = 0
+        self._sound_counts: list[int] = [0] * len(Sound)
+        self.score: int = 0
+        self.lives: int = SETTINGS.player_lives
+        self.wave_number: int = 0
+        self.alien_scale: float = 0.0
+        self.game_over: bool = False
+        self.game_won: bool = False
+        self.sounds: list[Sound] = []
+        self.effects: list[tuple[Effect, float, float]] = []
+
+    @property
+    def player(self) -> arcade.Sprite:
+        """The sprite showing the player."""
+        return self.mirror.player
+
+    @property
+    def aliens(self) -> arcade.SpriteList[arcade.Sprite]:
+        """The aliens currently in play."""
+        return self.mirror.aliens
+
+    @property
+    def player_bullets(self) -> arcade.SpriteList[arcade.Sprite]:
+        """Bullets fired by the player."""
+        return self.mirror.player_bullets
+
+    @property
+    def alien_bullets(self) -> arcade.SpriteList[arcade.Sprite]:
+        """Bullets fired by aliens."""
+        return self.mirror.alien_bullets
+
+    @property
+    def sprite_lists(self) -> list[arcade.SpriteList[arcade.Sprite]]:
+        """Sprite lists of game objects in drawing order."""
+        return self.mirror.sprite_lists
+
+    @property
+    def moving_sprite_lists(self) -> list[arcade.SpriteList[arcade.Sprite]]:
+        """Sprite lists of game objects that move between logic steps."""
+        return self.sprite_lists[:-1]
+
+    def entities(self) -> Iterator[Entity]:
+        """
+        Iterate over the entities in the last frame shown.
+
+        Yields:
+            (id, kind, x, y, subtype) for every entity.
+        """
+        return self.mirror.entities()
+
+    @property
+    def input_steps_pending(self) -> int:
+        """Number of recent logic steps whose controls the frame shown does not reflect yet."""
+        if not self._unshown:
+            return 0
+        return self._steps - self._unshown[0][0] + 1
+
+    @property
+    def paused(self) -> bool:
+        """Whether the simulation process is holding the game still."""
+        return self._controls.paused
+
+    @paused.setter
+    def paused(self, paused: bool) -> None:
+        self._controls.paused = paused
+        self._send()
+
+    def setup(self) -> None:
+        """Start the simulation process, or ask it to start a new game."""
+        if self._process is None:
+            context = multiprocessing.get_context("spawn")
+            self._process = context.Process(
+                target=run_simulation_process,
+                args=(self.state.name, self.inputs.name),
+                name="invaders-simulation",
+                daemon=True,
+            )
+            self._process.start()
+            logger.info("Started simulation process %d", self._process.pid)
+        else:
+            # Frames from before the restart are ignored until the new game shows up
+            self._controls.restarts += 1
+            self._send()
+
+        self.score = 0
+        self.lives = SETTINGS.player_lives
+        self.game_over = False
+        self.game_won = False
+
+    def steer(self, direction: int) -> None:
+        """
+        Set the player's horizontal movement.
+
+        Args:
+            direction: -1 to move left, 1 to move right, 0 to stop.
+        """
+        if direction != self._controls.direction:
+            self._controls.direction = direction
+            self._send()
+
+    def fire(self) -> bool:
+        """
+        Ask the simulation process to fire a bullet from the player's position.
+
+        The process answers in a later frame, so a press takes several calls:
+        the first sends a request, and the calls after it return False until
+        the process has fired for it. A refused request (too many bullets in
+        flight) is sent again by the next call, for as long as the window
+        keeps the press buffered.
+
+        Returns:
+            True once the process has fired a bullet for this press.
+        """
+        if self._steps - self._fire_step > 1:
+            # A new press: a shot fired for an earlier, abandoned one is not its answer
+            self._fire_claimed = self._fired
+        self._fire_step = self._steps
+
+        if self._fired != self._fire_claimed:
+            self._fire_claimed = self._fired
+            return True
+        if self._fires_handled == self._controls.fires:
+            self._controls.fires += 1
+            self._send()
+        return False
+
+    def update(self, delta_time: float) -> None:
+        """
+        Show the latest state published by the simulation process.
+
+        Args:
+            delta_time: Fixed logic step in seconds (unused, the process keeps its own time).
+        """
+        self._steps += 1
+        sequence = self._controls.sequence
+        if sequence != (self._unshown[-1][1] if self._unshown else self._inputs_shown):
+            self._unshown.append((self._steps, sequence))
+
+        frame = self.state.read()
+        if frame is None or frame.frame == self._frame or frame.restarts < self._controls.restarts:
+            return
+
+        # Copy the entities out of shared memory before checking the read, so
+        # nothing from a frame overwritten mid-read reaches the screen
+        entities = list(frame.entities())
+        if not SharedState.is_consistent(frame):
+            # Overwritten while reading: try again on the next step
+            return
+
+        # Every new explosion marks a destroyed alien
+        for _, kind, x, y, _ in self.mirror.sync(entities, frame.alien_scale):
+            if kind is EntityKind.EXPLOSION:
+                self.effects.append((Effect.DEBRIS, x, y))
+
+        self._frame = frame.frame
+        self._inputs_shown = frame.inputs
+        while self._unshown and self._unshown[0][1] <= frame.inputs:
+            self._unshown.popleft()
+        self._fires_handled = frame.fires
+        self._fired = frame.fired
+        self.score = frame.score
+        self.lives = frame.lives
+        self.wave_number = frame.wave
+        self.alien_scale = frame.alien_scale
+        self.game_over = frame.game_over
+        self.game_won = frame.game_won
+        for sound in Sound:
+            if frame.sound_counts[sound] != self._sound_counts[sound]:
+                self.sounds.append(sound)
+        if frame.sound_counts[Sound.HIT] != self._sound_counts[Sound.HIT]:
+            self.effects.append((Effect.SPARKS, self.player.center_x, self.player.center_y))
+        self._sound_counts = list(frame.sound_counts)
+
+    def _send(self) -> None:
+        """Write the controls for the process under a new sequence number."""
+        self._controls.sequence += 1
+        self.inputs.write(self._controls)
+
+    def close(self) -> None:
+        """Stop the simulation process and free the shared memory."""
+        if self._process is not None:
+            self._controls.quit = True
+            self._send()
+            self._process.join(SHUTDOWN_TIMEOUT)
+            if self._process.is_alive():
+                logger.warning("Simulation process did not exit, terminating it")
+                self._process.terminate()
+                self._process.join()
+            self._process = None
+        self.state.close()
+        self.inputs.close()
@@ -1,5 +1,6 @@
 """Parallax starfield background with multiple layers."""
 
+import functools
 import random
 
 import arcade
@@ -7,6 +8,15 @@ import arcade
 from invaders.settings import SETTINGS
 
 
+@functools.cache
+def _circle_texture(size: int, color: tuple[int, int, int, int]) -> arcade.Texture:
+    """Create a soft circular star texture, shared by all stars of the same look."""
+    # Stars never collide, so skip tracing the hit box
+    return arcade.make_circle_texture(
+        size, color, hit_box_algorithm=arcade.hitbox.algo_bounding_box
+    )
+
+
 class Star(arcade.Sprite):
     """
     A single star sprite that moves downward to create scrolling effect.
@@ -27,9 +37,8 @@ class Star(arcade.Sprite):
             speed: Downward movement speed in pixels per second.
             color: RGBA color tuple for the star.
         """
-        # Create a soft circular texture for the star
-        texture = arcade.make_circle_texture(size, color)
-        super().__init__(texture, scale=1.0)
+        # Use a soft circular texture for the star
+        super().__init__(_circle_texture(size, color), scale=1.0)
 
         self.center_x = x
         self.center_y = y
@@ -132,6 +141,20 @@ class StarField:
             color=(255, 255, 255, 255),  # White, fully opaque
         )
 
+        # Number of layers updated and drawn, dropping the far layer first
+        self.active_layers: int = 3
+
+    @property
+    def layers(self) -> tuple[StarLayer, ...]:
+        """Star layers ordered from far to near."""
+        return (self.far_layer, self.mid_layer, self.near_layer)
+
+    @property
+    def visible_layers(self) -> tuple[StarLayer, ...]:
+        """The nearest ``active_layers`` layers, ordered from far to near."""
+        layers = self.layers
+        return layers[len(layers) - max(0, min(self.active_layers, len(layers))) :]
+
     def update(self, delta_time: float = 1 / 60) -> None:
         """
         Update all star layers.
@@ -139,12 +162,10 @@ class StarField:
         Args:
             delta_time: Time elapsed since last update in seconds.
         """
-        self.far_layer.update(delta_time)
-        self.mid_layer.update(delta_time)
-        self.near_layer.update(delta_time)
+        for layer in self.visible_layers:
+            layer.update(delta_time)
 
     def draw(self) -> None:
-        """Render all star layers from far to near."""
-        self.far_layer.draw()
-        self.mid_layer.draw()
-        self.near_layer.draw()
+        """Render all visible star layers from far to near."""
+        for layer in self.visible_layers:
+            layer.draw()
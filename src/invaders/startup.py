@@ -0,0 +1,242 @@
+"""
+Startup benchmark tracking import time with ``python -X importtime``.
+
+Each module is imported in a fresh interpreter, several times over, and the
+median wall-clock time of the whole process is reported together with the
+import time attributed to the module (everything it imports beyond what a
+bare interpreter loads) and the slowest imports behind it. Modules expected
+to stay light are checked for loading Arcade's window, GL and audio stack::
+
+    python -m invaders.startup --repeat 10 --json startup.json --check
+
+Nothing here imports Arcade, so the benchmark measures the same cold start
+the game's command line tools see.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+
+# Modules that must import without loading any of HEAVY_PACKAGES
+LIGHT_MODULES = (
+    "invaders.main",
+    "invaders.settings",
+    "invaders.waves",
+    "invaders.timing",
+    "invaders.input",
+    "invaders.quality",
+    "invaders.power",
+    "invaders.shared_state",
+    "invaders.spectator",
+    "invaders.telemetry",
+    "invaders.leaderboard",
+    "invaders.soak",
+    "invaders.record",
+    "invaders.viewer",
+    "invaders.startup",
+)
+
+# Modules that load Arcade, measured for comparison: the sprite-based game
+# rules, and the window on top of them
+ARCADE_MODULES = ("invaders.simulation", "invaders.game")
+
+# Top-level packages that pull in the window, GL and audio backends
+HEAVY_PACKAGES = ("arcade", "pyglet")
+
+_PREFIX = "import time:"
+
+
+@dataclass
+class ImportTiming:
+    """Import time of one module as reported by ``-X importtime``."""
+
+    name: str
+    self_us: int  # Time spent in the module itself
+    cumulative_us: int  # Including everything it imported
+    depth: int  # 0 for imports made directly by the measured code
+
+
+@dataclass
+class StartupResult:
+    """Median startup cost of importing one module in a fresh interpreter."""
+
+    module: str
+    wall_ms: float  # Whole process, including interpreter startup
+    import_ms: float  # Imports beyond those of a bare interpreter
+    modules_loaded: int  # Modules imported beyond those of a bare interpreter
+    heavy: list[str]  # HEAVY_PACKAGES that were loaded
+    slowest: list[ImportTiming] = field(default_factory=list)  # By self time
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """
+    Parse the report ``-X importtime`` writes to stderr.
+
+    Args:
+        output: Captured stderr of the interpreter.
+
+    Returns:
+        One timing per imported module, in the order imports finished.
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith(_PREFIX):
+            continue
+        columns = line[len(_PREFIX) :].split("|")
+        if len(columns) != 3 or not columns[0].strip().isdigit():
+            # Header, or a cached import listed by -X importtime=2
+            continue
+        name = columns[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(
+            ImportTiming(
+                name=stripped,
+                self_us=int(columns[0]),
+                cumulative_us=int(columns[1]),
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return timings
+
+
+def run_import(code: str) -> tuple[float, list[ImportTiming]]:
+    """
+    Run code in a fresh interpreter with import timing enabled.
+
+    Args:
+        code: Python source passed to ``-c``.
+
+    Returns:
+        Wall-clock seconds the process took, and its import timings.
+
+    Raises:
+        RuntimeError: If the interpreter exits with an error.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"{code!r} failed:\n{result.stderr.strip()}")
+    return elapsed, parse_importtime(result.stderr)
+
+
+def measure(module: str, baseline: set[str], repeat: int = 5, top: int = 5) -> StartupResult:
+    """
+    Measure the startup cost of importing a module.
+
+    Args:
+        module: Dotted module name.
+        baseline: Modules a bare interpreter imports, which are not counted.
+        repeat: Number of fresh interpreters to take the median over.
+        top: Number of slowest imports to keep.
+
+    Returns:
+        The median result.
+    """
+    walls = []
+    imports = []
+    runs = []
+    for _ in range(repeat):
+        wall, timings = run_import(f"import {module}")
+        added = [timing for timing in timings if timing.name not in baseline]
+        walls.append(wall)
+        imports.append(sum(timing.cumulative_us for timing in added if timing.depth == 0))
+        runs.append(added)
+
+    # Break down the run closest to the median
+    median_us = statistics.median(imports)
+    added = runs[min(range(repeat), key=lambda run: abs(imports[run] - median_us))]
+    names = {timing.name for timing in added}
+    return StartupResult(
+        module=module,
+        wall_ms=statistics.median(walls) * 1000,
+        import_ms=median_us / 1000,
+        modules_loaded=len(added),
+        heavy=[package for package in HEAVY_PACKAGES if package in names],
+        slowest=sorted(added, key=lambda timing: timing.self_us, reverse=True)[:top],
+    )
+
+
+def run_benchmark(modules: list[str], repeat: int = 5, top: int = 5) -> list[StartupResult]:
+    """
+    Measure the startup cost of several modules.
+
+    Args:
+        modules: Dotted module names.
+        repeat: Number of fresh interpreters per module.
+        top: Number of slowest imports to keep per module.
+
+    Returns:
+        One result per module, in the order given.
+    """
+    _, timings = run_import("pass")
+    baseline = {timing.name for timing in timings}
+    return [measure(module, baseline, repeat, top) for module in modules]
+
+
+def print_report(results: list[StartupResult]) -> None:
+    """
+    Print a human-readable summary of startup results.
+
+    Args:
+        results: Results to print.
+    """
+    for result in results:
+        heavy = f"  loads {', '.join(result.heavy)}" if result.heavy else ""
+        print(
+            f"{result.module}: {result.wall_ms:.1f} ms process, "
+            f"{result.import_ms:.1f} ms imports, {result.modules_loaded} modules{heavy}"
+        )
+        for timing in result.slowest:
+            print(f"  {timing.self_us / 1000:7.1f} ms  {timing.name}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command line entry point for the startup benchmark.
+
+    Args:
+        argv: Command line arguments, defaults to ``sys.argv[1:]``.
+
+    Returns:
+        Process exit code, non-zero when ``--check`` finds a light module loading Arcade.
+    """
+    parser = argparse.ArgumentParser(description="Measure module import time at startup.")
+    parser.add_argument(
+        "modules", nargs="*", help="modules to measure (default: light and Arcade modules)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument("--top", type=int, default=5, help="slowest imports shown per module")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument(
+        "--check", action="store_true", help="fail if a light module loads arcade or pyglet"
+    )
+    args = parser.parse_args(argv)
+
+    modules = args.modules or [*LIGHT_MODULES, *ARCADE_MODULES]
+    results = run_benchmark(modules, max(args.repeat, 1), args.top)
+    print_report(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([asdict(result) for result in results], f, indent=2)
+
+    if args.check:
+        offenders = [r for r in results if r.heavy and r.module in LIGHT_MODULES]
+        for result in offenders:
+            print(f"FAIL: {result.module} loads {', '.join(result.heavy)}", file=sys.stderr)
+        return 1 if offenders else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
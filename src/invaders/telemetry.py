@@ -0,0 +1,263 @@
+"""
+Gameplay telemetry written in the background.
+
+Game code emits small events (shots, kills, hits, deaths, wave outcomes,
+input latencies and per-second frame statistics) into an in-memory buffer;
+emitting is a single deque append of a tuple and never touches the disk. A
+writer thread drains the buffer in batches and writes them as gzip-compressed
+JSON lines, one object per event, rotating files by size and keeping a
+bounded number::
+
+    {"t":1760853601.512,"event":"kill","alien":3,"x":412.0,"y":388.5,"wave":2}
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from enum import StrEnum
+from pathlib import Path
+
+from invaders.settings import SETTINGS
+
+logger = logging.getLogger(__name__)
+
+# Prefix and suffix of event log file names
+FILE_PREFIX = "events-"
+FILE_SUFFIX = ".jsonl.gz"
+
+
+class Event(StrEnum):
+    """Kinds of telemetry events."""
+
+    SHOT = "shot"
+    KILL = "kill"
+    HIT = "hit"
+    DEATH = "death"
+    WAVE = "wave"
+    FRAMES = "frames"
+    INPUT = "input"
+
+
+# Names of the values emitted with each kind of event, in order
+EVENT_FIELDS: dict[Event, tuple[str, ...]] = {
+    Event.SHOT: ("x",),
+    Event.KILL: ("alien", "x", "y", "wave"),
+    Event.HIT: ("lives", "x"),
+    Event.DEATH: ("cause", "score", "wave"),
+    Event.WAVE: ("wave", "outcome", "seconds", "score"),
+    Event.FRAMES: ("fps", "mean_ms", "max_ms", "quality"),
+    Event.INPUT: ("action", "pressed", "latency_ms"),
+}
+
+
+class EventLog:
+    """
+    Buffers telemetry events and writes them on a background thread.
+
+    ``emit`` is safe to call from the game loop at any rate. If the writer
+    cannot keep up, the buffer holds at most ``capacity`` events and the
+    oldest are dropped.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        flush_interval: float = 1.0,
+        file_bytes: int = 4 * 1024 * 1024,
+        max_files: int = 50,
+        capacity: int = 100_000,
+    ) -> None:
+        """
+        Start the writer thread.
+
+        Args:
+            directory: Directory the event log files are written to.
+            flush_interval: Seconds between two batches written to disk.
+            file_bytes: Uncompressed bytes per file before starting a new one.
+            max_files: Event log files kept in the directory, oldest deleted first.
+            capacity: Events buffered before the oldest are dropped.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.file_bytes = file_bytes
+        self.max_files = max_files
+        self.written: int = 0
+
+        self._events: deque[tuple[float, Event, tuple[object, ...]]] = deque(maxlen=capacity)
+        self._append = self._events.append
+
+        self._file: gzip.GzipFile | None = None
+        self._file_written: int = 0
+        self._files_started: int = 0
+        self._session = time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="invaders-telemetry", daemon=True)
+        self._thread.start()
+
+    def emit(self, event: Event, *values: object) -> None:
+        """
+        Record an event.
+
+        Args:
+            event: Kind of event.
+            *values: The event's values, in the order of ``EVENT_FIELDS``.
+        """
+        self._append((time.time(), event, values))
+
+    def _run(self) -> None:
+        """Write batches until stopped, then write whatever is left."""
+        while not self._stop.wait(self.flush_interval):
+            self._write_batch()
+        self._write_batch()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write_batch(self) -> None:
+        """Drain the buffer and append its events to the current file."""
+        events = self._events
+        count = len(events)
+        if not count:
+            return
+
+        lines = []
+        for _ in range(count):
+            timestamp, event, values = events.popleft()
+            record: dict[str, object] = {"t": round(timestamp, 3), "event": event}
+            for field, value in zip(EVENT_FIELDS[event], values, strict=False):
+                record[field] = round(value, 2) if isinstance(value, float) else value
+            lines.append(json.dumps(record, separators=(",", ":")))
+        data = ("\n".join(lines) + "\n").encode()
+
+        try:
+            if self._file is None or self._file_written >= self.file_bytes:
+                self._rotate()
+            if self._file is None:
+                return
+            self._file.write(data)
+            # Sync flush the compressor, then push the file from the page cache
+            # to the disk, so everything up to here survives a power cut
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except OSError:
+            logger.exception("Failed to write %d telemetry events", count)
+            return
+        self._file_written += len(data)
+        self.written += count
+
+    def _rotate(self) -> None:
+        """Close the current file, start a new one and delete the oldest ones."""
+        if self._file is not None:
+            self._file.close()
+        self._files_started += 1
+        name = f"{FILE_PREFIX}{self._session}-{self._files_started:04d}{FILE_SUFFIX}"
+        self._file = gzip.open(self.directory / name, "wb")
+        self._file_written = 0
+
+        # Names break ties between files modified within the clock's resolution
+        files = sorted(
+            self.directory.glob(f"{FILE_PREFIX}*{FILE_SUFFIX}"),
+            key=lambda p: (p.stat().st_mtime, p.name),
+        )
+        for path in files[: max(len(files) - self.max_files, 0)]:
+            path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Write every buffered event and stop the writer thread."""
+        self._stop.set()
+        self._thread.join()
+
+
+def open_event_log() -> EventLog | None:
+    """
+    Start the event log configured in the settings.
+
+    Returns:
+        The event log, or None if telemetry is disabled.
+    """
+    if SETTINGS.telemetry_path is None:
+        return None
+    return EventLog(
+        SETTINGS.telemetry_path,
+        flush_interval=SETTINGS.telemetry_flush_interval,
+        file_bytes=SETTINGS.telemetry_file_bytes,
+        max_files=SETTINGS.telemetry_max_files,
+    )
+
+
+class FrameStats:
+    """Aggregates frame times and emits them once per interval."""
+
+    def __init__(self, log: EventLog, interval: float = 1.0) -> None:
+        """
+        Initialize empty statistics.
+
+        Args:
+            log: Event log the statistics are emitted to.
+            interval: Seconds covered by each ``frames`` event.
+        """
+        self.log = log
+        self.interval = interval
+        self._start = time.perf_counter()
+        self._frames: int = 0
+        self._total: float = 0.0
+        self._max: float = 0.0
+
+    def record(self, frame_time: float, quality: int) -> None:
+        """
+        Add one frame, emitting the statistics when the interval is over.
+
+        Args:
+            frame_time: Work time of the frame in seconds.
+            quality: Quality level index in effect.
+        """
+        self._frames += 1
+        self._total += frame_time
+        if frame_time > self._max:
+            self._max = frame_time
+
+        now = time.perf_counter()
+        elapsed = now - self._start
+        if elapsed < self.interval:
+            return
+        self.log.emit(
+            Event.FRAMES,
+            round(self._frames / elapsed, 1),
+            round(self._total / self._frames * 1000, 2),
+            round(self._max * 1000, 2),
+            quality,
+        )
+        self._start = now
+        self._frames = 0
+        self._total = 0.0
+        self._max = 0.0
+
+
+def read_events(path: str | Path) -> list[dict[str, object]]:
+    """
+    Read back the events of one event log file.
+
+    Files still being written, or cut off by a power loss, are read up to
+    the last batch that was flushed.
+
+    Args:
+        path: An event log file.
+
+    Returns:
+        The events in the order they were emitted.
+    """
+    events: list[dict[str, object]] = []
+    with gzip.open(path, "rt") as file:
+        try:
+            for line in file:
+                if line.strip():
+                    events.append(json.loads(line))
+        except EOFError:
+            pass  # No end-of-stream marker yet
+    return events
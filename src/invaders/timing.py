@@ -0,0 +1,161 @@
+"""Fixed-rate logic clock and interpolated rendering helpers."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import arcade
+
+# Smallest scheduling interval used when rendering is uncapped
+UNCAPPED_INTERVAL = 1 / 1000
+
+
+def frame_interval(rate: float) -> float:
+    """
+    Convert a rate in Hz to a scheduling interval.
+
+    Args:
+        rate: Calls per second, or 0 (or less) for uncapped.
+
+    Returns:
+        Interval in seconds between calls.
+    """
+    if rate <= 0:
+        return UNCAPPED_INTERVAL
+    return 1.0 / rate
+
+
+class FixedStepClock:
+    """
+    Accumulator that turns variable frame times into fixed-size logic steps.
+
+    Rendering runs at whatever rate the window is driven at, while game logic
+    advances in constant increments of ``step`` seconds. The leftover time is
+    exposed as ``alpha`` so drawing can interpolate between logic states.
+
+    Arcade's own fixed clock (``Window.on_fixed_update``) is not used for two
+    reasons. It belongs to the window, and the split-mode simulation process
+    runs the same loop without one. It also never drops time: capped frames
+    leave their backlog to be caught up later, and there is no way to discard
+    time spent paused, unfocused or loading a new game, which ``reset`` and the
+    ``max_steps`` cap do here. Arcade still ticks its fixed clock for every
+    window, but with no ``on_fixed_update`` handler that costs next to nothing.
+    """
+
+    def __init__(self, rate: float, max_steps: int = 5) -> None:
+        """
+        Initialize the clock.
+
+        Args:
+            rate: Logic updates per second.
+            max_steps: Maximum logic steps run for a single frame. Time beyond
+                this is dropped so a long stall cannot trigger a catch-up spiral.
+        """
+        if rate <= 0:
+            raise ValueError(f"logic rate must be positive, got {rate}")
+
+        self.step: float = 1.0 / rate
+        self.max_steps: int = max_steps
+        self._accumulator: float = 0.0
+
+    def advance(self, delta_time: float) -> int:
+        """
+        Accumulate frame time and return how many logic steps are due.
+
+        Args:
+            delta_time: Time elapsed since last frame in seconds.
+
+        Returns:
+            Number of fixed steps the caller should run this frame.
+        """
+        self._accumulator += delta_time
+        steps = int(self._accumulator / self.step)
+
+        if steps > self.max_steps:
+            # Drop the backlog rather than trying to simulate all of it
+            steps = self.max_steps
+            self._accumulator = 0.0
+        else:
+            self._accumulator -= steps * self.step
+
+        return steps
+
+    def reset(self) -> None:
+        """Discard any accumulated time."""
+        self._accumulator = 0.0
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a logic step elapsed since the last one, in ``[0, 1)``."""
+        return min(self._accumulator / self.step, 1.0)
+
+
+class SpriteInterpolator:
+    """
+    Blends sprite positions between the previous and current logic states.
+
+    Call ``capture`` before each logic step to remember where sprites were,
+    then wrap drawing in ``apply`` / ``restore`` so sprites are shown at the
+    interpolated position without disturbing the simulation state.
+    """
+
+    def __init__(self, snap_distance: float) -> None:
+        """
+        Initialize the interpolator.
+
+        Args:
+            snap_distance: Moves longer than this in one step (such as a star
+                wrapping to the top of the screen) are drawn without blending.
+        """
+        self.snap_distance: float = snap_distance
+        self._previous: dict[arcade.BasicSprite, tuple[float, float]] = {}
+        self._current: list[tuple[arcade.BasicSprite, float, float]] = []
+
+    def capture(self, sprite_lists: Iterable[arcade.SpriteList[arcade.Sprite]]) -> None:
+        """
+        Record sprite positions before a logic step.
+
+        Args:
+            sprite_lists: Sprite lists whose movement should be interpolated.
+        """
+        self._previous = {
+            sprite: sprite.position for sprite_list in sprite_lists for sprite in sprite_list
+        }
+
+    def apply(self, sprite_lists: Iterable[arcade.SpriteList[arcade.Sprite]], alpha: float) -> None:
+        """
+        Move sprites to their interpolated positions for drawing.
+
+        Args:
+            sprite_lists: Sprite lists to interpolate, as passed to ``capture``.
+            alpha: Blend factor between previous (0) and current (1) state.
+        """
+        snap = self.snap_distance
+        self._current = []
+
+        for sprite_list in sprite_lists:
+            for sprite in sprite_list:
+                previous = self._previous.get(sprite)
+                if previous is None:
+                    continue
+
+                x, y = sprite.position
+                prev_x, prev_y = previous
+                if abs(x - prev_x) > snap or abs(y - prev_y) > snap:
+                    continue
+
+                self._current.append((sprite, x, y))
+                sprite.position = (prev_x + (x - prev_x) * alpha, prev_y + (y - prev_y) * alpha)
+
+    def restore(self) -> None:
+        """Put sprites back at their simulated positions after drawing."""
+        for sprite, x, y in self._current:
+            sprite.position = (x, y)
+        self._current = []
+
+    def clear(self) -> None:
+        """Forget all captured state, e.g. after a restart."""
+        self._previous = {}
+        self._current = []
@@ -0,0 +1,63 @@
+"""
+Spectator viewer showing a game streamed by another process.
+
+The window and Arcade are only imported when a window is opened, so
+``--stats`` runs headless without loading them.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from invaders.settings import SETTINGS
+from invaders.spectator import measure
+
+# Port used when neither the command line nor the settings name one
+DEFAULT_PORT = 7777
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command line entry point for the spectator viewer.
+
+    Args:
+        argv: Command line arguments, defaults to ``sys.argv[1:]``.
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(description="Watch a game streamed by a spectator server.")
+    parser.add_argument("--host", default=SETTINGS.spectator_host, help="server address")
+    parser.add_argument(
+        "--port", type=int, default=SETTINGS.spectator_port or DEFAULT_PORT, help="server port"
+    )
+    parser.add_argument(
+        "--stats",
+        type=float,
+        metavar="SECONDS",
+        help="print stream statistics after this many seconds instead of opening a window",
+    )
+    args = parser.parse_args(argv)
+
+    if args.stats is not None:
+        try:
+            stats = asyncio.run(measure(args.host, args.port, args.stats))
+        except OSError as error:
+            print(f"Could not connect to {args.host}:{args.port}: {error}", file=sys.stderr)
+            return 1
+        print(f"keyframes: {stats.keyframes}  deltas: {stats.deltas}  ticks: {stats.last_tick}")
+        print(f"bytes: {stats.total_bytes}  ({stats.bytes_per_second / 1024:.1f} KiB/s)")
+        print(f"max entities: {stats.max_entities}")
+        return 0 if stats.keyframes else 1
+
+    import arcade
+
+    from invaders.viewer_window import SpectatorWindow
+
+    SpectatorWindow(args.host, args.port)
+    arcade.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
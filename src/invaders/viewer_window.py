@@ -0,0 +1,152 @@
+"""Window of the spectator viewer, mirroring a game streamed by another process."""
+
+import asyncio
+import contextlib
+import queue
+import threading
+
+import arcade
+from arcade.types import LRBT
+
+from invaders.explosion import load_explosion_textures
+from invaders.mirror import EntityMirror
+from invaders.settings import SETTINGS
+from invaders.spectator import WorldState, read_message
+from invaders.star import StarField
+
+
+class SpectatorWindow(arcade.Window):
+    """
+    Window that mirrors a game from a spectator server.
+
+    Messages are received on a background thread and applied on the window's
+    own update, so drawing never waits on the network.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        """
+        Create the window and start receiving.
+
+        Args:
+            host: Spectator server address.
+            port: Spectator server port.
+        """
+        super().__init__(
+            width=SETTINGS.screen_width,
+            height=SETTINGS.screen_height,
+            title=f"{SETTINGS.screen_title} - Spectator",
+            resizable=True,
+        )
+        self.camera = arcade.Camera2D(
+            position=(0, 0),
+            projection=LRBT(
+                left=0, right=SETTINGS.screen_width, bottom=0, top=SETTINGS.screen_height
+            ),
+            viewport=self.rect,
+        )
+        self.background_color = arcade.color.BLACK
+
+        self.world = WorldState()
+        self.mirror = EntityMirror(load_explosion_textures())
+        self.starfield = StarField()
+        self.connected: bool = True
+
+        # Message bodies from the receiver thread; None marks the end of the stream
+        self._messages: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+        self._receiver = threading.Thread(
+            target=asyncio.run,
+            args=(self._receive(host, port),),
+            name="invaders-viewer",
+            daemon=True,
+        )
+        self._receiver.start()
+
+    async def _receive(self, host: str, port: int) -> None:
+        """Forward messages from the server until it disconnects."""
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            self._messages.put(None)
+            return
+        try:
+            while True:
+                self._messages.put(await read_message(reader))
+        except asyncio.IncompleteReadError:
+            pass  # Server closed the stream
+        except ConnectionError:
+            pass
+        finally:
+            self._messages.put(None)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    def on_update(self, delta_time: float) -> None:
+        """
+        Apply received messages and move the sprites to the latest state.
+
+        Args:
+            delta_time: Time elapsed since last update in seconds.
+        """
+        self.starfield.update(delta_time)
+
+        changed = False
+        while True:
+            try:
+                message = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if message is None:
+                self.connected = False
+                break
+            self.world.apply(message)
+            changed = True
+
+        if changed:
+            self.mirror.sync(self.world.entities.values(), self.world.alien_scale)
+
+    def on_draw(self) -> None:
+        """Render the mirrored game."""
+        self.clear()
+        self.camera.use()
+
+        self.starfield.draw()
+        for sprite_list in self.mirror.sprite_lists:
+            sprite_list.draw()
+
+        arcade.draw_text(
+            text=f"Score: {self.world.score}   Lives: {self.world.lives}   Wave: {self.world.wave}",
+            x=10,
+            y=SETTINGS.screen_height - 30,
+            color=arcade.color.WHITE,
+            font_size=16,
+        )
+
+        if not self.connected:
+            status = "DISCONNECTED"
+        elif self.world.game_over:
+            status = "GAME OVER"
+        elif self.world.game_won:
+            status = "YOU WIN!"
+        else:
+            status = ""
+        if status:
+            arcade.draw_text(
+                text=status,
+                x=SETTINGS.screen_width / 2,
+                y=SETTINGS.screen_height / 2,
+                color=arcade.color.YELLOW,
+                font_size=32,
+                anchor_x="center",
+            )
+
+    def on_resize(self, width: int, height: int) -> None:
+        """
+        Handle window resize events.
+
+        Args:
+            width: New window width.
+            height: New window height.
+        """
+        super().on_resize(width, height)
+        self.camera.viewport = self.rect
@@ -0,0 +1,131 @@
+"""Procedurally generated alien waves."""
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+from invaders.settings import SETTINGS
+
+# Free space kept between the formation and the screen edges
+FORMATION_MARGIN_X = 60.0
+FORMATION_TOP = 100.0  # Distance of the first row below the top of the screen
+FORMATION_BOTTOM = 260.0  # Lowest y the last row may start at
+
+# Alien sprite scale at the default spacing
+ALIEN_SCALE = 0.4
+
+
+def _grid(row: int, col: int, rows: int, columns: int) -> bool:
+    """Fill every cell."""
+    return True
+
+
+def _checker(row: int, col: int, rows: int, columns: int) -> bool:
+    """Fill alternating cells."""
+    return (row + col) % 2 == 0
+
+
+def _wedge(row: int, col: int, rows: int, columns: int) -> bool:
+    """Fill a downward-pointing wedge, widest at the top."""
+    center = (columns - 1) / 2
+    half_width = center * (rows - row) / rows
+    return abs(col - center) <= half_width + 0.5
+
+
+def _hollow(row: int, col: int, rows: int, columns: int) -> bool:
+    """Fill the outline of the formation."""
+    return row in (0, rows - 1) or col in (0, columns - 1)
+
+
+# Formation patterns, cycled through wave by wave
+PATTERNS: dict[str, Callable[[int, int, int, int], bool]] = {
+    "grid": _grid,
+    "checker": _checker,
+    "wedge": _wedge,
+    "hollow": _hollow,
+}
+
+
+@dataclass(frozen=True)
+class WaveSpec:
+    """Layout and difficulty of a single alien wave."""
+
+    number: int
+    rows: int
+    columns: int
+    spacing: float
+    scale: float
+    speed: float
+    shoot_chance: float
+    pattern: str = "grid"
+
+    def positions(self) -> Iterator[tuple[float, float, int]]:
+        """
+        Lazily yield the aliens of this wave, top row first.
+
+        Yields:
+            (x, y, alien_type) for every cell the pattern fills.
+        """
+        include = PATTERNS[self.pattern]
+        start_x = (SETTINGS.screen_width - (self.columns - 1) * self.spacing) / 2
+        start_y = SETTINGS.screen_height - FORMATION_TOP
+
+        for row in range(self.rows):
+            for col in range(self.columns):
+                if include(row, col, self.rows, self.columns):
+                    yield start_x + col * self.spacing, start_y - row * self.spacing, row
+
+
+def make_wave(number: int, pattern: str = "grid") -> WaveSpec:
+    """
+    Build the spec for a wave, growing and speeding up with the wave number.
+
+    Wave 1 matches the classic formation from the settings.
+
+    Args:
+        number: 1-based wave number.
+        pattern: Name of the formation pattern in ``PATTERNS``.
+
+    Returns:
+        The wave spec.
+    """
+    growth = (number - 1) // 2
+    rows = min(SETTINGS.alien_rows + growth, SETTINGS.max_alien_rows)
+    columns = min(SETTINGS.alien_columns + growth * 2, SETTINGS.max_alien_columns)
+
+    # Shrink spacing (and sprites with it) so big waves still fit on screen
+    usable_width = SETTINGS.screen_width - 2 * FORMATION_MARGIN_X
+    usable_height = SETTINGS.screen_height - FORMATION_TOP - FORMATION_BOTTOM
+    spacing = min(
+        SETTINGS.alien_spacing,
+        usable_width / max(columns - 1, 1),
+        usable_height / max(rows - 1, 1),
+    )
+
+    difficulty = min(1.0 + 0.1 * (number - 1), SETTINGS.max_wave_difficulty)
+    return WaveSpec(
+        number=number,
+        rows=rows,
+        columns=columns,
+        spacing=spacing,
+        scale=ALIEN_SCALE * spacing / SETTINGS.alien_spacing,
+        speed=SETTINGS.alien_speed * difficulty,
+        shoot_chance=0.02 * difficulty,
+        pattern=pattern,
+    )
+
+
+def generate_waves(start: int = 1) -> Iterator[WaveSpec]:
+    """
+    Lazily generate an endless sequence of waves.
+
+    Args:
+        start: Number of the first wave to generate.
+
+    Yields:
+        Wave specs with growing size, speed and varying patterns.
+    """
+    patterns = list(PATTERNS)
+    number = start
+    while True:
+        yield make_wave(number, patterns[(number - 1) % len(patterns)])
+        number += 1
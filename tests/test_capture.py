@@ -0,0 +1,119 @@
+"""Tests for writing captured frames, which needs no GL context."""
+
+import threading
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from invaders.capture import FrameWriter
+
+RED = bytes((255, 0, 0, 0))
+BLUE = bytes((0, 0, 255, 0))
+
+
+def gl_rows(width: int, top: bytes, bottom: bytes) -> bytearray:
+    """Pixels of a 4-row frame as glReadPixels returns them: bottom row first."""
+    return bytearray(bottom * width * 2 + top * width * 2)
+
+
+def test_png_frames_are_written_top_down(tmp_path: Path) -> None:
+    writer = FrameWriter(tmp_path / "frames", "png")
+    for frame in range(3):
+        writer.submit(frame, (4, 4), gl_rows(4, top=RED, bottom=BLUE))
+    writer.close()
+
+    assert writer.written == 3
+    files = sorted(path.name for path in (tmp_path / "frames").iterdir())
+    assert files == ["frame_000000.png", "frame_000001.png", "frame_000002.png"]
+    with Image.open(tmp_path / "frames" / "frame_000001.png") as image:
+        assert image.mode == "RGB"
+        assert image.size == (4, 4)
+        assert image.getpixel((0, 0)) == (255, 0, 0)
+        assert image.getpixel((3, 3)) == (0, 0, 255)
+
+
+def test_yuv_frames_are_planar_i420(tmp_path: Path) -> None:
+    output = tmp_path / "run.yuv"
+    writer = FrameWriter(output, "yuv")
+    writer.submit(0, (4, 4), gl_rows(4, top=RED, bottom=BLUE))
+    writer.submit(1, (4, 4), gl_rows(4, top=BLUE, bottom=RED))
+    writer.close()
+
+    data = output.read_bytes()
+    frame_size = 4 * 4 + 2 * (2 * 2)  # Full size luma, two quarter size chroma planes
+    assert len(data) == 2 * frame_size
+
+    luma, cb, cr = data[:16], data[16:20], data[20:24]
+    assert luma == bytes([76] * 8 + [29] * 8)  # Red rows on top, then blue
+    assert cb == bytes([84, 84, 255, 255])
+    assert cr == bytes([255, 255, 107, 107])
+    assert data[frame_size : frame_size + 16] == bytes([29] * 8 + [76] * 8)
+
+
+def test_drop_policy_skips_frames_without_a_free_buffer(tmp_path: Path) -> None:
+    writer = FrameWriter(tmp_path, "png", policy="drop")
+    try:
+        assert writer.acquire() is None
+        assert writer.dropped == 1
+
+        writer.free.put(bytearray(4 * 4 * 4))
+        assert writer.acquire() is not None
+        assert writer.dropped == 1
+    finally:
+        writer.close()
+
+
+def test_wait_policy_blocks_until_the_writer_hands_a_buffer_back(tmp_path: Path) -> None:
+    writer = FrameWriter(tmp_path, "png", policy="wait")
+    writer.free.put(bytearray(4 * 4 * 4))
+    try:
+        pixels = writer.acquire()
+        assert pixels is not None
+        pixels[:] = gl_rows(4, top=RED, bottom=BLUE)
+
+        # Nothing is free until the thread has decoded the frame just submitted
+        writer.submit(0, (4, 4), pixels)
+        assert writer.acquire() is pixels
+        assert writer.dropped == 0
+    finally:
+        writer.close()
+    assert writer.written == 1
+
+
+def test_wait_policy_counts_the_time_spent_waiting(tmp_path: Path) -> None:
+    writer = FrameWriter(tmp_path, "png", policy="wait")
+    pixels = bytearray(4)
+    timer = threading.Timer(0.05, writer.free.put, (pixels,))
+    timer.start()
+    try:
+        assert writer.acquire() is pixels
+    finally:
+        timer.join()
+        writer.close()
+    assert writer.waited >= 0.04
+
+
+def test_close_raises_the_error_from_the_writer_thread(tmp_path: Path) -> None:
+    output = tmp_path / "frames"
+    writer = FrameWriter(output, "png")
+    # Replace the output directory with a file so every save fails
+    output.rmdir()
+    output.write_bytes(b"")
+
+    pixels = gl_rows(4, top=RED, bottom=BLUE)
+    writer.submit(0, (4, 4), pixels)
+    writer.submit(1, (4, 4), gl_rows(4, top=RED, bottom=BLUE))
+    with pytest.raises(OSError):
+        writer.close()
+
+    assert writer.written == 0
+    # Buffers still come back, so a waiting game is never stuck behind a failed writer
+    assert writer.free.qsize() == 2
+
+
+def test_unknown_format_and_policy_are_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="format"):
+        FrameWriter(tmp_path, "gif")
+    with pytest.raises(ValueError, match="policy"):
+        FrameWriter(tmp_path, "png", policy="block")
@@ -0,0 +1,36 @@
+"""Tests for the axis-aligned collision mode."""
+
+import random
+
+import arcade
+
+from invaders.hitbox import check_for_collision, check_for_collision_with_list
+
+
+def make_sprite(x: float, y: float, angle: float = 0.0, scale: float = 1.0) -> arcade.Sprite:
+    sprite = arcade.SpriteSolidColor(20, 10, x, y, color=arcade.color.WHITE)
+    sprite.angle = angle
+    sprite.scale = scale
+    return sprite
+
+
+def test_aabb_agrees_with_polygon_test() -> None:
+    rng = random.Random(1)
+    for _ in range(500):
+        a = make_sprite(rng.uniform(0, 60), rng.uniform(0, 60), rng.choice([0, 180, 45]))
+        b = make_sprite(rng.uniform(0, 60), rng.uniform(0, 60), scale=rng.uniform(0.5, 2.0))
+        expected = arcade.check_for_collision(a, b)
+        assert check_for_collision(a, b, "aabb") == expected
+        assert check_for_collision(a, b, "polygon") == expected
+
+
+def test_list_matches_pairwise_checks() -> None:
+    rng = random.Random(2)
+    others: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList()
+    for _ in range(200):
+        others.append(make_sprite(rng.uniform(0, 200), rng.uniform(0, 200), rng.choice([0, 90])))
+    sprite = make_sprite(100, 100, scale=3.0)
+    expected = [other for other in others if arcade.check_for_collision(sprite, other)]
+    assert expected
+    assert check_for_collision_with_list(sprite, others, "aabb") == expected
+    assert check_for_collision_with_list(sprite, others, "polygon") == expected
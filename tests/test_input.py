@@ -0,0 +1,133 @@
+"""Tests for polled input and latency measurement."""
+
+import pytest
+
+from invaders import input as input_module
+from invaders.input import Action, InputState, LatencyStats
+
+LEFT, RIGHT, FIRE, OTHER = 1, 2, 3, 4
+BINDINGS = {LEFT: Action.LEFT, RIGHT: Action.RIGHT, FIRE: Action.FIRE}
+STEP = 1 / 60
+
+
+class FakeClock:
+    """Manually advanced stand-in for ``time.perf_counter``."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(input_module.time, "perf_counter", clock)
+    return clock
+
+
+def test_only_bound_keys_are_tracked() -> None:
+    state = InputState(BINDINGS)
+    assert state.press(LEFT)
+    assert not state.press(OTHER)
+    assert not state.release(OTHER)
+    assert state.held == Action.LEFT
+
+
+def test_last_pressed_direction_wins() -> None:
+    state = InputState(BINDINGS)
+    state.press(LEFT)
+    state.press(RIGHT)
+    assert state.sample(STEP).direction == 1
+    state.release(RIGHT)
+    assert state.sample(STEP).direction == -1
+    state.release(LEFT)
+    assert state.sample(STEP).direction == 0
+
+
+def test_tap_between_steps_still_fires(clock: FakeClock) -> None:
+    state = InputState(BINDINGS, fire_buffer_time=0.15)
+    state.press(FIRE)
+    state.release(FIRE)
+    assert state.sample(STEP).fire
+    state.consume_fire()
+    assert not state.sample(STEP).fire
+
+
+def test_unused_fire_press_expires_after_its_logic_time() -> None:
+    state = InputState(BINDINGS, fire_buffer_time=0.15)
+    state.press(FIRE)
+    assert [state.sample(0.1).fire for _ in range(3)] == [True, True, False]
+
+
+def test_stall_does_not_expire_a_fire_press(clock: FakeClock) -> None:
+    state = InputState(BINDINGS, fire_buffer_time=0.15)
+    state.press(FIRE)
+    clock.now += 1.0  # No steps ran meanwhile
+    assert state.sample(STEP).fire
+
+
+def test_latency_runs_from_event_to_drawn_frame(clock: FakeClock) -> None:
+    state = InputState(BINDINGS)
+    state.press(LEFT)
+    clock.now += 0.004
+    assert state.frame_drawn() == []  # Not sampled by a logic step yet
+    state.sample(STEP)
+    clock.now += 0.010
+    (latency,) = state.frame_drawn()
+    assert latency.action is Action.LEFT
+    assert latency.pressed
+    assert latency.latency == pytest.approx(0.014)
+    assert state.frame_drawn() == []
+
+
+def test_events_wait_for_the_frame_showing_their_step(clock: FakeClock) -> None:
+    state = InputState(BINDINGS)
+    state.press(LEFT)
+    state.sample(STEP)
+    state.press(FIRE)
+    state.sample(STEP)
+    clock.now += 0.020
+    # As in split mode, with the process not done with the last two steps
+    assert state.frame_drawn(pending_steps=2) == []
+    (latency,) = state.frame_drawn(pending_steps=1)
+    assert latency.action is Action.LEFT
+    clock.now += 0.010
+    (latency,) = state.frame_drawn()
+    assert latency.action is Action.FIRE
+    assert latency.latency == pytest.approx(0.030)
+
+
+def test_reset_drops_events_from_while_the_game_was_stopped(clock: FakeClock) -> None:
+    state = InputState(BINDINGS)
+    state.press(FIRE)
+    state.release(FIRE)
+    clock.now += 60.0  # Game over screen: no steps sample the events
+    state.reset()
+    state.press(RIGHT)
+    state.sample(STEP)
+    clock.now += 0.010
+    (latency,) = state.frame_drawn()
+    assert latency.latency == pytest.approx(0.010)
+    assert state.held == Action.RIGHT
+
+
+def test_release_all_forgets_held_keys_and_pending_events() -> None:
+    state = InputState(BINDINGS)
+    state.press(LEFT)
+    state.press(FIRE)
+    state.release_all()
+    sample = state.sample(STEP)
+    assert (sample.direction, sample.fire) == (0, False)
+    assert state.frame_drawn() == []
+
+
+def test_latency_percentiles() -> None:
+    stats = LatencyStats(window=100)
+    assert stats.percentile(50) == 0.0
+    for ms in range(1, 101):
+        stats.add(ms / 1000)
+    assert stats.percentile(50) == pytest.approx(0.051)
+    assert stats.percentile(99) == pytest.approx(0.100)
+    assert "100 events" in stats.summary()
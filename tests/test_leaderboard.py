@@ -0,0 +1,61 @@
+"""Tests for the local high-score table."""
+
+from pathlib import Path
+
+from invaders.leaderboard import Leaderboard
+
+
+def test_scores_rank_immediately_and_persist(tmp_path: Path) -> None:
+    path = tmp_path / "scores.db"
+    board = Leaderboard(path, size=3)
+    assert board.loaded.wait(5)
+    entries = [board.submit(score, wave=1) for score in (50, 300, 120, 10)]
+    assert [entry.score for entry in board.top] == [300, 120, 50]
+    assert [board.rank(entry) for entry in entries] == [3, 1, 2, None]
+    board.close()
+
+    reopened = Leaderboard(path, size=3)
+    try:
+        assert reopened.loaded.wait(5)
+        assert [entry.score for entry in reopened.top] == [300, 120, 50]
+    finally:
+        reopened.close()
+
+
+def test_earlier_game_wins_a_tie(tmp_path: Path) -> None:
+    board = Leaderboard(tmp_path / "scores.db", size=2)
+    try:
+        first = board.submit(100, wave=1)
+        second = board.submit(100, wave=2)
+        assert board.rank(first) == 1
+        assert board.rank(second) == 2
+    finally:
+        board.close()
+
+
+def test_scores_submitted_while_loading_are_kept(tmp_path: Path) -> None:
+    path = tmp_path / "scores.db"
+    board = Leaderboard(path)
+    board.submit(40, wave=1)
+    board.close()
+
+    # Submitted before the stored scores are merged in
+    board = Leaderboard(path)
+    board.submit(70, wave=2)
+    board.loaded.wait(5)
+    try:
+        assert [entry.score for entry in board.top] == [70, 40]
+    finally:
+        board.close()
+
+
+def test_unusable_database_still_ranks_this_session(tmp_path: Path) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+    board = Leaderboard(blocker / "scores.db")
+    try:
+        assert board.loaded.wait(5)
+        entry = board.submit(10, wave=1)
+        assert board.rank(entry) == 1
+    finally:
+        board.close()
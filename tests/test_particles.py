@@ -0,0 +1,125 @@
+"""Tests for the particle pool, which needs no GL context."""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from invaders.particles import DEBRIS, SPARKS, EffectStyle, ParticlePool
+from invaders.simulation import Effect
+
+
+def still_style(life: float, count: float = 10) -> EffectStyle:
+    """Particles that stay where they spawn for exactly ``life`` seconds."""
+    return EffectStyle(
+        count=count,
+        speed=(0.0, 0.0),
+        life=(life, life),
+        size=(2.0, 2.0),
+        gravity=0.0,
+        colors=((255, 255, 255),),
+    )
+
+
+@pytest.fixture
+def pool() -> ParticlePool:
+    random.seed(0)
+    return ParticlePool(capacity=1000)
+
+
+def test_emit_spawns_count_per_source(pool: ParticlePool) -> None:
+    assert pool.emit(DEBRIS, (100.0, 200.0)) == 40
+    assert pool.emit(DEBRIS, [(10.0, 20.0), (30.0, 40.0)]) == 80
+    assert pool.count == 120
+    assert pool.emit(DEBRIS, []) == 0
+
+    positions = pool.vertices()["pos"]
+    assert positions[0].tolist() == [100.0, 200.0]
+    assert {tuple(position) for position in positions[40:].tolist()} == {
+        (10.0, 20.0),
+        (30.0, 40.0),
+    }
+
+
+def test_add_effects_batches_by_kind(pool: ParticlePool) -> None:
+    pool.add_effects(
+        [(Effect.DEBRIS, 0.0, 0.0), (Effect.SPARKS, 5.0, 5.0), (Effect.DEBRIS, 9.0, 9.0)]
+    )
+    assert pool.count == 2 * DEBRIS.count + SPARKS.count
+
+
+def test_particles_expire_at_the_end_of_their_life(pool: ParticlePool) -> None:
+    pool.emit(still_style(0.5), (0.0, 100.0))
+    pool.update(0.3)
+    assert pool.count == 10
+    pool.update(0.3)
+    assert pool.count == 0
+    assert len(pool.vertices()) == 0
+
+
+def test_survivors_are_packed_to_the_front(pool: ParticlePool) -> None:
+    pool.emit(still_style(0.2), (10.0, 100.0))
+    pool.emit(still_style(1.0, count=5), (50.0, 100.0))
+    pool.emit(still_style(0.2), (10.0, 100.0))
+
+    pool.update(0.5)
+    assert pool.count == 5
+    assert pool.vertices()["pos"].tolist() == [[50.0, 100.0]] * 5
+
+
+def test_particles_falling_off_screen_are_culled(pool: ParticlePool) -> None:
+    falling = EffectStyle(
+        count=10,
+        speed=(100.0, 100.0),
+        life=(5.0, 5.0),
+        size=(2.0, 2.0),
+        gravity=0.0,
+        colors=((255, 255, 255),),
+        angle=-math.pi / 2,
+        spread=0.0,
+    )
+    pool.emit(falling, (0.0, -10.0))
+    pool.update(0.01)  # Down to -11
+    assert pool.count == 10
+    pool.update(0.1)  # Down to -21
+    assert pool.count == 0
+
+
+def test_emission_stops_at_capacity() -> None:
+    pool = ParticlePool(capacity=50)
+    assert pool.emit(DEBRIS, (0.0, 0.0)) == 40
+    assert pool.emit(DEBRIS, (0.0, 0.0)) == 10
+    assert pool.emit(DEBRIS, (0.0, 0.0)) == 0
+    assert pool.count == 50
+
+    # Room is made again once particles die
+    pool.update(DEBRIS.life[1] + 0.01)
+    assert pool.count == 0
+    assert pool.emit(DEBRIS, (0.0, 0.0)) == 40
+
+
+def test_intensity_scales_the_particles_spawned() -> None:
+    pool = ParticlePool(capacity=10_000, intensity=0.5)
+    assert pool.emit(DEBRIS, (0.0, 0.0)) == 20
+
+    # Fractional counts are rounded at random so they average out
+    random.seed(1)
+    pool = ParticlePool(capacity=10_000, intensity=0.25)
+    spawned = sum(pool.emit(still_style(1.0, count=1), (0.0, 0.0)) for _ in range(4000))
+    assert spawned == pytest.approx(1000, rel=0.1)
+
+
+def test_particles_fade_out_over_their_life(pool: ParticlePool) -> None:
+    pool.emit(still_style(1.0), (0.0, 100.0))
+    assert set(pool.vertices()["color"][:, 3].tolist()) == {255}
+    pool.update(0.5)
+    alpha = pool.vertices()["color"][:, 3]
+    assert np.all(np.abs(alpha.astype(int) - 127) <= 1)
+
+
+def test_clear_removes_every_particle(pool: ParticlePool) -> None:
+    pool.emit(DEBRIS, (0.0, 0.0))
+    pool.clear()
+    assert pool.count == 0
+    assert len(pool.vertices()) == 0
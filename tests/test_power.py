@@ -0,0 +1,60 @@
+"""Tests for power mode selection."""
+
+from invaders.power import PowerManager, PowerMode
+
+
+def make_manager(pause_when_unfocused: bool = True) -> PowerManager:
+    return PowerManager(1 / 60, 0.1, 0.25, pause_when_unfocused=pause_when_unfocused)
+
+
+def test_modes_follow_window_and_game_state() -> None:
+    power = make_manager()
+    assert power.mode is PowerMode.ACTIVE
+
+    power.static = True
+    assert power.refresh()
+    assert power.mode is PowerMode.IDLE
+    assert power.interval == 0.1
+
+    power.focused = False
+    assert power.refresh()
+    assert power.mode is PowerMode.BACKGROUND
+
+    power.focused = True
+    power.static = False
+    assert power.refresh()
+    assert power.mode is PowerMode.ACTIVE
+    assert not power.refresh()
+
+
+def test_unfocused_keeps_running_when_configured() -> None:
+    power = make_manager(pause_when_unfocused=False)
+    power.focused = False
+    assert not power.refresh()
+    assert power.mode is PowerMode.ACTIVE
+
+    power.visible = False
+    power.refresh()
+    assert power.mode is PowerMode.BACKGROUND
+
+
+def test_static_screens_redraw_only_when_invalidated() -> None:
+    power = make_manager()
+    power.static = True
+    power.refresh()
+
+    # The mode change itself asks for one redraw
+    assert power.should_draw()
+    assert not power.should_draw()
+
+    power.invalidate()
+    assert power.should_draw()
+    assert not power.should_draw()
+
+
+def test_hidden_window_never_draws() -> None:
+    power = make_manager()
+    power.visible = False
+    power.refresh()
+    power.invalidate()
+    assert not power.should_draw()
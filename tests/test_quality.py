@@ -0,0 +1,85 @@
+"""Tests for the adaptive quality governor."""
+
+import pytest
+
+from invaders.quality import QUALITY_LEVELS, QualityGovernor
+
+
+class FakeClock:
+    """Manually advanced clock for the governor's cooldown."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_governor(clock: FakeClock) -> QualityGovernor:
+    return QualityGovernor(budget=0.010, window=4, cooldown=1.0, headroom=0.5, clock=clock)
+
+
+def test_waits_for_a_full_window() -> None:
+    clock = FakeClock()
+    governor = make_governor(clock)
+    clock.now = 10.0
+    for _ in range(3):
+        assert governor.record(0.050) is None
+    assert governor.record(0.050) is QUALITY_LEVELS[1]
+
+
+def test_steps_down_and_back_up_with_cooldown() -> None:
+    clock = FakeClock()
+    governor = make_governor(clock)
+    clock.now = 10.0
+    for _ in range(4):
+        governor.record(0.020)
+    assert governor.level_index == 1
+
+    # Within the cooldown nothing changes, however fast the frames are
+    for _ in range(4):
+        assert governor.record(0.002) is None
+    assert governor.level_index == 1
+
+    clock.now = 20.0
+    assert governor.record(0.002) is QUALITY_LEVELS[0]
+    assert [d.reason for d in governor.decisions] == ["over budget", "headroom"]
+
+
+def test_stays_put_inside_the_band() -> None:
+    clock = FakeClock()
+    governor = make_governor(clock)
+    clock.now = 10.0
+    for _ in range(20):
+        assert governor.record(0.008) is None
+    assert governor.level_index == 0
+
+
+def test_never_goes_past_the_cheapest_level() -> None:
+    clock = FakeClock()
+    governor = make_governor(clock)
+    for step in range(len(QUALITY_LEVELS) + 2):
+        clock.now = 10.0 * (step + 1)
+        for _ in range(4):
+            governor.record(1.0)
+    assert governor.level is QUALITY_LEVELS[-1]
+
+
+def test_set_level_notifies_and_validates() -> None:
+    governor = make_governor(FakeClock())
+    changes = []
+    governor.on_change = changes.append
+    governor.set_level(2)
+    assert changes == [QUALITY_LEVELS[2]]
+    with pytest.raises(ValueError):
+        governor.set_level(len(QUALITY_LEVELS))
+
+
+def test_disabled_governor_keeps_its_level() -> None:
+    clock = FakeClock()
+    governor = make_governor(clock)
+    governor.enabled = False
+    clock.now = 10.0
+    for _ in range(8):
+        assert governor.record(1.0) is None
+    assert governor.level_index == 0
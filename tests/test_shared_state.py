@@ -0,0 +1,110 @@
+"""Tests for the shared-memory state and input blocks."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from invaders.shared_state import (
+    Controls,
+    EntityKind,
+    SharedInput,
+    SharedState,
+    next_entity_id,
+)
+
+
+@pytest.fixture
+def state() -> Iterator[SharedState]:
+    state = SharedState(capacity=8)
+    yield state
+    state.close()
+
+
+def test_nothing_to_read_before_the_first_frame(state: SharedState) -> None:
+    assert state.read() is None
+
+
+def test_reader_sees_the_published_frame(state: SharedState) -> None:
+    with state.frame() as frame:
+        frame.score = 120
+        frame.lives = 2
+        frame.game_over = True
+        frame.inputs = 9
+        frame.fires = 4
+        frame.fired = 3
+        frame.sound_counts[1] += 1
+        frame.add((7, EntityKind.ALIEN, 10.5, 20.0, 3))
+        frame.add((8, EntityKind.EXPLOSION, 1.0, 2.0, 300))
+
+    reader = SharedState(state.name, capacity=8)
+    try:
+        published = reader.read()
+        assert published is not None
+        entities = list(published.entities())
+        assert SharedState.is_consistent(published)
+        assert (published.score, published.lives, published.game_over) == (120, 2, True)
+        assert (published.inputs, published.fires, published.fired) == (9, 4, 3)
+        assert published.sound_counts[1] == 1
+        assert entities == [
+            (7, EntityKind.ALIEN, 10.5, 20.0, 3),
+            (8, EntityKind.EXPLOSION, 1.0, 2.0, 255),
+        ]
+    finally:
+        reader.close()
+
+
+def test_sound_counts_carry_over(state: SharedState) -> None:
+    with state.frame() as frame:
+        frame.sound_counts[0] += 2
+    with state.frame() as frame:
+        assert frame.sound_counts[0] == 2
+
+
+def test_entities_beyond_capacity_are_dropped(state: SharedState) -> None:
+    with state.frame() as frame:
+        for i in range(20):
+            frame.add((i, EntityKind.PLAYER_BULLET, 0.0, 0.0, 0))
+    published = state.read()
+    assert published is not None
+    assert published.count == 8
+
+
+def test_overwritten_read_is_detected(state: SharedState) -> None:
+    with state.frame() as frame:
+        frame.add((1, EntityKind.ALIEN, 0.0, 0.0, 0))
+    published = state.read()
+    assert published is not None
+
+    # Two more frames wrap around the double buffer onto the slot being read
+    for _ in range(2):
+        with state.frame():
+            pass
+    assert not SharedState.is_consistent(published)
+
+
+def test_write_in_progress_is_not_read(state: SharedState) -> None:
+    with state.frame():
+        pass
+    with state.frame():
+        # The back slot is not published until the block exits
+        published = state.read()
+        assert published is not None
+        assert published.frame == 1
+
+
+def test_controls_round_trip() -> None:
+    inputs = SharedInput()
+    try:
+        controls = Controls(sequence=7, direction=-1, fires=3, restarts=1, paused=True)
+        inputs.write(controls)
+        reader = SharedInput(inputs.name)
+        assert reader.read() == controls
+        reader.close()
+    finally:
+        inputs.close()
+
+
+def test_entity_ids_are_never_reused() -> None:
+    ids = [next_entity_id() for _ in range(1000)]
+    assert len(set(ids)) == len(ids)
+    assert min(ids) > 0
@@ -0,0 +1,58 @@
+"""Tests for the soak test's trend analysis."""
+
+import pytest
+
+from invaders.soak import SoakSample, analyze, growth_per_hour
+
+
+def make_samples(
+    bytes_per_hour: float, objects_per_hour: float, count: int = 10
+) -> list[SoakSample]:
+    samples = []
+    for index in range(count):
+        hours = index / 2
+        samples.append(
+            SoakSample(
+                frame=index * 1000,
+                elapsed=hours * 3600,
+                restarts=index,
+                traced_bytes=int(1_000_000 + bytes_per_hour * hours),
+                object_counts={"game.Thing": int(100 + objects_per_hour * hours)},
+                sprite_lists={"aliens": 50},
+                atlas_textures=20,
+                atlas_images=20,
+                atlas_size=(512, 512),
+            )
+        )
+    return samples
+
+
+def test_growth_per_hour() -> None:
+    assert growth_per_hour([0, 1800, 3600], [0, 5, 10]) == pytest.approx(10)
+    assert growth_per_hour([0], [5]) == 0.0
+    assert growth_per_hour([60, 60], [1, 2]) == 0.0
+
+
+def test_flat_run_passes() -> None:
+    report = analyze(make_samples(0, 0), max_bytes_per_hour=1024, max_objects_per_hour=10)
+    assert report.verdict == "pass"
+    assert report.frames == 9000
+    assert report.restarts == 9
+    assert report.duration == pytest.approx(4.5 * 3600)
+
+
+def test_memory_growth_fails() -> None:
+    report = analyze(make_samples(1e6, 0), max_bytes_per_hour=1024, max_objects_per_hour=10)
+    assert report.verdict == "fail"
+    assert report.traced_bytes_per_hour == pytest.approx(1e6, rel=1e-3)
+
+
+def test_growing_object_type_fails() -> None:
+    report = analyze(make_samples(0, 100), max_bytes_per_hour=1024, max_objects_per_hour=10)
+    assert report.verdict == "fail"
+    assert set(report.growing_types) == {"game.Thing"}
+
+
+def test_short_run_is_inconclusive() -> None:
+    report = analyze(make_samples(0, 0, count=2), max_bytes_per_hour=1024, max_objects_per_hour=10)
+    assert report.verdict == "inconclusive"
@@ -0,0 +1,148 @@
+"""Tests for spectator streaming, from the encoder to a viewer on localhost."""
+
+import asyncio
+
+from invaders.shared_state import Entity, EntityKind
+from invaders.spectator import (
+    DeltaEncoder,
+    MessageType,
+    Snapshot,
+    SpectatorServer,
+    WorldState,
+    read_message,
+)
+
+
+def make_snapshot(entities: list[Entity], score: int = 0) -> Snapshot:
+    return Snapshot(
+        score=score,
+        lives=3,
+        wave=1,
+        game_over=False,
+        game_won=False,
+        alien_scale=0.4,
+        entities=entities,
+    )
+
+
+def decode(world: WorldState, message: bytes) -> MessageType:
+    """Apply a length-prefixed message to a world."""
+    return world.apply(message[4:])
+
+
+def positions(world: WorldState) -> set[tuple[EntityKind, float, float, int]]:
+    return {(kind, x, y, subtype) for _, kind, x, y, subtype in world.entities.values()}
+
+
+def test_deltas_rebuild_the_game() -> None:
+    encoder = DeltaEncoder()
+    world = WorldState()
+    snapshots = [
+        [(10, EntityKind.ALIEN, 100.0, 400.0, 2), (11, EntityKind.PLAYER_BULLET, 50.0, 60.0, 0)],
+        [(10, EntityKind.ALIEN, 101.25, 400.0, 2), (11, EntityKind.PLAYER_BULLET, 50.0, 70.0, 0)],
+        [(10, EntityKind.ALIEN, 102.5, 400.0, 2), (12, EntityKind.EXPLOSION, 50.0, 80.0, 1)],
+    ]
+    for score, entities in enumerate(snapshots):
+        assert decode(world, encoder.encode(make_snapshot(entities, score))) is MessageType.DELTA
+        assert positions(world) == {(kind, x, y, sub) for _, kind, x, y, sub in entities}
+        assert world.score == score
+
+    # A keyframe alone gives a new viewer the same world
+    fresh = WorldState()
+    assert decode(fresh, encoder.keyframe()) is MessageType.KEYFRAME
+    assert fresh.entities == world.entities
+
+
+def test_unchanged_entities_are_not_resent() -> None:
+    encoder = DeltaEncoder()
+    entities: list[Entity] = [(1, EntityKind.ALIEN, 10.0, 20.0, 0)]
+    first = encoder.encode(make_snapshot(entities))
+    second = encoder.encode(make_snapshot(entities))
+    assert len(second) < len(first)
+    world = WorldState()
+    decode(world, first)
+    decode(world, second)
+    assert len(world.entities) == 1
+
+
+def test_new_entity_replaces_old_one_instead_of_moving_it() -> None:
+    encoder = DeltaEncoder()
+    world = WorldState()
+    decode(world, encoder.encode(make_snapshot([(1, EntityKind.ALIEN, 10.0, 20.0, 0)])))
+    (old_id,) = world.entities
+    decode(world, encoder.encode(make_snapshot([(2, EntityKind.ALIEN, 30.0, 20.0, 0)])))
+    (new_id,) = world.entities
+    assert new_id != old_id
+
+
+def test_viewer_on_localhost_follows_the_game() -> None:
+    server = SpectatorServer("127.0.0.1", 0, queue_size=64)
+    server.start()
+    try:
+        world = asyncio.run(watch_game(server, steps=30))
+    finally:
+        server.stop()
+
+    assert world.tick == 30
+    assert world.score == 29
+    assert positions(world) == {
+        (EntityKind.PLAYER, 400.0, 50.0, 0),
+        (EntityKind.ALIEN, 129.0, 300.0, 1),
+    }
+
+
+async def watch_game(server: SpectatorServer, steps: int) -> WorldState:
+    """Connect a viewer, publish some steps and read until the last one arrives."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    try:
+        while not server.has_clients:
+            await asyncio.sleep(0.01)
+        for step in range(steps):
+            entities: list[Entity] = [
+                (0, EntityKind.PLAYER, 400.0, 50.0, 0),
+                (7, EntityKind.ALIEN, 100.0 + step, 300.0, 1),
+            ]
+            server.publish(make_snapshot(entities, score=step))
+
+        world = WorldState()
+        while world.tick < steps:
+            world.apply(await asyncio.wait_for(read_message(reader), timeout=5))
+        return world
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def test_viewer_joining_a_still_game_gets_the_current_state() -> None:
+    server = SpectatorServer("127.0.0.1", 0, queue_size=64)
+    server.start()
+    try:
+        world = asyncio.run(join_still_game(server))
+    finally:
+        server.stop()
+
+    assert not server.needs_snapshot
+    assert world.score == 120
+    assert positions(world) == {(EntityKind.ALIEN, 50.0, 200.0, 0)}
+
+
+async def join_still_game(server: SpectatorServer) -> WorldState:
+    """Connect to a server nothing was published to, then answer its request for a snapshot."""
+    assert not server.needs_snapshot
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    try:
+        world = WorldState()
+        # The keyframe sent on connecting has nothing in it yet
+        assert world.apply(await asyncio.wait_for(read_message(reader), timeout=5)) is (
+            MessageType.KEYFRAME
+        )
+        assert not world.entities
+        assert server.needs_snapshot
+
+        # What the game does on its next update, stepping or not
+        server.publish(make_snapshot([(3, EntityKind.ALIEN, 50.0, 200.0, 0)], score=120))
+        world.apply(await asyncio.wait_for(read_message(reader), timeout=5))
+        return world
+    finally:
+        writer.close()
+        await writer.wait_closed()
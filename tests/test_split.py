@@ -0,0 +1,134 @@
+"""Tests for the renderer side of split mode."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from invaders.explosion import load_explosion_textures
+from invaders.shared_state import EntityKind, SharedState
+from invaders.simulation import Effect
+from invaders.split import RemoteSimulation
+
+
+@pytest.fixture
+def remote() -> Iterator[RemoteSimulation]:
+    remote = RemoteSimulation(load_explosion_textures())
+    yield remote
+    remote.close()
+
+
+def publish_alien(remote: RemoteSimulation, x: float) -> None:
+    with remote.state.frame() as frame:
+        frame.score = 10
+        frame.add((1, EntityKind.ALIEN, x, 300.0, 0))
+
+
+def test_shows_consistent_frames(remote: RemoteSimulation) -> None:
+    publish_alien(remote, 100.0)
+    remote.update(1 / 60)
+    assert remote.score == 10
+    assert [alien.position for alien in remote.aliens] == [(100.0, 300.0)]
+
+
+def test_torn_frame_never_reaches_the_sprites(
+    remote: RemoteSimulation, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    publish_alien(remote, 100.0)
+    remote.update(1 / 60)
+
+    publish_alien(remote, 200.0)
+    with monkeypatch.context() as patch:
+        patch.setattr(SharedState, "is_consistent", staticmethod(lambda frame: False))
+        remote.update(1 / 60)
+    assert [alien.position for alien in remote.aliens] == [(100.0, 300.0)]
+
+    # The same frame read cleanly on the next step is shown
+    remote.update(1 / 60)
+    assert [alien.position for alien in remote.aliens] == [(200.0, 300.0)]
+
+
+def test_debris_only_comes_from_consistent_frames(
+    remote: RemoteSimulation, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with remote.state.frame() as frame:
+        frame.add((5, EntityKind.EXPLOSION, 150.0, 250.0, 0))
+    with monkeypatch.context() as patch:
+        patch.setattr(SharedState, "is_consistent", staticmethod(lambda frame: False))
+        remote.update(1 / 60)
+    assert remote.effects == []
+
+    remote.update(1 / 60)
+    assert remote.effects == [(Effect.DEBRIS, 150.0, 250.0)]
+
+    # The same explosion in later frames is not a new one
+    remote.effects.clear()
+    with remote.state.frame() as frame:
+        frame.add((5, EntityKind.EXPLOSION, 150.0, 250.0, 1))
+    remote.update(1 / 60)
+    assert remote.effects == []
+
+
+STEP = 1 / 60
+
+
+def answer(remote: RemoteSimulation, fires: int, fired: int, inputs: int | None = None) -> None:
+    """Publish a frame as the process would after handling the controls sent so far."""
+    with remote.state.frame() as frame:
+        frame.inputs = remote.inputs.read().sequence if inputs is None else inputs
+        frame.fires = fires
+        frame.fired = fired
+
+
+def test_press_is_kept_until_the_process_fires(remote: RemoteSimulation) -> None:
+    assert not remote.fire()
+    assert remote.inputs.read().fires == 1
+    remote.update(STEP)
+
+    # Unanswered: the request is not sent twice
+    assert not remote.fire()
+    assert remote.inputs.read().fires == 1
+    answer(remote, fires=1, fired=0)  # Refused, too many bullets in flight
+    remote.update(STEP)
+
+    assert not remote.fire()
+    assert remote.inputs.read().fires == 2
+    answer(remote, fires=2, fired=2)
+    remote.update(STEP)
+
+    assert remote.fire()
+    remote.update(STEP)
+    assert remote.inputs.read().fires == 2
+
+
+def test_shot_for_an_abandoned_press_is_not_credited_to_the_next(
+    remote: RemoteSimulation,
+) -> None:
+    assert not remote.fire()
+    remote.update(STEP)
+    answer(remote, fires=1, fired=1)
+    # The press expired before the answer was seen
+    remote.update(STEP)
+    remote.update(STEP)
+
+    assert not remote.fire()
+    assert remote.inputs.read().fires == 2
+
+
+def test_steps_are_pending_until_a_frame_applies_their_input(remote: RemoteSimulation) -> None:
+    assert remote.input_steps_pending == 0
+    remote.steer(1)
+    remote.update(STEP)
+    remote.update(STEP)
+    remote.steer(-1)
+    remote.update(STEP)
+    assert remote.input_steps_pending == 3
+
+    # A frame applying the first write shows the steps before the second
+    first = remote.inputs.read().sequence - 1
+    answer(remote, fires=0, fired=0, inputs=first)
+    remote.update(STEP)
+    assert remote.input_steps_pending == 2
+
+    answer(remote, fires=0, fired=0)
+    remote.update(STEP)
+    assert remote.input_steps_pending == 0
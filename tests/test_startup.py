@@ -0,0 +1,40 @@
+"""Tests for the import-time startup benchmark."""
+
+from pathlib import Path
+
+import pytest
+
+import invaders
+from invaders.startup import LIGHT_MODULES, parse_importtime, run_benchmark
+
+REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:        80 |        200 | encodings
+import time: cached    |     cached |   cached.module
+import time:        40 |         40 |     deep.leaf
+import time:        60 |        100 |   mid
+import time:        10 |        110 | top
+some other output
+"""
+
+
+def test_parse_importtime() -> None:
+    timings = parse_importtime(REPORT)
+    assert [(t.name, t.self_us, t.cumulative_us, t.depth) for t in timings] == [
+        ("_io", 120, 120, 1),
+        ("encodings", 80, 200, 0),
+        ("deep.leaf", 40, 40, 2),
+        ("mid", 60, 100, 1),
+        ("top", 10, 110, 0),
+    ]
+
+
+def test_light_modules_do_not_load_arcade(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Fresh interpreters find the package where this one did
+    monkeypatch.setenv("PYTHONPATH", str(Path(invaders.__file__).parents[1]))
+    results = run_benchmark(list(LIGHT_MODULES), repeat=1, top=3)
+    assert {result.module: result.heavy for result in results} == {
+        module: [] for module in LIGHT_MODULES
+    }
+    assert all(result.modules_loaded > 0 for result in results)
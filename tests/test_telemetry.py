@@ -0,0 +1,83 @@
+"""Tests for the background telemetry event log."""
+
+import time
+from pathlib import Path
+
+from invaders.telemetry import FILE_SUFFIX, Event, EventLog, FrameStats, read_events
+
+
+def wait_written(log: EventLog, count: int) -> None:
+    deadline = time.monotonic() + 5
+    while log.written < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_events_round_trip(tmp_path: Path) -> None:
+    log = EventLog(tmp_path, flush_interval=60)
+    log.emit(Event.KILL, 3, 412.0, 388.456, 2)
+    log.emit(Event.DEATH, "aliens", 120, 2)
+    log.close()
+
+    (path,) = tmp_path.glob(f"*{FILE_SUFFIX}")
+    events = read_events(path)
+    assert [event["event"] for event in events] == ["kill", "death"]
+    assert events[0] | {"t": 0} == {
+        "t": 0,
+        "event": "kill",
+        "alien": 3,
+        "x": 412.0,
+        "y": 388.46,
+        "wave": 2,
+    }
+    assert events[1]["cause"] == "aliens"
+
+
+def test_flushed_batches_are_readable_while_writing(tmp_path: Path) -> None:
+    log = EventLog(tmp_path, flush_interval=0.01)
+    try:
+        for x in range(10):
+            log.emit(Event.SHOT, float(x))
+        wait_written(log, 10)
+        (path,) = tmp_path.glob(f"*{FILE_SUFFIX}")
+        assert [event["x"] for event in read_events(path)] == [float(x) for x in range(10)]
+    finally:
+        log.close()
+
+
+def test_files_rotate_and_oldest_are_pruned(tmp_path: Path) -> None:
+    log = EventLog(tmp_path, flush_interval=0.01, file_bytes=1, max_files=3)
+    try:
+        for x in range(6):
+            log.emit(Event.SHOT, float(x))
+            wait_written(log, x + 1)
+    finally:
+        log.close()
+
+    files = sorted(tmp_path.glob(f"*{FILE_SUFFIX}"))
+    assert len(files) == 3
+    assert [read_events(path)[0]["x"] for path in files] == [3.0, 4.0, 5.0]
+
+
+def test_buffer_drops_oldest_events_when_full(tmp_path: Path) -> None:
+    log = EventLog(tmp_path, flush_interval=60, capacity=5)
+    for x in range(8):
+        log.emit(Event.SHOT, float(x))
+    log.close()
+    (path,) = tmp_path.glob(f"*{FILE_SUFFIX}")
+    assert [event["x"] for event in read_events(path)] == [3.0, 4.0, 5.0, 6.0, 7.0]
+
+
+def test_frame_stats_emit_once_per_interval(tmp_path: Path) -> None:
+    log = EventLog(tmp_path, flush_interval=60)
+    stats = FrameStats(log, interval=0.05)
+    for _ in range(3):
+        stats.record(0.010, quality=1)
+    time.sleep(0.06)
+    stats.record(0.020, quality=1)
+    log.close()
+
+    (path,) = tmp_path.glob(f"*{FILE_SUFFIX}")
+    (event,) = read_events(path)
+    assert event["event"] == "frames"
+    assert event["max_ms"] == 20.0
+    assert event["quality"] == 1
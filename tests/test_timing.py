@@ -0,0 +1,39 @@
+"""Tests for the fixed-rate logic clock."""
+
+import pytest
+
+from invaders.timing import UNCAPPED_INTERVAL, FixedStepClock, frame_interval
+
+
+def test_frame_interval() -> None:
+    assert frame_interval(60) == pytest.approx(1 / 60)
+    assert frame_interval(0) == UNCAPPED_INTERVAL
+    assert frame_interval(-1) == UNCAPPED_INTERVAL
+
+
+def test_rejects_non_positive_rate() -> None:
+    with pytest.raises(ValueError):
+        FixedStepClock(0)
+
+
+def test_carries_leftover_time() -> None:
+    clock = FixedStepClock(rate=10)
+    assert clock.advance(0.05) == 0
+    assert clock.alpha == pytest.approx(0.5)
+    assert clock.advance(0.17) == 2
+    assert clock.alpha == pytest.approx(0.2)
+
+
+def test_drops_backlog_beyond_max_steps() -> None:
+    clock = FixedStepClock(rate=10, max_steps=3)
+    assert clock.advance(5.0) == 3
+    assert clock.alpha == 0.0
+    assert clock.advance(0.1) == 1
+
+
+def test_reset_discards_accumulated_time() -> None:
+    clock = FixedStepClock(rate=10)
+    clock.advance(0.09)
+    clock.reset()
+    assert clock.alpha == 0.0
+    assert clock.advance(0.05) == 0
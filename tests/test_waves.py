@@ -0,0 +1,37 @@
+"""Tests for procedurally generated waves."""
+
+from itertools import islice
+
+from invaders.settings import SETTINGS
+from invaders.waves import PATTERNS, generate_waves, make_wave
+
+
+def test_first_wave_is_the_classic_formation() -> None:
+    wave = make_wave(1)
+    assert (wave.rows, wave.columns) == (SETTINGS.alien_rows, SETTINGS.alien_columns)
+    assert len(list(wave.positions())) == SETTINGS.alien_rows * SETTINGS.alien_columns
+
+
+def test_waves_grow_but_stay_on_screen() -> None:
+    for wave in islice(generate_waves(), 40):
+        assert wave.rows <= SETTINGS.max_alien_rows
+        assert wave.columns <= SETTINGS.max_alien_columns
+        for x, y, _ in wave.positions():
+            assert 0 < x < SETTINGS.screen_width
+            assert 0 < y < SETTINGS.screen_height
+
+
+def test_waves_cycle_patterns_and_speed_up() -> None:
+    waves = list(islice(generate_waves(), len(PATTERNS) + 1))
+    assert [wave.pattern for wave in waves[: len(PATTERNS)]] == list(PATTERNS)
+    assert waves[-1].pattern == waves[0].pattern
+    assert all(a.speed < b.speed for a, b in zip(waves, waves[1:], strict=False))
+
+
+def test_positions_are_unique_and_top_row_first() -> None:
+    for pattern in PATTERNS:
+        positions = list(make_wave(5, pattern).positions())
+        assert positions
+        assert len({(x, y) for x, y, _ in positions}) == len(positions)
+        ys = [y for _, y, _ in positions]
+        assert ys == sorted(ys, reverse=True)